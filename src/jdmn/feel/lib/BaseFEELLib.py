@@ -1047,6 +1047,13 @@ class BaseFEELLib(FEELLib):
     def ruleMatches(eventListener: EventListener, rule: Rule, *operands) -> bool:
         if (operands is None or len(operands) == 0):
             return False
+        elif eventListener.isNop():
+            for operand in operands:
+                if isinstance(operand, LazyEval):
+                    operand = operand.getOrCompute()
+                if operand is None or operand is False:
+                    return False
+            return True
         else:
             for i, operand in enumerate(operands):
                 if isinstance(operand, LazyEval):
@@ -10,19 +10,27 @@
 # "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.  See the License for the
 # specific language governing permissions and limitations under the License.
 #
-from typing import Any, Optional
+from datetime import date, datetime, time, timedelta
+from decimal import Decimal
+from typing import Any, Callable, Dict, Optional
+
+from isodate import Duration
 
 from jdmn.feel.lib.BaseFEELLib import BaseFEELLib
-from jdmn.feel.lib.Types import DECIMAL, STRING, BOOLEAN, DATE, TIME, DATE_TIME, DURATION, LIST, DATE_OR_DATE_TIME, TIME_OR_DATE_TIME
+from jdmn.feel.lib.Types import DECIMAL, STRING, BOOLEAN, DATE, TIME, DATE_TIME, DURATION, LIST, DATE_OR_DATE_TIME, TIME_OR_DATE_TIME, CONTEXT
 from jdmn.feel.lib.type.ComparableComparator import comparable
+from jdmn.feel.lib.type.TypeDispatcher import TypeDispatcher
+from jdmn.feel.lib.type.TypeOperations import TypeOperations
 from jdmn.feel.lib.type.bool.DefaultBooleanLib import DefaultBooleanLib
 from jdmn.feel.lib.type.list.DefaultListLib import DefaultListLib
 from jdmn.feel.lib.type.numeric.DefaultNumericLib import DefaultNumericLib
-from jdmn.feel.lib.type.range.DefaultRangeLib import DefaultRangeLib
+from jdmn.feel.lib.type.range.DefaultRangeLib import DefaultRangeLib, COMPARATOR_MAP
+from jdmn.feel.lib.type.range.RangeIndex import RangeIndex
 from jdmn.feel.lib.type.string.DefaultStringLib import DefaultStringLib
 from jdmn.feel.lib.type.time.DefaultDateTimeLib import DefaultDateTimeLib
 from jdmn.feel.lib.type.time.DefaultDurationLib import DefaultDurationLib
 from jdmn.runtime.DMNRuntimeException import DMNRuntimeException
+from jdmn.runtime.Context import Context
 from jdmn.runtime.LambdaExpression import LambdaExpression
 from jdmn.runtime.NumericRoundingMode import NumericRoundingMode
 from jdmn.runtime.Range import Range
@@ -40,6 +48,23 @@ class BaseStandardFEELLib(BaseFEELLib):
 
     def __init__(self):
         BaseFEELLib.__init__(self)
+        self.typeDispatcher = self.makeTypeDispatcher()
+
+    def makeTypeDispatcher(self) -> TypeDispatcher:
+        # Bound to the type instances of this lib, so subclasses can replace them
+        return TypeDispatcher({
+            Decimal: TypeOperations("number", self.numericType.numericIs, self.numericType.numericEqual, COMPARATOR_MAP[Decimal]),
+            bool: TypeOperations("boolean", self.booleanType.booleanIs, self.booleanType.booleanEqual),
+            str: TypeOperations("string", self.stringType.stringIs, self.stringType.stringEqual, COMPARATOR_MAP[str]),
+            date: TypeOperations("date", self.dateType.dateIs, self.dateType.dateEqual, COMPARATOR_MAP[date]),
+            time: TypeOperations("time", self.timeType.timeIs, self.timeType.timeEqual, COMPARATOR_MAP[time]),
+            datetime: TypeOperations("date and time", self.dateTimeType.dateTimeIs, self.dateTimeType.dateTimeEqual, COMPARATOR_MAP[datetime]),
+            Duration: TypeOperations("duration", self.durationType.durationIs, self.durationType.durationEqual, COMPARATOR_MAP[Duration]),
+            timedelta: TypeOperations("duration", self.durationType.durationIs, self.durationType.durationEqual, COMPARATOR_MAP[timedelta]),
+            list: TypeOperations("list", self.listType.listIs, self.listType.listEqual),
+            Range: TypeOperations("range", self.rangeType.rangeIs, self.rangeType.rangeEqual),
+            Context: TypeOperations("context", self.contextType.contextIs, self.contextType.contextEqual),
+        })
 
     #
     # Conversion functions
@@ -84,6 +109,15 @@ class BaseStandardFEELLib(BaseFEELLib):
             self.logError(message, e)
             return None
 
+    def preParseLiterals(self, function: str, *literals: str) -> Dict[str, Any]:
+        # Hoist the date, time and dateAndTime literal constants of a decision, e.g. preParseLiterals("date", "2020-01-01")
+        try:
+            return self.dateTimeLib.preParse(function, literals)
+        except Exception as e:
+            message: STRING = f"preParseLiterals({function}, {literals})"
+            self.logError(message, e)
+            return None
+
     def duration(self, from_: STRING) -> DURATION:
         try:
             return self.durationLib.duration(from_)
@@ -557,35 +591,35 @@ class BaseStandardFEELLib(BaseFEELLib):
             elif type(value1) is not type(value2):
                 # Different kind
                 return False
-            elif self.isNumber(value1):
-                return self.numericType.numericIs(value1, value2)
-            elif self.isBoolean(value1):
-                return self.booleanType.booleanIs(value1, value2)
-            elif self.isString(value1):
-                return self.stringType.stringIs(value1, value2)
-            elif self.isDate(value1):
-                return self.dateType.dateIs(value1, value2)
-            elif self.isTime(value1):
-                return self.timeType.timeIs(value1, value2)
-            elif self.isDateTime(value1):
-                return self.dateTimeType.dateTimeIs(value1, value2)
-            elif self.isDuration(value1):
-                return self.durationType.durationIs(value1, value2)
-            elif self.isList(value1):
-                return self.listType.listIs(value1, value2)
-            elif self.isRange(value1):
-                return self.rangeType.rangeIs(value1, value2)
-            elif self.isContext(value1):
-                return self.contextType.contextIs(value1, value2)
-            else:
-                self.logError(f"'{value1.getClass().getSimpleName()}' is not supported yet")
-                return False
 
+            operations = self.typeDispatcher.resolve(value1)
+            if operations is None:
+                self.logError(f"'{type(value1).__name__}' is not supported yet")
+                return False
+            return operations.is_(value1, value2)
         except Exception as e:
             message: STRING = f"is({value1}, {value2})"
             self.logError(message, e)
             return False
 
+    def equal(self, value1: Any, value2: Any) -> BOOLEAN:
+        # Generic =, dispatched on the type of the operands
+        try:
+            if value1 is None or value2 is None:
+                return value1 is value2
+            elif type(value1) is not type(value2):
+                return False
+
+            operations = self.typeDispatcher.resolve(value1)
+            if operations is None:
+                self.logError(f"'{type(value1).__name__}' is not supported yet")
+                return None
+            return operations.equal(value1, value2)
+        except Exception as e:
+            message: STRING = f"equal({value1}, {value2})"
+            self.logError(message, e)
+            return None
+
     #
     # Temporal functions
     #
@@ -738,9 +772,9 @@ class BaseStandardFEELLib(BaseFEELLib):
             self.logError(message, e)
             return None
 
-    def flatten(self, list_: LIST) -> LIST:
+    def flatten(self, list_: LIST, lazy: bool = False) -> LIST:
         try:
-            return self.listLib.flatten(list_)
+            return self.listLib.flatten(list_, lazy)
         except Exception as e:
             message: STRING = f"flatten({list_})"
             self.logError(message, e)
@@ -778,6 +812,14 @@ class BaseStandardFEELLib(BaseFEELLib):
             self.logError(message, e)
             return None
 
+    def describe(self, *args) -> CONTEXT:
+        try:
+            return self.numberLib.describe(*args)
+        except Exception as e:
+            message: STRING = f"describe{args}"
+            self.logError(message, e)
+            return None
+
     def collect(self, result: LIST, list_: LIST) -> None:
         try:
             self.listLib.collect(result, list_)
@@ -793,6 +835,14 @@ class BaseStandardFEELLib(BaseFEELLib):
             self.logError(message, e)
             return None
 
+    def sortBy(self, list_: LIST, key: Callable[[Any], Any], descending: BOOLEAN = False) -> LIST:
+        try:
+            return self.listLib.sortBy(list_, key, bool(descending))
+        except Exception as e:
+            message: STRING = f"sortBy({list_})"
+            self.logError(message, e)
+            return None
+
     #
     # Range functions
     #
@@ -908,3 +958,43 @@ class BaseStandardFEELLib(BaseFEELLib):
             message: STRING = f"coincides({arg1}, {arg2})"
             self.logError(message, e)
             return None
+
+    def rangeIndex(self, ranges: LIST) -> Optional[RangeIndex]:
+        try:
+            return self.rangeLib.rangeIndex(ranges)
+        except Exception as e:
+            message: STRING = f"rangeIndex({ranges})"
+            self.logError(message, e)
+            return None
+
+    def rangesContaining(self, index: RangeIndex, point: Any) -> LIST:
+        try:
+            return self.rangeLib.rangesContaining(index, point)
+        except Exception as e:
+            message: STRING = f"rangesContaining({index}, {point})"
+            self.logError(message, e)
+            return None
+
+    def rangesOverlapping(self, index: RangeIndex, range_: Range) -> LIST:
+        try:
+            return self.rangeLib.rangesOverlapping(index, range_)
+        except Exception as e:
+            message: STRING = f"rangesOverlapping({index}, {range_})"
+            self.logError(message, e)
+            return None
+
+    def rangesIncluding(self, index: RangeIndex, range_: Range) -> LIST:
+        try:
+            return self.rangeLib.rangesIncluding(index, range_)
+        except Exception as e:
+            message: STRING = f"rangesIncluding({index}, {range_})"
+            self.logError(message, e)
+            return None
+
+    def rangesDuring(self, index: RangeIndex, range_: Range) -> LIST:
+        try:
+            return self.rangeLib.rangesDuring(index, range_)
+        except Exception as e:
+            message: STRING = f"rangesDuring({index}, {range_})"
+            self.logError(message, e)
+            return None
@@ -0,0 +1,83 @@
+#
+# Copyright 2016 Goldman Sachs.
+#
+# Licensed under the Apache License, Version 2.0 (the "License") you may not use self file except in compliance with the License.
+#
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations under the License.
+#
+import copy
+
+from jdmn.feel.lib.DefaultStandardFEELLib import DefaultStandardFEELLib
+
+
+class FastStandardFEELLib(DefaultStandardFEELLib):
+    """
+    DefaultStandardFEELLib where the hot operators are bound directly to the type implementations.
+
+    The operators skip the wrappers of BaseFEELLib and call the type implementations directly, so a failing operator
+    raises instead of logging the error and returning null. Errors are handled once per request by the caller, e.g.
+    FastDMNBaseDecision.evaluateRequest(), which evaluates the request again with safeCopy().
+    """
+
+    # Operators bound to the type instance with the same name
+    FAST_OPERATORS = {
+        "numericType": (
+            "numericIs", "numericEqual", "numericNotEqual",
+            "numericLessThan", "numericGreaterThan", "numericLessEqualThan", "numericGreaterEqualThan",
+            "numericAdd", "numericSubtract", "numericMultiply", "numericDivide", "numericUnaryMinus", "numericExponentiation"
+        ),
+        "booleanType": (
+            "booleanIs", "booleanEqual", "booleanNotEqual",
+            "booleanNot", "booleanOr", "binaryBooleanOr", "booleanAnd", "binaryBooleanAnd"
+        ),
+        "stringType": (
+            "stringIs", "stringEqual", "stringNotEqual",
+            "stringLessThan", "stringGreaterThan", "stringLessEqualThan", "stringGreaterEqualThan",
+            "stringAdd"
+        ),
+        "dateType": (
+            "dateIs", "dateEqual", "dateNotEqual",
+            "dateLessThan", "dateGreaterThan", "dateLessEqualThan", "dateGreaterEqualThan",
+            "dateAddDuration", "dateSubtractDuration"
+        ),
+        "timeType": (
+            "timeIs", "timeEqual", "timeNotEqual",
+            "timeLessThan", "timeGreaterThan", "timeLessEqualThan", "timeGreaterEqualThan",
+            "timeSubtract", "timeAddDuration", "timeSubtractDuration"
+        ),
+        "dateTimeType": (
+            "dateTimeIs", "dateTimeEqual", "dateTimeNotEqual",
+            "dateTimeLessThan", "dateTimeGreaterThan", "dateTimeLessEqualThan", "dateTimeGreaterEqualThan",
+            "dateTimeAddDuration", "dateTimeSubtractDuration"
+        ),
+        "durationType": (
+            "durationIs", "durationEqual", "durationNotEqual",
+            "durationLessThan", "durationGreaterThan", "durationLessEqualThan", "durationGreaterEqualThan",
+            "durationAdd", "durationSubtract", "durationDivide", "durationMultiplyNumber", "durationDivideNumber"
+        ),
+        "listType": ("listIs", "listEqual", "listNotEqual"),
+        "contextType": ("contextIs", "contextEqual", "contextNotEqual"),
+        "rangeType": ("rangeIs", "rangeEqual", "rangeNotEqual"),
+    }
+
+    def __init__(self):
+        DefaultStandardFEELLib.__init__(self)
+
+        # Instance attributes shadow the wrappers inherited from BaseFEELLib
+        for typeName, operators in self.FAST_OPERATORS.items():
+            type_ = getattr(self, typeName)
+            for operator in operators:
+                setattr(self, operator, getattr(type_, operator))
+
+    def safeCopy(self) -> 'FastStandardFEELLib':
+        # Shallow copy that uses the BaseFEELLib wrappers, which log errors and return null as in DefaultStandardFEELLib
+        lib = copy.copy(self)
+        for operators in self.FAST_OPERATORS.values():
+            for operator in operators:
+                lib.__dict__.pop(operator, None)
+        return lib
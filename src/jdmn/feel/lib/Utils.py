@@ -10,7 +10,8 @@
 # "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.  See the License for the
 # specific language governing permissions and limitations under the License.
 #
-from typing import List, Any
+from collections.abc import Iterator
+from typing import Iterable, List, Any
 
 
 def varArgToList(*operands) -> List[Any]:
@@ -22,3 +23,13 @@ def varArgToList(*operands) -> List[Any]:
         else:
             operands = [operands[0]]
     return list(operands)
+
+
+def varArgToIterable(*operands) -> Iterable[Any]:
+    # Same as varArgToList, but a single list or iterator argument is returned without copying
+    if len(operands) == 1:
+        if isinstance(operands[0], (list, Iterator)):
+            return operands[0]
+        else:
+            return [operands[0]]
+    return operands
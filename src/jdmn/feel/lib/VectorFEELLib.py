@@ -0,0 +1,173 @@
+#
+# Copyright 2016 Goldman Sachs.
+#
+# Licensed under the Apache License, Version 2.0 (the "License") you may not use self file except in compliance with the License.
+#
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations under the License.
+#
+from decimal import Decimal
+from typing import Any, Callable
+
+from jdmn.feel.lib.FEELLib import FEELLib
+from jdmn.feel.lib.Types import DECIMAL
+from jdmn.feel.lib.type.numeric.DefaultNumericType import DefaultNumericType
+from jdmn.feel.lib.type.numeric.VectorNumericType import COLUMN, OPERAND, VectorNumericType
+
+
+class VectorFEELLib(FEELLib):
+    """
+    Columnar FEEL numeric operators and aggregation functions, see VectorNumericType.
+
+    Errors are logged and mapped to null for the elements that fail, as with the scalar operators. When a column
+    operator fails, it is applied again element by element; columns with different lengths give null.
+    """
+
+    vectorNumericType = VectorNumericType()
+
+    def __init__(self):
+        FEELLib.__init__(self)
+
+    #
+    # Numeric operators
+    #
+    def numericAdd(self, first: OPERAND, second: OPERAND) -> COLUMN:
+        try:
+            return self.vectorNumericType.numericAdd(first, second)
+        except Exception:
+            return self.elementWise("numericAdd", self.vectorNumericType.numericType.numericAdd, first, second)
+
+    def numericSubtract(self, first: OPERAND, second: OPERAND) -> COLUMN:
+        try:
+            return self.vectorNumericType.numericSubtract(first, second)
+        except Exception:
+            return self.elementWise("numericSubtract", self.vectorNumericType.numericType.numericSubtract, first, second)
+
+    def numericMultiply(self, first: OPERAND, second: OPERAND) -> COLUMN:
+        try:
+            return self.vectorNumericType.numericMultiply(first, second)
+        except Exception:
+            return self.elementWise("numericMultiply", self.vectorNumericType.numericType.numericMultiply, first, second)
+
+    def numericDivide(self, first: OPERAND, second: OPERAND) -> COLUMN:
+        try:
+            return self.vectorNumericType.numericDivide(first, second)
+        except Exception:
+            return self.elementWise("numericDivide", self.vectorNumericType.numericType.numericDivide, first, second)
+
+    def numericExponentiation(self, first: OPERAND, second: OPERAND) -> COLUMN:
+        try:
+            return self.vectorNumericType.numericExponentiation(first, second)
+        except Exception:
+            return self.elementWise("numericExponentiation", self.vectorNumericType.numericType.numericExponentiation, first, second)
+
+    def numericUnaryMinus(self, first: OPERAND) -> COLUMN:
+        try:
+            return self.vectorNumericType.numericUnaryMinus(first)
+        except Exception:
+            return self.elementWise("numericUnaryMinus", self.vectorNumericType.numericType.numericUnaryMinus, first)
+
+    def numericEqual(self, first: OPERAND, second: OPERAND) -> COLUMN:
+        try:
+            return self.vectorNumericType.numericEqual(first, second)
+        except Exception:
+            return self.elementWise("numericEqual", self.vectorNumericType.numericType.numericEqual, first, second)
+
+    def numericNotEqual(self, first: OPERAND, second: OPERAND) -> COLUMN:
+        try:
+            return self.vectorNumericType.numericNotEqual(first, second)
+        except Exception:
+            return self.elementWise("numericNotEqual", self.vectorNumericType.numericType.numericNotEqual, first, second)
+
+    def numericLessThan(self, first: OPERAND, second: OPERAND) -> COLUMN:
+        try:
+            return self.vectorNumericType.numericLessThan(first, second)
+        except Exception:
+            return self.elementWise("numericLessThan", self.vectorNumericType.numericType.numericLessThan, first, second)
+
+    def numericGreaterThan(self, first: OPERAND, second: OPERAND) -> COLUMN:
+        try:
+            return self.vectorNumericType.numericGreaterThan(first, second)
+        except Exception:
+            return self.elementWise("numericGreaterThan", self.vectorNumericType.numericType.numericGreaterThan, first, second)
+
+    def numericLessEqualThan(self, first: OPERAND, second: OPERAND) -> COLUMN:
+        try:
+            return self.vectorNumericType.numericLessEqualThan(first, second)
+        except Exception:
+            return self.elementWise("numericLessEqualThan", self.vectorNumericType.numericType.numericLessEqualThan, first, second)
+
+    def numericGreaterEqualThan(self, first: OPERAND, second: OPERAND) -> COLUMN:
+        try:
+            return self.vectorNumericType.numericGreaterEqualThan(first, second)
+        except Exception:
+            return self.elementWise("numericGreaterEqualThan", self.vectorNumericType.numericType.numericGreaterEqualThan, first, second)
+
+    def elementWise(self, name: str, scalarOperator: Callable[..., Any], *operands) -> COLUMN:
+        try:
+            if len(operands) == 2:
+                columns = self.vectorNumericType.broadcast(*operands)
+            else:
+                # Scalars are columns of one element, as in broadcast()
+                columns = [operand if self.vectorNumericType.isColumn(operand) else [operand] for operand in operands]
+            result = []
+            for elements in zip(*columns):
+                try:
+                    result.append(scalarOperator(*elements))
+                except Exception as e:
+                    message = "{}({})".format(name, ", ".join(str(element) for element in elements))
+                    self.logError(message, e)
+                    result.append(None)
+            return self.vectorNumericType.makeColumn(result, *operands)
+        except Exception as e:
+            message = "{}({})".format(name, ", ".join("column" for _ in operands))
+            self.logError(message, e)
+            return None
+
+    #
+    # Aggregation functions over one column, same results as the list functions of DefaultNumericLib
+    #
+    def sum(self, column: COLUMN) -> DECIMAL:
+        try:
+            if len(column) == 0 or any(x is None for x in column):
+                return None
+            return sum(column, Decimal(0))
+        except Exception as e:
+            message = "sum(column)"
+            self.logError(message, e)
+            return None
+
+    def mean(self, column: COLUMN) -> DECIMAL:
+        try:
+            sum_ = self.sum(column)
+            if sum_ is None:
+                return None
+            return DefaultNumericType.decimalNumericDivide(sum_, Decimal(len(column)))
+        except Exception as e:
+            message = "mean(column)"
+            self.logError(message, e)
+            return None
+
+    def min(self, column: COLUMN) -> DECIMAL:
+        try:
+            if len(column) == 0 or any(x is None for x in column):
+                return None
+            return min(column)
+        except Exception as e:
+            message = "min(column)"
+            self.logError(message, e)
+            return None
+
+    def max(self, column: COLUMN) -> DECIMAL:
+        try:
+            if len(column) == 0 or any(x is None for x in column):
+                return None
+            return max(column)
+        except Exception as e:
+            message = "max(column)"
+            self.logError(message, e)
+            return None
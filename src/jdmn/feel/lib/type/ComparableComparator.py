@@ -24,21 +24,29 @@ class ComparableComparator(RelationalComparator):
     def compare(self, first: comparable, second: comparable) -> int:
         return self.compareTo(first, second)
 
+    # Null cases are branched on directly, this is on the hot path of every decision table
     def equalTo(self, first: comparable, second: comparable) -> BOOLEAN:
-        return self.applyOperator(first, second, [
-            lambda: True,
-            lambda: False,
-            lambda: False,
-            lambda: type(first) is type(second) and self.compareTo(first, second) == 0
-        ])
+        if first is None:
+            return second is None
+        elif second is None:
+            return False
+        else:
+            return type(first) is type(second) and self.compareTo(first, second) == 0
 
     def lessThan(self, first: comparable, second: comparable) -> BOOLEAN:
-        return self.applyOperator(first, second, [
-            lambda: None,
-            lambda: None,
-            lambda: None,
-            lambda: type(first) is type(second) and self.compareTo(first, second) < 0
-        ])
+        if first is None or second is None:
+            return None
+        else:
+            return type(first) is type(second) and self.compareTo(first, second) < 0
+
+    def lessEqualThan(self, first: comparable, second: comparable) -> BOOLEAN:
+        if first is None or second is None:
+            return True if first is None and second is None else None
+        else:
+            return type(first) is type(second) and self.compareTo(first, second) <= 0
+
+    def greaterEqualThan(self, first: comparable, second: comparable) -> BOOLEAN:
+        return self.lessEqualThan(second, first)
 
     def compareTo(self, first: comparable, second: comparable) -> int:
         raise NotImplementedError()
@@ -12,7 +12,7 @@
 #
 from typing import Any, Optional, List, Callable
 
-from jdmn.feel.lib.type.bool.TernaryBooleanLogicUtil import TernaryBooleanLogicUtil
+from jdmn.feel.lib.type.bool.TernaryBooleanLogicUtil import ternaryNot
 
 
 class EqualityComparator:
@@ -20,7 +20,7 @@ class EqualityComparator:
         raise NotImplementedError()
 
     def notEqualTo(self, first: Any, second: Any) -> Optional[bool]:
-        return TernaryBooleanLogicUtil().not_(self.equalTo(first, second))
+        return ternaryNot(self.equalTo(first, second))
 
     @staticmethod
     def applyOperator(first: Any, second: Any, result: List[Callable]) -> Optional[bool]:
@@ -13,7 +13,7 @@
 from typing import Any, Optional
 
 from jdmn.feel.lib.type.EqualityComparator import EqualityComparator
-from jdmn.feel.lib.type.bool.TernaryBooleanLogicUtil import TernaryBooleanLogicUtil
+from jdmn.feel.lib.type.bool.TernaryBooleanLogicUtil import ternaryOr
 
 
 class RelationalComparator(EqualityComparator):
@@ -27,7 +27,7 @@ class RelationalComparator(EqualityComparator):
         return self.lessThan(second, first)
 
     def lessEqualThan(self, first: Any, second: Any) -> Optional[bool]:
-        return TernaryBooleanLogicUtil().or_(self.lessThan(first, second), self.equalTo(first, second))
+        return ternaryOr(self.lessThan(first, second), self.equalTo(first, second))
 
     def greaterEqualThan(self, first: Any, second: Any) -> Optional[bool]:
-        return TernaryBooleanLogicUtil().or_(self.greaterThan(first, second), self.equalTo(first, second))
+        return ternaryOr(self.greaterThan(first, second), self.equalTo(first, second))
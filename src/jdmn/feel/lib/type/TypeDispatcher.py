@@ -0,0 +1,52 @@
+#
+# Copyright 2016 Goldman Sachs.
+#
+# Licensed under the Apache License, Version 2.0 (the "License") you may not use self file except in compliance with the License.
+#
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations under the License.
+#
+from typing import Any, Dict, Optional
+
+
+class TypeDispatcher:
+    """
+    Maps the type of a value to an entry in one dict lookup.
+    Subclasses of registered types are resolved through the MRO on the first miss and the result is cached,
+    including misses, so the walk is done once per type.
+    """
+
+    def __init__(self, entries: Dict[type, Any] = None):
+        self.registered: Dict[type, Any] = {}
+        self.cache: Dict[type, Any] = {}
+        if entries is not None:
+            for type_, entry in entries.items():
+                self.register(type_, entry)
+
+    def register(self, type_: type, entry: Any) -> None:
+        self.registered[type_] = entry
+        # Previously resolved subclasses might resolve differently now
+        self.cache = dict(self.registered)
+
+    def resolve(self, value: Any) -> Optional[Any]:
+        type_ = type(value)
+        try:
+            return self.cache[type_]
+        except KeyError:
+            return self.resolveType(type_)
+
+    def resolveType(self, type_: type) -> Optional[Any]:
+        entry = None
+        for base in type_.__mro__:
+            if base in self.registered:
+                entry = self.registered[base]
+                break
+        self.cache[type_] = entry
+        return entry
+
+    def types(self):
+        return self.registered.keys()
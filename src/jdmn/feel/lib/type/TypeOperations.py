@@ -0,0 +1,28 @@
+#
+# Copyright 2016 Goldman Sachs.
+#
+# Licensed under the Apache License, Version 2.0 (the "License") you may not use self file except in compliance with the License.
+#
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations under the License.
+#
+from typing import Any, Callable, Optional
+
+from jdmn.feel.lib.Types import BOOLEAN
+from jdmn.feel.lib.type.RelationalComparator import RelationalComparator
+
+
+class TypeOperations:
+    # Implementations of the type-specific operators of a FEEL type, see TypeDispatcher
+    def __init__(self, name: str, is_: Callable[[Any, Any], BOOLEAN], equal: Callable[[Any, Any], BOOLEAN], comparator: Optional[RelationalComparator] = None):
+        self.name = name
+        self.is_ = is_
+        self.equal = equal
+        self.comparator = comparator
+
+    def __repr__(self):
+        return f"TypeOperations({self.name})"
@@ -12,42 +12,15 @@
 #
 from typing import Optional
 
-from jdmn.feel.lib.Utils import varArgToList
+from jdmn.feel.lib.Utils import varArgToIterable
+from jdmn.feel.lib.type.bool.TernaryBooleanLogicUtil import ternaryAll, ternaryAny
 
 
 class DefaultBooleanLib:
     @staticmethod
     def all(*args) -> Optional[bool]:
-        operands = varArgToList(*args)
-
-        oneFalse = False
-        allTrue = True
-        for opd in operands:
-            if opd is False:
-                oneFalse = True
-            if opd is not True:
-                allTrue = False
-        if oneFalse:
-            return False
-        elif allTrue:
-            return True
-        else:
-            return None
+        return ternaryAll(varArgToIterable(*args))
 
     @staticmethod
     def any(*args) -> Optional[bool]:
-        operands = varArgToList(*args)
-
-        oneTrue = False
-        allFalse = True
-        for opd in operands:
-            if opd is True:
-                oneTrue = True
-            if opd is not False:
-                allFalse = False
-        if oneTrue:
-            return True
-        elif allFalse:
-            return False
-        else:
-            return None
+        return ternaryAny(varArgToIterable(*args))
@@ -14,7 +14,7 @@ from typing import Any, Optional
 
 from jdmn.feel.lib.Utils import varArgToList
 from jdmn.feel.lib.type.BaseType import BaseType
-from jdmn.feel.lib.type.bool.TernaryBooleanLogicUtil import TernaryBooleanLogicUtil
+from jdmn.feel.lib.type.bool.TernaryBooleanLogicUtil import ternaryNot, ternaryAnd, ternaryOr, ternaryAll, ternaryAny
 
 
 class DefaultBooleanType(BaseType):
@@ -31,35 +31,31 @@ class DefaultBooleanType(BaseType):
 
     @staticmethod
     def booleanNot(operand: Any) -> Optional[bool]:
-        return TernaryBooleanLogicUtil().not_(operand)
+        return ternaryNot(operand)
 
-    def booleanOr(self, *args) -> Optional[bool]:
+    @staticmethod
+    def booleanOr(*args) -> Optional[bool]:
         operands = varArgToList(*args)
 
         if len(operands) < 2:
             return None
-        result = operands[0]
-        for opd in operands[1:]:
-            result = self.binaryBooleanOr(result, opd)
-        return result
+        return ternaryAny(operands)
 
     @staticmethod
     def binaryBooleanOr(first: Any, second: Any) -> Optional[bool]:
-        return TernaryBooleanLogicUtil().or_(first, second)
+        return ternaryOr(first, second)
 
-    def booleanAnd(self, *args) -> Optional[bool]:
+    @staticmethod
+    def booleanAnd(*args) -> Optional[bool]:
         operands = varArgToList(*args)
 
         if len(operands) < 2:
             return None
-        result = operands[0]
-        for opd in operands[1:]:
-            result = self.binaryBooleanAnd(result, opd)
-        return result
+        return ternaryAll(operands)
 
     @staticmethod
     def binaryBooleanAnd(first: Any, second: Any) -> Optional[bool]:
-        return TernaryBooleanLogicUtil().and_(first, second)
+        return ternaryAnd(first, second)
 
     def booleanIs(self, first: Optional[bool], second: Optional[bool]) -> Optional[bool]:
         return self.booleanEqual(first, second)
@@ -10,37 +10,79 @@
 # "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.  See the License for the
 # specific language governing permissions and limitations under the License.
 #
-from typing import Any, Optional
+from typing import Any, Iterable, Optional
+
+
+#
+# Three-valued logic over {True, False, None}. Identity checks only: non-boolean operands behave like None
+# (a lookup table keyed by operands would not work, as True == 1 == Decimal(1)).
+#
+def ternaryNot(operand: Any) -> Optional[bool]:
+    if operand is True:
+        return False
+    elif operand is False:
+        return True
+    else:
+        return None
+
+
+def ternaryAnd(first: Any, second: Any) -> Optional[bool]:
+    if first is False or second is False:
+        return False
+    elif first is True and second is True:
+        return True
+    else:
+        return None
+
+
+def ternaryOr(first: Any, second: Any) -> Optional[bool]:
+    if first is True or second is True:
+        return True
+    elif first is False and second is False:
+        return False
+    else:
+        return None
+
+
+def ternaryAll(operands: Iterable[Any]) -> Optional[bool]:
+    # Stops at the first False
+    allTrue = True
+    for opd in operands:
+        if opd is False:
+            return False
+        elif opd is not True:
+            allTrue = False
+    return True if allTrue else None
+
+
+def ternaryAny(operands: Iterable[Any]) -> Optional[bool]:
+    # Stops at the first True
+    allFalse = True
+    for opd in operands:
+        if opd is True:
+            return True
+        elif opd is not False:
+            allFalse = False
+    return False if allFalse else None
 
 
 class TernaryBooleanLogicUtil:
     @staticmethod
     def not_(operand: Any) -> Optional[bool]:
-        if isinstance(operand, bool):
-            return not operand
-        else:
-            return None
+        return ternaryNot(operand)
 
-    def and_(self, first: Any, second: Any) -> Optional[bool]:
-        if self.isBooleanFalse(first) or self.isBooleanFalse(second):
-            return False
-        elif self.isBooleanTrue(first) and self.isBooleanTrue(second):
-            return True
-        else:
-            return None
+    @staticmethod
+    def and_(first: Any, second: Any) -> Optional[bool]:
+        return ternaryAnd(first, second)
 
-    def or_(self, first: Any, second: Any) -> Optional[bool]:
-        if self.isBooleanTrue(first) or self.isBooleanTrue(second):
-            return True
-        elif self.isBooleanFalse(first) and self.isBooleanFalse(second):
-            return False
-        else:
-            return None
+    @staticmethod
+    def or_(first: Any, second: Any) -> Optional[bool]:
+        return ternaryOr(first, second)
 
     @staticmethod
     def isBooleanTrue(obj: Any) -> bool:
-        return isinstance(obj, bool) and obj is True
+        return obj is True
 
     @staticmethod
     def isBooleanFalse(obj: Any) -> bool:
-        return isinstance(obj, bool) and obj is False
+        return obj is False
@@ -11,7 +11,10 @@
 # specific language governing permissions and limitations under the License.
 #
 from functools import cmp_to_key
-from typing import Any
+from operator import itemgetter
+from typing import Any, Callable, Iterator, Optional, Union
+
+from isodate import Duration
 
 from jdmn.feel.lib.Types import BOOLEAN, LIST, INTEGER
 from jdmn.runtime.LambdaExpression import LambdaExpression
@@ -97,35 +100,89 @@ class DefaultListLib:
 
     @staticmethod
     def distinctValues(list1: LIST) -> LIST:
+        # Same result as testing 'element not in result' for each element, in linear time for hashable elements
         result = []
         if list1 is not None:
+            seen = set()
+            unhashables = []
             for element in list1:
-                if element not in result:
+                try:
+                    key = DefaultListLib.hashKey(element)
+                    hash(key)
+                except TypeError:
+                    # e.g. lists and contexts, compared with all the previous elements
+                    if element not in result:
+                        result.append(element)
+                        unhashables.append(element)
+                    continue
+
+                if key not in seen and not (unhashables and element in unhashables):
+                    seen.add(key)
                     result.append(element)
         return result
 
-    def flatten(self, list1: LIST) -> LIST:
+    @staticmethod
+    def hashKey(element: Any) -> Any:
+        # Key with a hash consistent with ==, isodate.Duration equals timedelta and P1Y equals P12M but has a different hash
+        if isinstance(element, Duration):
+            if element.years == 0 and element.months == 0:
+                return element.tdelta
+            return Duration, element.years * 12 + element.months, element.tdelta
+        return element
+
+    def flatten(self, list1: LIST, lazy: bool = False) -> Optional[Union[LIST, Iterator[Any]]]:
+        # lazy returns an iterator, e.g. for sum(), count() or listContains()
         if list1 is None:
             return None
-        result = []
-        self.collect(result, list1)
-        return result
+        if lazy:
+            return self.iterFlatten(list1)
+        return list(self.iterFlatten(list1))
 
     def collect(self, result: LIST, list1: LIST) -> None:
         if list1 is not None:
-            for obj in list1:
+            result.extend(self.iterFlatten(list1))
+
+    @staticmethod
+    def iterFlatten(list1: LIST) -> Iterator[Any]:
+        # Depth first, without recursion
+        stack = [iter(list1)]
+        while stack:
+            for obj in stack[-1]:
                 if isinstance(obj, list):
-                    self.collect(result, obj)
-                else:
-                    result.append(obj)
+                    stack.append(iter(obj))
+                    break
+                yield obj
+            else:
+                stack.pop()
 
     @staticmethod
     def sort(list_: LIST, precedes: LambdaExpression) -> LIST:
+        if precedes is not None and precedes.key is not None:
+            return DefaultListLib.sortBy(list_, precedes.key, precedes.descending)
+
         clone = []
         clone.extend(list_)
         clone.sort(key=cmp_to_key(lambda o1, o2: -1 if precedes.apply(o1, o2) else (0 if o1 == o2 else 1)))
         return clone
 
+    @staticmethod
+    def sortBy(list_: LIST, key: Callable[[Any], Any], descending: bool = False) -> LIST:
+        # Native key sort, stable, elements with null keys are last in their original order
+        if isinstance(key, LambdaExpression):
+            key = key.apply
+        keyed = []
+        nulls = []
+        for element in list_:
+            value = key(element)
+            if value is None:
+                nulls.append(element)
+            else:
+                keyed.append((value, element))
+        keyed.sort(key=itemgetter(0), reverse=descending)
+        result = [element for _, element in keyed]
+        result.extend(nulls)
+        return result
+
     @staticmethod
     def isOutOfBounds(list_: LIST, position: INTEGER) -> bool:
         if position is None:
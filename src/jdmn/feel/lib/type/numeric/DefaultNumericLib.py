@@ -10,13 +10,15 @@
 # "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.  See the License for the
 # specific language governing permissions and limitations under the License.
 #
-from collections import defaultdict
+from collections.abc import Iterator
 from decimal import Decimal
 from typing import List, Any, Optional
 
 from jdmn.feel.lib.Types import STRING, DECIMAL, BOOLEAN
-from jdmn.feel.lib.Utils import varArgToList
+from jdmn.feel.lib.Utils import varArgToIterable, varArgToList
 from jdmn.feel.lib.type.numeric.DefaultNumericType import DefaultNumericType
+from jdmn.feel.lib.type.numeric.NumericAggregates import NumericAggregates
+from jdmn.runtime.Context import Context
 from jdmn.runtime.NumericRoundingMode import NumericRoundingMode
 
 
@@ -154,6 +156,8 @@ class DefaultNumericLib:
     def count(list_: List[Any]) -> DECIMAL:
         if list_ is None:
             return Decimal(0)
+        elif isinstance(list_, Iterator):
+            return Decimal(sum(1 for _ in list_))
         else:
             return Decimal(len(list_))
 
@@ -191,14 +195,14 @@ class DefaultNumericLib:
 
     @staticmethod
     def sum(*args) -> DECIMAL:
-        operands = varArgToList(*args)
-        if len(operands) == 0:
-            return None
-
+        # A single iterator argument is consumed without copying
+        operands = varArgToIterable(*args)
+        empty = True
         result = Decimal(0)
         for opd in operands:
             result += opd
-        return result
+            empty = False
+        return None if empty else result
 
     def mean(self, *args) -> DECIMAL:
         operands = varArgToList(*args)
@@ -221,62 +225,33 @@ class DefaultNumericLib:
 
     @staticmethod
     def median(*args) -> DECIMAL:
-        operands = varArgToList(*args)
-        if len(operands) == 0:
-            return None
+        return NumericAggregates.median(varArgToIterable(*args))
 
-        sortedList = sorted(operands, key=float)
-        size = len(sortedList)
-        if size % 2 == 0:
-            first = sortedList[int(size / 2)]
-            second = sortedList[int(size / 2 - 1)]
-            median = (first + second) / 2
-        else:
-            median = sortedList[int(size / 2)]
-        return median
-
-    def stddev(self, *args) -> DECIMAL:
-        operands = varArgToList(*args)
-        if len(operands) == 0:
-            return None
-
-        mean = self.mean(operands)
-        length = Decimal(len(operands) - 1)
-        variance = Decimal(0)
-        for e in operands:
-            number = e
-            dm = number - mean
-            dv = dm * dm
-            variance += dv
-        variance = DefaultNumericType.decimalNumericDivide(variance, length)
-        stddev = self.sqrt(variance)
-        return stddev
+    @staticmethod
+    def stddev(*args) -> DECIMAL:
+        aggregates = NumericAggregates.of(varArgToIterable(*args))
+        return None if aggregates is None else aggregates.stddev()
 
     @staticmethod
     def mode(*args) -> Optional[List[Decimal]]:
         if (args is None):
             return None
-        operands = varArgToList(*args)
-        if len(operands) == 0:
-            return []
-
-        max_ = -1
-        modes = []
-        countMap = defaultdict(int)
-        for n in operands:
-            if not isinstance(n, Decimal):
-                return None
-            countMap[n] += 1
-            count = countMap[n]
-            if count > max_:
-                max_ = count
-
-        for key, value in countMap.items():
-            if value == max_:
-                modes.append(key)
-
-        sortedModes = sorted(modes)
-        return sortedModes
+        return NumericAggregates.mode(varArgToIterable(*args))
+
+    @staticmethod
+    def describe(*args) -> Optional[Context]:
+        # count, sum, mean, min, max and stddev computed in one pass
+        aggregates = NumericAggregates.of(varArgToIterable(*args))
+        if aggregates is None or aggregates.count == 0:
+            return None
+
+        return Context() \
+            .add("count", Decimal(aggregates.count)) \
+            .add("sum", aggregates.sum) \
+            .add("mean", aggregates.mean()) \
+            .add("min", aggregates.min) \
+            .add("max", aggregates.max) \
+            .add("stddev", aggregates.stddev())
 
     @staticmethod
     def toNumber(number: DECIMAL) -> DECIMAL:
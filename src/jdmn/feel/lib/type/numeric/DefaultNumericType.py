@@ -20,6 +20,7 @@ from jdmn.feel.lib.type.numeric.NumericComparator import NumericComparator
 
 
 class DefaultNumericType(BaseType):
+    # Operations call the DECIMAL128 context methods directly instead of entering a local context
     DECIMAL128 = decimal.Context(prec=34, rounding=decimal.ROUND_HALF_EVEN)
 
     def __init__(self):
@@ -63,19 +64,19 @@ class DefaultNumericType(BaseType):
         if first is None or second is None:
             return None
 
-        return self.decimalOperation(first, second, lambda x, y: x + y)
+        return self.DECIMAL128.add(first, second)
 
     def numericSubtract(self, first: DECIMAL, second: DECIMAL) -> Optional[Optional[Decimal]]:
         if first is None or second is None:
             return None
 
-        return self.decimalOperation(first, second, lambda x, y: x - y)
+        return self.DECIMAL128.subtract(first, second)
 
     def numericMultiply(self, first: DECIMAL, second: DECIMAL) -> Optional[Optional[Decimal]]:
         if first is None or second is None:
             return None
 
-        return self.decimalOperation(first, second, lambda x, y: x * y)
+        return self.DECIMAL128.multiply(first, second)
 
     def numericDivide(self, first: DECIMAL, second: DECIMAL) -> Optional[Optional[Decimal]]:
         return self.decimalNumericDivide(first, second)
@@ -85,17 +86,14 @@ class DefaultNumericType(BaseType):
         if first is None:
             return None
 
-        # DECIMAL 128
-        with decimal.localcontext() as ctx:
-            ctx.rounding = DefaultNumericType.DECIMAL128.rounding
-            ctx.prec = DefaultNumericType.DECIMAL128.prec
-            return first.copy_negate()
+        # Negation is exact, no context needed
+        return first.copy_negate()
 
     def numericExponentiation(self, first: DECIMAL, second: DECIMAL) -> DECIMAL:
         if first is None or second is None:
             return None
 
-        return self.decimalOperation(first, second, lambda x, y: x ** y)
+        return self.DECIMAL128.power(first, second)
 
     @staticmethod
     def decimalNumericDivide(first: DECIMAL, second: DECIMAL) -> DECIMAL:
@@ -104,7 +102,7 @@ class DefaultNumericType(BaseType):
         if second.is_zero():
             return None
 
-        return DefaultNumericType.decimalOperation(first, second, lambda x, y: x / y)
+        return DefaultNumericType.DECIMAL128.divide(first, second)
 
     @staticmethod
     def decimalOperation(first: DECIMAL, second: DECIMAL, funct: Callable[[DECIMAL, DECIMAL], DECIMAL]):
@@ -0,0 +1,151 @@
+#
+# Copyright 2016 Goldman Sachs.
+#
+# Licensed under the Apache License, Version 2.0 (the "License") you may not use self file except in compliance with the License.
+#
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations under the License.
+#
+import decimal
+import random
+from collections import Counter
+from decimal import Decimal
+from typing import Any, Iterable, List, Optional
+
+from jdmn.feel.lib.Types import DECIMAL
+from jdmn.feel.lib.type.numeric.DefaultNumericType import DefaultNumericType
+
+# Below this size sorting is cheaper than partitioning
+SELECT_SORT_THRESHOLD = 64
+
+
+class NumericAggregates:
+    """
+    Single-pass accumulator for count, sum, min, max, mean and variance of a stream of numbers.
+    Values are not stored: the accumulator keeps the sum and the sum of squares of the values shifted by the first one,
+    which avoids the cancellation of the textbook formula when the values are large compared to their spread.
+    """
+    DECIMAL128 = DefaultNumericType.DECIMAL128
+
+    def __init__(self):
+        self.count: int = 0
+        self.min: DECIMAL = None
+        self.max: DECIMAL = None
+        self.shift: DECIMAL = None
+        self.shiftedSum: DECIMAL = Decimal(0)
+        self.shiftedSquares: DECIMAL = Decimal(0)
+
+    @staticmethod
+    def of(values: Iterable[Any]) -> Optional['NumericAggregates']:
+        aggregates = NumericAggregates()
+        return aggregates if aggregates.addAll(values) else None
+
+    def add(self, value: DECIMAL) -> bool:
+        return self.addAll((value,))
+
+    def addAll(self, values: Iterable[Any]) -> bool:
+        # False when an element is null, the state is not updated past it
+        count, min_, max_, shift = self.count, self.min, self.max, self.shift
+        shiftedSum, shiftedSquares = self.shiftedSum, self.shiftedSquares
+        result = True
+        with decimal.localcontext(NumericAggregates.DECIMAL128):
+            for value in values:
+                if value is None:
+                    result = False
+                    break
+                if count == 0:
+                    min_ = max_ = shift = value
+                elif value < min_:
+                    min_ = value
+                elif value > max_:
+                    max_ = value
+                delta = value - shift
+                shiftedSum += delta
+                shiftedSquares += delta * delta
+                count += 1
+        self.count, self.min, self.max, self.shift = count, min_, max_, shift
+        self.shiftedSum, self.shiftedSquares = shiftedSum, shiftedSquares
+        return result
+
+    @property
+    def sum(self) -> DECIMAL:
+        if self.count == 0:
+            return Decimal(0)
+        context = NumericAggregates.DECIMAL128
+        return context.add(context.multiply(self.shift, Decimal(self.count)), self.shiftedSum)
+
+    def mean(self) -> DECIMAL:
+        if self.count == 0:
+            return None
+        return DefaultNumericType.decimalNumericDivide(self.sum, Decimal(self.count))
+
+    def variance(self) -> DECIMAL:
+        # Sample variance
+        if self.count < 2:
+            return None
+        context = NumericAggregates.DECIMAL128
+        correction = context.divide(context.multiply(self.shiftedSum, self.shiftedSum), Decimal(self.count))
+        return DefaultNumericType.decimalNumericDivide(context.subtract(self.shiftedSquares, correction), Decimal(self.count - 1))
+
+    def stddev(self) -> DECIMAL:
+        variance = self.variance()
+        if variance is None:
+            return None
+        return variance.sqrt(context=NumericAggregates.DECIMAL128)
+
+    #
+    # Order statistics
+    #
+    @staticmethod
+    def median(values: Iterable[Any]) -> DECIMAL:
+        values = list(values)
+        size = len(values)
+        if size == 0 or any(v is None for v in values):
+            return None
+
+        middle = size // 2
+        if size % 2 == 1:
+            return NumericAggregates.select(values, middle)
+        lower = NumericAggregates.select(values, middle - 1)
+        # The upper middle is either a duplicate of lower or the smallest value above it
+        if sum(1 for v in values if v <= lower) > middle:
+            upper = lower
+        else:
+            upper = min(v for v in values if v > lower)
+        return NumericAggregates.DECIMAL128.divide(NumericAggregates.DECIMAL128.add(lower, upper), Decimal(2))
+
+    @staticmethod
+    def select(values: List[Any], k: int) -> Any:
+        # k-th smallest element (0 based), expected linear time, exact comparisons
+        while len(values) > SELECT_SORT_THRESHOLD:
+            pivot = values[random.randrange(len(values))]
+            lows = [v for v in values if v < pivot]
+            if k < len(lows):
+                values = lows
+                continue
+            highs = [v for v in values if v > pivot]
+            equals = len(values) - len(lows) - len(highs)
+            if k < len(lows) + equals:
+                return pivot
+            k -= len(lows) + equals
+            values = highs
+        return sorted(values)[k]
+
+    #
+    # Frequencies
+    #
+    @staticmethod
+    def mode(values: Iterable[Any]) -> Optional[List[DECIMAL]]:
+        values = list(values)
+        if not all(isinstance(value, Decimal) for value in values):
+            return None
+        counts = Counter(values)
+        if not counts:
+            return []
+
+        maxCount = max(counts.values())
+        return sorted(value for value, count in counts.items() if count == maxCount)
@@ -11,12 +11,34 @@
 # specific language governing permissions and limitations under the License.
 #
 
+from jdmn.feel.lib.Types import BOOLEAN, DECIMAL
 from jdmn.feel.lib.type.ComparableComparator import ComparableComparator
 
 
 class NumericComparator(ComparableComparator):
+    # Native operators, no compareTo() round trip
+    def equalTo(self, first: DECIMAL, second: DECIMAL) -> BOOLEAN:
+        if first is None:
+            return second is None
+        elif second is None:
+            return False
+        else:
+            return type(first) is type(second) and first == second
+
+    def lessThan(self, first: DECIMAL, second: DECIMAL) -> BOOLEAN:
+        if first is None or second is None:
+            return None
+        else:
+            return type(first) is type(second) and first < second
+
+    def lessEqualThan(self, first: DECIMAL, second: DECIMAL) -> BOOLEAN:
+        if first is None or second is None:
+            return True if first is None and second is None else None
+        else:
+            return type(first) is type(second) and first <= second
+
     @staticmethod
-    def compareTo(first: str, second: str) -> int:
+    def compareTo(first: DECIMAL, second: DECIMAL) -> int:
         if first == second:
             return 0
         elif first < second:
@@ -0,0 +1,128 @@
+#
+# Copyright 2016 Goldman Sachs.
+#
+# Licensed under the Apache License, Version 2.0 (the "License") you may not use self file except in compliance with the License.
+#
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations under the License.
+#
+import itertools
+from decimal import Decimal
+from typing import Any, Callable, Iterable, List, Optional
+
+from jdmn.feel.lib.Types import DECIMAL
+from jdmn.feel.lib.type.BaseType import BaseType
+from jdmn.feel.lib.type.numeric.DefaultNumericType import DefaultNumericType
+from jdmn.runtime.DMNRuntimeException import DMNRuntimeException
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+COLUMN = Any  # list, tuple or numpy array of DECIMAL
+OPERAND = Any  # COLUMN or DECIMAL, scalars are broadcast
+
+
+class VectorNumericType(BaseType):
+    """
+    Element-wise numeric operators over columns of values.
+
+    The results are the same as applying the DefaultNumericType operator to each element, including null propagation.
+    Columns are lists, tuples or NumPy arrays (when NumPy is installed); the result is a NumPy object array
+    when one of the operands is an array, a list otherwise.
+    """
+
+    def __init__(self):
+        BaseType.__init__(self)
+        self.numericType = DefaultNumericType()
+
+    #
+    # Arithmetic operators
+    #
+    def numericAdd(self, first: OPERAND, second: OPERAND) -> COLUMN:
+        return self.arithmetic(first, second, DefaultNumericType.DECIMAL128.add)
+
+    def numericSubtract(self, first: OPERAND, second: OPERAND) -> COLUMN:
+        return self.arithmetic(first, second, DefaultNumericType.DECIMAL128.subtract)
+
+    def numericMultiply(self, first: OPERAND, second: OPERAND) -> COLUMN:
+        return self.arithmetic(first, second, DefaultNumericType.DECIMAL128.multiply)
+
+    def numericDivide(self, first: OPERAND, second: OPERAND) -> COLUMN:
+        return self.arithmetic(first, second, DefaultNumericType.decimalNumericDivide)
+
+    def numericExponentiation(self, first: OPERAND, second: OPERAND) -> COLUMN:
+        return self.arithmetic(first, second, DefaultNumericType.DECIMAL128.power)
+
+    def numericUnaryMinus(self, first: OPERAND) -> COLUMN:
+        column = first if self.isColumn(first) else [first]
+        return self.makeColumn([None if x is None else x.copy_negate() for x in column], first)
+
+    #
+    # Comparison operators
+    #
+    def numericEqual(self, first: OPERAND, second: OPERAND) -> COLUMN:
+        return self.comparison(first, second, Decimal.__eq__, self.numericType.numericEqual)
+
+    def numericNotEqual(self, first: OPERAND, second: OPERAND) -> COLUMN:
+        return self.comparison(first, second, Decimal.__ne__, self.numericType.numericNotEqual)
+
+    def numericLessThan(self, first: OPERAND, second: OPERAND) -> COLUMN:
+        return self.comparison(first, second, Decimal.__lt__, self.numericType.numericLessThan)
+
+    def numericGreaterThan(self, first: OPERAND, second: OPERAND) -> COLUMN:
+        return self.comparison(first, second, Decimal.__gt__, self.numericType.numericGreaterThan)
+
+    def numericLessEqualThan(self, first: OPERAND, second: OPERAND) -> COLUMN:
+        return self.comparison(first, second, Decimal.__le__, self.numericType.numericLessEqualThan)
+
+    def numericGreaterEqualThan(self, first: OPERAND, second: OPERAND) -> COLUMN:
+        return self.comparison(first, second, Decimal.__ge__, self.numericType.numericGreaterEqualThan)
+
+    #
+    # Helpers
+    #
+    def arithmetic(self, first: OPERAND, second: OPERAND, operator: Callable[[Decimal, Decimal], DECIMAL]) -> COLUMN:
+        # null if any operand is null
+        firstColumn, secondColumn = self.broadcast(first, second)
+        result = [None if x is None or y is None else operator(x, y) for x, y in zip(firstColumn, secondColumn)]
+        return self.makeColumn(result, first, second)
+
+    def comparison(self, first: OPERAND, second: OPERAND, operator: Callable[[Decimal, Decimal], bool],
+                   scalarOperator: Callable[[DECIMAL, DECIMAL], Optional[bool]]) -> COLUMN:
+        # Two numbers are compared directly, nulls and other values go through the scalar comparator
+        firstColumn, secondColumn = self.broadcast(first, second)
+        result = [operator(x, y) if type(x) is Decimal and type(y) is Decimal else scalarOperator(x, y) for x, y in zip(firstColumn, secondColumn)]
+        return self.makeColumn(result, first, second)
+
+    def broadcast(self, first: OPERAND, second: OPERAND) -> (Iterable, Iterable):
+        firstIsColumn = self.isColumn(first)
+        secondIsColumn = self.isColumn(second)
+        if firstIsColumn and secondIsColumn:
+            if len(first) != len(second):
+                raise DMNRuntimeException(f"Columns have different lengths {len(first)} and {len(second)}")
+            return first, second
+        elif firstIsColumn:
+            return first, itertools.repeat(second, len(first))
+        elif secondIsColumn:
+            return itertools.repeat(first, len(second)), second
+        else:
+            return [first], [second]
+
+    @staticmethod
+    def isColumn(value: Any) -> bool:
+        return isinstance(value, (list, tuple)) or (numpy is not None and isinstance(value, numpy.ndarray))
+
+    def makeColumn(self, result: List[Any], *operands) -> COLUMN:
+        if not any(self.isColumn(operand) for operand in operands):
+            return result[0]
+        if numpy is not None and any(isinstance(operand, numpy.ndarray) for operand in operands):
+            array = numpy.empty(len(result), dtype=object)
+            array[:] = result
+            return array
+        return result
@@ -12,12 +12,15 @@
 #
 from datetime import datetime, date, time, timedelta
 from decimal import Decimal
+from typing import Optional
 
 from isodate import Duration
 
-from jdmn.feel.lib.Types import POINT_RANGE_UNION, BOOLEAN, RANGE, COMPARABLE
+from jdmn.feel.lib.Types import POINT_RANGE_UNION, BOOLEAN, RANGE, COMPARABLE, LIST
+from jdmn.feel.lib.type.TypeDispatcher import TypeDispatcher
 from jdmn.feel.lib.type.bool.DefaultBooleanType import DefaultBooleanType
 from jdmn.feel.lib.type.numeric.NumericComparator import NumericComparator
+from jdmn.feel.lib.type.range.RangeIndex import RangeIndex
 from jdmn.feel.lib.type.string.StringComparator import StringComparator
 from jdmn.feel.lib.type.time.DefaultDateComparator import DefaultDateComparator
 from jdmn.feel.lib.type.time.DefaultDateTimeComparator import DefaultDateTimeComparator
@@ -33,6 +36,7 @@ COMPARATOR_MAP[time] = DefaultTimeComparator()
 COMPARATOR_MAP[datetime] = DefaultDateTimeComparator()
 COMPARATOR_MAP[Duration] = DefaultDurationComparator()
 COMPARATOR_MAP[timedelta] = DefaultDurationComparator()
+COMPARATOR_DISPATCHER = TypeDispatcher(COMPARATOR_MAP)
 
 
 class DefaultRangeLib:
@@ -657,6 +661,38 @@ class DefaultRangeLib:
         else:
             return None
 
+    #
+    # Batch queries over many ranges
+    #
+    def rangeIndex(self, ranges: LIST) -> Optional[RangeIndex]:
+        if ranges is None:
+            return None
+        return RangeIndex(ranges, self)
+
+    @staticmethod
+    def rangesContaining(index: RangeIndex, point: COMPARABLE) -> LIST:
+        if index is None or point is None:
+            return None
+        return index.stab(point)
+
+    @staticmethod
+    def rangesOverlapping(index: RangeIndex, range_: RANGE) -> LIST:
+        if index is None or range_ is None:
+            return None
+        return index.overlapping(range_)
+
+    @staticmethod
+    def rangesIncluding(index: RangeIndex, range_: RANGE) -> LIST:
+        if index is None or range_ is None:
+            return None
+        return index.including(range_)
+
+    @staticmethod
+    def rangesDuring(index: RangeIndex, range_: RANGE) -> LIST:
+        if index is None or range_ is None:
+            return None
+        return index.during(range_)
+
     @staticmethod
     def checkArguments(arg1: POINT_RANGE_UNION, arg2: POINT_RANGE_UNION) -> bool:
         return arg1 is None or arg2 is None
@@ -671,6 +707,4 @@ class DefaultRangeLib:
 
     @staticmethod
     def resolveComparator(arg):
-        key = type(arg)
-        cmp = COMPARATOR_MAP.get(key)
-        return cmp
+        return COMPARATOR_DISPATCHER.resolve(arg)
@@ -0,0 +1,124 @@
+#
+# Copyright 2016 Goldman Sachs.
+#
+# Licensed under the Apache License, Version 2.0 (the "License") you may not use self file except in compliance with the License.
+#
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations under the License.
+#
+from bisect import bisect_left, bisect_right
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+from jdmn.runtime.IntervalTree import INTERVAL, IntervalTree, indexKey
+from jdmn.runtime.Range import Range
+
+
+class RangeIndex:
+    """
+    Index over a list of ranges that answers the same queries as filtering the list with the range lib:
+        stab(point)           - ranges r such that includes(r, point) is true
+        overlapping(range)    - ranges r such that overlaps(r, range) is true
+        including(range)      - ranges r such that includes(r, range) is true
+        during(range)         - ranges r such that during(r, range) is true
+    The index finds the candidates, the ranges whose closed range [start..end] contains the point or has a point in common
+    with the query, and the lib checks them, so degenerate ranges such as (1..1] and ranges with a missing endpoint give
+    the same results as the lib. Ranges without a start (e.g. Range("<", 10) or Range("!=", x), which does not keep its
+    endpoint) are null in DefaultRangeLib, they are not indexed and never match.
+    Stabbing and overlap queries run in O(log n + k), containment queries in O(log n + c) where k is the number of
+    candidates and c the number of ranges containing the start of the query (including) or starting inside the query (during).
+    Ranges are grouped by endpoint type like the ranges of a decision table column (see ColumnIndex),
+    queries return the matching ranges in their original order.
+    """
+
+    def __init__(self, ranges: Iterable[Range], rangeLib: Any):
+        # rangeLib is a DefaultRangeLib
+        self.ranges: List[Range] = list(ranges)
+        self.rangeLib = rangeLib
+        intervals: Dict[type, List[INTERVAL]] = {}
+        for position, range_ in enumerate(self.ranges):
+            interval = self.interval(range_, position)
+            if interval is not None:
+                intervals.setdefault(type(range_.getStart()), []).append(interval)
+        self.groups: Dict[type, RangeIndexGroup] = {key: RangeIndexGroup(value) for key, value in intervals.items()}
+
+    def __len__(self):
+        return len(self.ranges)
+
+    def stab(self, point: Any) -> List[Range]:
+        if point is None:
+            return []
+        group = self.groups.get(type(point))
+        positions = [] if group is None else group.containing(indexKey(point))
+        return self.select(positions, point, self.rangeLib.includes)
+
+    def overlapping(self, range_: Range) -> List[Range]:
+        return self.query(range_, RangeIndexGroup.overlapping, self.rangeLib.overlaps)
+
+    def including(self, range_: Range) -> List[Range]:
+        return self.query(range_, RangeIndexGroup.including, self.rangeLib.includes)
+
+    def during(self, range_: Range) -> List[Range]:
+        return self.query(range_, RangeIndexGroup.during, self.rangeLib.during)
+
+    def query(self, range_: Range, candidates: Callable[['RangeIndexGroup', INTERVAL], List[int]], predicate: Callable[[Range, Any], Any]) -> List[Range]:
+        query = self.interval(range_, None)
+        if query is None:
+            return []
+        group = self.groups.get(type(range_.getStart()))
+        return [] if group is None else self.select(candidates(group, query), range_, predicate)
+
+    def select(self, positions: List[int], argument: Any, predicate: Callable[[Range, Any], Any]) -> List[Range]:
+        ranges = self.ranges
+        return [ranges[position] for position in sorted(positions) if predicate(ranges[position], argument) is True]
+
+    @staticmethod
+    def interval(range_: Range, position: Optional[int]) -> Optional[INTERVAL]:
+        # Closed range of index keys, None for ranges without a start
+        start = range_.getStart()
+        end = range_.getEnd()
+        if start is None:
+            return None
+        return indexKey(start), True, None if end is None else indexKey(end), True, position
+
+
+class RangeIndexGroup:
+    # Closed ranges of one endpoint type. The Range constructor does not check the order of Duration endpoints,
+    # inverted ranges are candidates of every query
+    def __init__(self, intervals: List[INTERVAL]):
+        self.positions: List[int] = [interval[4] for interval in intervals]
+        ordered = [interval for interval in intervals if not self.isInverted(interval)]
+        self.inverted: List[int] = [interval[4] for interval in intervals if self.isInverted(interval)]
+        self.tree = IntervalTree(ordered)
+        byStart = sorted(ordered, key=lambda interval: interval[0])
+        self.startKeys = [interval[0] for interval in byStart]
+        self.byStart: List[int] = [interval[4] for interval in byStart]
+
+    def containing(self, point: Any) -> List[int]:
+        return self.tree.stab(point) + self.inverted
+
+    def overlapping(self, query: INTERVAL) -> List[int]:
+        # Ranges containing the query start or starting inside the query
+        start, _, end, _, _ = query
+        if self.isInverted(query):
+            return self.positions
+        return self.containing(start) + self.byStart[bisect_right(self.startKeys, start):self.startsUpTo(end)]
+
+    def including(self, query: INTERVAL) -> List[int]:
+        return self.positions if self.isInverted(query) else self.containing(query[0])
+
+    def during(self, query: INTERVAL) -> List[int]:
+        start, _, end, _, _ = query
+        if self.isInverted(query):
+            return self.positions
+        return self.byStart[bisect_left(self.startKeys, start):self.startsUpTo(end)] + self.inverted
+
+    def startsUpTo(self, end: Any) -> int:
+        return len(self.byStart) if end is None else bisect_right(self.startKeys, end)
+
+    @staticmethod
+    def isInverted(interval: INTERVAL) -> bool:
+        return interval[2] is not None and interval[2] < interval[0]
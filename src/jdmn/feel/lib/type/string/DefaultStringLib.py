@@ -20,6 +20,10 @@ from lxml import etree
 import elementpath
 
 from jdmn.feel.lib.Types import STRING, BOOLEAN, INTEGER, LIST, DECIMAL, TIME_OR_DATE_TIME
+from jdmn.feel.lib.type.string.XPathRegexTranslator import XPathRegexTranslator
+
+# Text that is changed or rejected by the XML parser (markup, line end normalization, invalid characters)
+NOT_XML_TEXT = re.compile("[&<\x00-\x08\x0b-\x1f\ud800-\udfff\ufffe\uffff]|]]>")
 
 
 class DefaultStringLib:
@@ -160,14 +164,29 @@ class DefaultStringLib:
         return result
 
     def evaluateReplace(self, input_: str, pattern: str, replacement: str, flags: str) -> str:
+        if self.isTranslatable(input_, pattern, replacement, flags):
+            function = XPathRegexTranslator.compileReplace(pattern, replacement, flags)
+            if function is not None:
+                return function(input_)
+
         expression = f"replace(/root, '{pattern}', '{replacement}', '{flags}')"
         return self.evaluateXPath(input_, expression)
 
     def evaluateMatches(self, input_: str, pattern: str, flags: str) -> bool:
+        if self.isTranslatable(input_, pattern, flags):
+            regex = XPathRegexTranslator.compileMatches(pattern, flags)
+            if regex is not None:
+                return regex.search(input_) is not None
+
         expression = f"/root[matches(., '{pattern}', '{flags}')]"
         value = self.evaluateXPath(input_, expression)
         return len(value) != 0
 
+    @staticmethod
+    def isTranslatable(input_: str, *arguments: str) -> bool:
+        # Same result as the XPath evaluation: the input is unchanged by the XML parser and the arguments are valid XPath literals
+        return NOT_XML_TEXT.search(input_) is None and all("'" not in argument for argument in arguments)
+
     @staticmethod
     def evaluateXPath(input_: str, expression: str):
         # Read document
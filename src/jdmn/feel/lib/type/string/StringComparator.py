@@ -11,10 +11,32 @@
 # specific language governing permissions and limitations under the License.
 #
 
+from jdmn.feel.lib.Types import BOOLEAN, STRING
 from jdmn.feel.lib.type.ComparableComparator import ComparableComparator
 
 
 class StringComparator(ComparableComparator):
+    # Native operators, no compareTo() round trip
+    def equalTo(self, first: STRING, second: STRING) -> BOOLEAN:
+        if first is None:
+            return second is None
+        elif second is None:
+            return False
+        else:
+            return type(first) is type(second) and first == second
+
+    def lessThan(self, first: STRING, second: STRING) -> BOOLEAN:
+        if first is None or second is None:
+            return None
+        else:
+            return type(first) is type(second) and first < second
+
+    def lessEqualThan(self, first: STRING, second: STRING) -> BOOLEAN:
+        if first is None or second is None:
+            return True if first is None and second is None else None
+        else:
+            return type(first) is type(second) and first <= second
+
     @staticmethod
     def compareTo(first: str, second: str) -> int:
         if first == second:
@@ -0,0 +1,259 @@
+#
+# Copyright 2016 Goldman Sachs.
+#
+# Licensed under the Apache License, Version 2.0 (the "License") you may not use self file except in compliance with the License.
+#
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations under the License.
+#
+import functools
+import re
+from typing import Callable, List, Optional, Union
+
+# Regex syntax that is handled by the translator, see XPath and XQuery Functions and Operators 3.1, section 5.6
+SINGLE_CHAR_ESCAPES = "nrt\\|.-^?*+{}()[]$"
+QUANTIFIER = re.compile(r"\{\d+(,\d*)?}")
+XML_WHITESPACE = " \t\n\r"
+FLAGS = {"s": re.DOTALL, "m": re.MULTILINE, "i": re.IGNORECASE}
+
+
+class XPathRegexTranslator:
+    """
+    Translates XPath regular expressions and flags to Python regular expressions.
+
+    Only the common subset of the XPath syntax is translated. Constructs with different semantics in Python
+    (e.g. \\w, \\i, \\c, \\p{..}, character class subtraction) are not translated and the callers fall back
+    to elementpath. Compiled patterns are cached per (pattern, flags).
+    """
+
+    CACHE_SIZE = 1024
+
+    @staticmethod
+    @functools.lru_cache(maxsize=CACHE_SIZE)
+    def compileMatches(pattern: str, flags: str) -> Optional[re.Pattern]:
+        return XPathRegexTranslator.compilePattern(pattern, flags)
+
+    @staticmethod
+    @functools.lru_cache(maxsize=CACHE_SIZE)
+    def compileReplace(pattern: str, replacement: str, flags: str) -> Optional[Callable[[str], str]]:
+        regex = XPathRegexTranslator.compilePattern(pattern, flags)
+        if regex is None or regex.fullmatch("") is not None:
+            # Patterns that match the empty string are errors for replace()
+            return None
+
+        if "q" in flags:
+            if "\\" in replacement or "$" in replacement:
+                return None
+            return lambda input_: regex.sub(lambda match: replacement, input_)
+
+        parts = XPathRegexTranslator.parseReplacement(replacement, regex.groups)
+        if parts is None:
+            return None
+
+        def expand(match: re.Match) -> str:
+            return "".join(part if isinstance(part, str) else (match.group(part) or "") for part in parts)
+
+        return lambda input_: regex.sub(expand, input_)
+
+    @staticmethod
+    def compilePattern(pattern: str, flags: str) -> Optional[re.Pattern]:
+        if any(flag not in "smixq" for flag in flags):
+            return None
+
+        if "q" in flags:
+            translation = re.escape(pattern)
+            reFlags = re.IGNORECASE if "i" in flags else 0
+        else:
+            translation = XPathRegexTranslator.translate(pattern, flags)
+            if translation is None:
+                return None
+            reFlags = 0
+            for flag in flags:
+                reFlags |= FLAGS.get(flag, 0)
+
+        try:
+            return re.compile(translation, reFlags)
+        except re.error:
+            return None
+
+    @staticmethod
+    def translate(pattern: str, flags: str) -> Optional[str]:
+        if "x" in flags:
+            pattern = XPathRegexTranslator.removeWhitespace(pattern)
+            if pattern is None:
+                return None
+
+        result = []
+        dotAll = "s" in flags
+        multiLine = "m" in flags
+        inClass = False
+        quantified = None
+        i = 0
+        n = len(pattern)
+        while i < n:
+            c = pattern[i]
+            if c == "\\":
+                escape = XPathRegexTranslator.translateEscape(pattern, i, inClass)
+                if escape is None:
+                    return None
+                result.append(escape)
+                quantified = None
+                i += 2
+                continue
+
+            if inClass:
+                translation = XPathRegexTranslator.translateClassCharacter(pattern, i)
+                if translation is None:
+                    return None
+                inClass = c != "]"
+                result.append(translation)
+                i += 1
+                continue
+
+            quantified = XPathRegexTranslator.quantifierState(quantified, c)
+            if quantified == "invalid":
+                return None
+
+            if c == "[":
+                inClass = True
+                result.append(c)
+                if i + 1 < n and pattern[i + 1] == "^":
+                    result.append("^")
+                    i += 1
+                if i + 1 < n and pattern[i + 1] == "]":
+                    # Empty class
+                    return None
+            elif c in "]}" or (c == "^" and multiLine):
+                # ] and } are not allowed as normal characters, multi line ^ also matches after a trailing newline in Python
+                return None
+            elif c == ".":
+                result.append("." if dotAll else "[^\\n\\r]")
+            elif c == "$":
+                result.append("$" if multiLine else "\\Z")
+            elif c == "(":
+                if i + 1 < n and pattern[i + 1] == "?":
+                    return None
+                result.append(c)
+            elif c == "{":
+                quantifier = QUANTIFIER.match(pattern, i)
+                if quantifier is None:
+                    return None
+                result.append(quantifier.group())
+                i = quantifier.end()
+                continue
+            else:
+                result.append(c)
+            i += 1
+
+        if inClass:
+            return None
+        return "".join(result)
+
+    @staticmethod
+    def quantifierState(previous: Optional[str], c: str) -> Optional[str]:
+        # None, "quantifier", "reluctant" or "invalid". XPath allows one reluctant ? after a quantifier,
+        # Python also accepts possessive and repeated quantifiers
+        if c not in "*+?{":
+            return None
+        elif previous == "reluctant" or (previous == "quantifier" and c != "?"):
+            return "invalid"
+        else:
+            return "reluctant" if previous == "quantifier" else "quantifier"
+
+    @staticmethod
+    def translateClassCharacter(pattern: str, i: int) -> Optional[str]:
+        c = pattern[i]
+        if c == "[":
+            # Class subtraction
+            return None
+        elif c == "-" and i + 1 < len(pattern) and pattern[i + 1] == "-":
+            # Not valid in XPath, set difference in future Python versions
+            return None
+        elif c in "&~|":
+            # Set operators in future Python versions
+            return "\\" + c
+        else:
+            return c
+
+    @staticmethod
+    def translateEscape(pattern: str, i: int, inClass: bool) -> Optional[str]:
+        n = len(pattern)
+        if i + 1 >= n:
+            return None
+        escaped = pattern[i + 1]
+        if escaped in SINGLE_CHAR_ESCAPES or escaped in "dD":
+            return "\\" + escaped
+        elif escaped == "s":
+            # XML whitespace, Python \s matches more characters
+            return " \\t\\n\\r" if inClass else "[ \\t\\n\\r]"
+        elif escaped == "S" and not inClass:
+            return "[^ \\t\\n\\r]"
+        elif escaped in "123456789" and not inClass and (i + 2 >= n or not pattern[i + 2].isdigit()):
+            # Back reference
+            return "\\" + escaped
+        else:
+            return None
+
+    @staticmethod
+    def removeWhitespace(pattern: str) -> Optional[str]:
+        # Flag x: whitespace outside character classes is removed before matching
+        result = []
+        inClass = False
+        i = 0
+        n = len(pattern)
+        while i < n:
+            c = pattern[i]
+            if c == "\\":
+                if i + 1 < n and pattern[i + 1] in XML_WHITESPACE:
+                    return None
+                result.append(pattern[i:i + 2])
+                i += 2
+                continue
+            if inClass:
+                inClass = c != "]"
+            elif c == "[":
+                inClass = True
+            elif c in XML_WHITESPACE:
+                i += 1
+                continue
+            result.append(c)
+            i += 1
+        return "".join(result)
+
+    @staticmethod
+    def parseReplacement(replacement: str, groups: int) -> Optional[List[Union[str, int]]]:
+        # Literal strings and group numbers, None when the replacement is not supported
+        parts = []
+        i = 0
+        n = len(replacement)
+        while i < n:
+            c = replacement[i]
+            if c == "\\":
+                if i + 1 < n and replacement[i + 1] in "\\$":
+                    parts.append(replacement[i + 1])
+                    i += 2
+                else:
+                    return None
+            elif c == "$":
+                j = i + 1
+                while j < n and replacement[j].isdigit():
+                    j += 1
+                if j == i + 1:
+                    return None
+                # Longest prefix of the digits that is a valid group number
+                end = j
+                while end > i + 2 and int(replacement[i + 1:end]) > groups:
+                    end -= 1
+                group = int(replacement[i + 1:end])
+                if group > groups:
+                    return None
+                parts.append(group)
+                i = end
+            else:
+                parts.append(c)
+                i += 1
+        return parts
@@ -13,32 +13,16 @@
 from typing import Optional
 
 from jdmn.feel.lib.Types import DATE_TIME_UNION
-from jdmn.feel.lib.type.RelationalComparator import RelationalComparator
+from jdmn.feel.lib.type.ComparableComparator import ComparableComparator
 
 
-class BaseDateTimeComparator(RelationalComparator):
+class BaseDateTimeComparator(ComparableComparator):
     def compare(self, first: DATE_TIME_UNION, second: DATE_TIME_UNION) -> Optional[int]:
         if first is None or second is None:
             return None
         else:
             return self.compareTo(first, second)
 
-    def equalTo(self, first: DATE_TIME_UNION, second: DATE_TIME_UNION) -> Optional[bool]:
-        return self.applyOperator(first, second, [
-                lambda: True,
-                lambda: False,
-                lambda:False,
-                lambda: type(first) is type(second) and self.compareTo(first, second) == 0
-        ])
-
-    def lessThan(self, first: DATE_TIME_UNION, second: DATE_TIME_UNION) -> Optional[bool]:
-        return self.applyOperator(first, second, [
-                lambda: None,
-                lambda: None,
-                lambda: None,
-                lambda: type(first) is type(second) and self.compareTo(first, second) == -1
-            ])
-
     @staticmethod
     def compareTo(first: DATE_TIME_UNION, second: DATE_TIME_UNION) -> int:
         pass  # do nothing
@@ -13,7 +13,7 @@
 import re
 from datetime import date, time, datetime
 from decimal import Decimal
-from typing import Any
+from typing import Any, Callable, Dict, Iterable
 from zoneinfo import ZoneInfo
 
 import isodate
@@ -21,7 +21,9 @@ from isodate import Duration, tzinfo, FixedOffset
 
 from jdmn.feel.lib.Types import STRING, DATE, TIME, DATE_TIME, DURATION, INTEGER, TIME_OR_DATE_TIME
 from jdmn.feel.lib.type.BaseType import BaseType
+from jdmn.feel.lib.type.time.ISODateTimeParser import ISODateTimeParser
 from jdmn.runtime.DMNRuntimeException import DMNRuntimeException
+from jdmn.runtime.cache.LRUCache import LRUCache
 
 DAY_NAMES = ["", "Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"]
 MONTH_NAMES = ["January", "February", "March", "April", "May", "June", "July", "August", "September", "October", "November", "December"]
@@ -36,6 +38,12 @@ class DefaultDateTimeLib:
     TIME_PATTERN = re.compile("^T?" + TIME_PART + "$")
     DATE_TIME_PATTERN = re.compile("^" + DATE_PART + "T" + TIME_PART + "$")
 
+    LITERAL_CACHE_SIZE = 4096
+
+    def __init__(self, literalCacheSize: int = LITERAL_CACHE_SIZE):
+        # Parsed literals are immutable and shared between calls, None disables the cache
+        self.literalCache = None if not literalCacheSize else LRUCache(maxEntries=literalCacheSize)
+
     #
     # Conversion functions
     #
@@ -45,7 +53,7 @@ class DefaultDateTimeLib:
             arg = args[0]
             if isinstance(arg, str):
                 # From literal
-                result = self.parseDate(arg)
+                result = self.parseLiteral("date", arg, self.parseDate)
             elif isinstance(arg, (datetime, date)):
                 # From date or datetime
                 result = self.toDate(arg)
@@ -67,12 +75,7 @@ class DefaultDateTimeLib:
             arg = args[0]
             if isinstance(arg, str):
                 # From literal
-                if '@' in arg:
-                    parts = arg.split("@")
-                    time_ = self.parseTime(parts[0])
-                    result = self.mergeTzInfo(arg, time_, parts[1])
-                else:
-                    result = self.parseTime(arg)
+                result = self.parseLiteral("time", arg, self.parseTimeLiteral)
             elif isinstance(arg, (time, datetime, date)):
                 # From date, time or datetime
                 result = self.toTime(arg)
@@ -100,14 +103,7 @@ class DefaultDateTimeLib:
             arg = args[0]
             if isinstance(arg, str):
                 # From literal (date or datetime)
-                if "-" in arg and not ("T" in arg):
-                    arg += "T00:00:00"
-                if '@' in arg:
-                    parts = arg.split("@")
-                    dt = self.parseDateTime(parts[0])
-                    result = self.mergeTzInfo(arg, dt, parts[1])
-                else:
-                    result = self.parseDateTime(arg)
+                result = self.parseLiteral("dateAndTime", arg, self.parseDateTimeLiteral)
             elif isinstance(arg, time):
                 # From time
                 result = arg
@@ -120,6 +116,54 @@ class DefaultDateTimeLib:
             result = None
         return result if self.isValidDateTimeValue(result) else None
 
+    #
+    # Literal cache
+    #
+    def parseLiteral(self, kind: str, literal: str, parse: Callable[[str], Any]) -> Any:
+        # Invalid literals raise exceptions and are not cached
+        cache = self.literalCache
+        if cache is None:
+            return parse(literal)
+
+        key = (kind, literal)
+        try:
+            return cache.lookup(key)
+        except KeyError:
+            result = parse(literal)
+            cache.bind(key, result)
+            return result
+
+    def preParse(self, function: str, literals: Iterable[str]) -> Dict[str, Any]:
+        # Parse the literals of a decision once, e.g. at construction time
+        conversion = getattr(self, function)
+        return {literal: conversion(literal) for literal in literals}
+
+    def literalCacheStatistics(self) -> Dict[str, Any]:
+        if self.literalCache is None:
+            return {}
+        statistics = self.literalCache.statistics()
+        lookups = statistics["hits"] + statistics["misses"]
+        statistics["hitRate"] = 0.0 if lookups == 0 else statistics["hits"] / lookups
+        return statistics
+
+    def parseTimeLiteral(self, arg: str) -> time:
+        if '@' in arg:
+            parts = arg.split("@")
+            time_ = self.parseTime(parts[0])
+            return self.mergeTzInfo(arg, time_, parts[1])
+        else:
+            return self.parseTime(arg)
+
+    def parseDateTimeLiteral(self, arg: str) -> datetime:
+        if "-" in arg and not ("T" in arg):
+            arg += "T00:00:00"
+        if '@' in arg:
+            parts = arg.split("@")
+            dt = self.parseDateTime(parts[0])
+            return self.mergeTzInfo(arg, dt, parts[1])
+        else:
+            return self.parseDateTime(arg)
+
     def parseDate(self, arg: str) -> date:
         if not bool(self.DATE_PATTERN.match(arg)):
             raise DMNRuntimeException(f"Illegal date format '{arg}'")
@@ -127,6 +171,10 @@ class DefaultDateTimeLib:
         return date.fromisoformat(arg)
 
     def parseTime(self, arg: str) -> time:
+        result = self.fastParse(ISODateTimeParser.parseTime, arg)
+        if result is not None:
+            return result
+
         if not bool(self.TIME_PATTERN.match(arg)):
             raise DMNRuntimeException(f"Illegal time format '{arg}'")
 
@@ -137,6 +185,10 @@ class DefaultDateTimeLib:
         return t
 
     def parseDateTime(self, arg: str) -> datetime:
+        result = self.fastParse(ISODateTimeParser.parseDateTime, arg)
+        if result is not None:
+            return result
+
         if not bool(self.DATE_TIME_PATTERN.match(arg)):
             raise DMNRuntimeException(f"Illegal datetime format '{arg}'")
 
@@ -153,6 +205,14 @@ class DefaultDateTimeLib:
         #        dt = dateutil.parser.isoparse(arg)
         return dt
 
+    @staticmethod
+    def fastParse(parse: Callable[[str], Any], arg: str) -> Any:
+        # None when the literal is not supported by the fast parser or is invalid, isodate reports the error
+        try:
+            return parse(arg)
+        except ValueError:
+            return None
+
     # Fix the format 2016-08-01T11:00:00.000+0000 to 2016-08-01T11:00:00.000+00:00
     # and T11:00:00.000+0000 to 11:00:00.000+00:00
     @staticmethod
@@ -0,0 +1,72 @@
+#
+# Copyright 2016 Goldman Sachs.
+#
+# Licensed under the Apache License, Version 2.0 (the "License") you may not use self file except in compliance with the License.
+#
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations under the License.
+#
+import functools
+import re
+from datetime import date, datetime, time
+from typing import Optional
+
+from isodate import FixedOffset
+
+# Same grammar as DefaultDateTimeLib.TIME_PATTERN and DATE_TIME_PATTERN, ASCII digits only
+TIME_PART = r"(\d{2}):(\d{2}):(\d{2})(?:[.](\d+))?([+-]\d{2}:?\d{2}|[Zz])?"
+TIME_LITERAL = re.compile("T?" + TIME_PART, re.ASCII)
+DATE_TIME_LITERAL = re.compile(r"(\d{4})-(\d{2})-(\d{2})T" + TIME_PART, re.ASCII)
+
+
+class ISODateTimeParser:
+    """
+    Parser for the time and date time literals of DefaultDateTimeLib.
+
+    Builds the same values as the isodate based parser (fractions truncated to microseconds, isodate FixedOffset
+    time zones, Z mapped to +00:00) by slicing the fields matched by the literal grammar.
+    Returns None for literals outside the grammar, so that the callers can fall back to isodate.
+    """
+
+    @staticmethod
+    def parseTime(literal: str) -> Optional[time]:
+        match = TIME_LITERAL.fullmatch(literal)
+        if match is None:
+            return None
+        hour, minute, second, fraction, offset = match.groups()
+        return time(int(hour), int(minute), int(second), ISODateTimeParser.microseconds(fraction), ISODateTimeParser.tzInfo(offset))
+
+    @staticmethod
+    def parseDateTime(literal: str) -> Optional[datetime]:
+        match = DATE_TIME_LITERAL.fullmatch(literal)
+        if match is None:
+            return None
+        year, month, day, hour, minute, second, fraction, offset = match.groups()
+        # Same range checks as date(), e.g. year 0 is rejected
+        date(int(year), int(month), int(day))
+        return datetime(int(year), int(month), int(day), int(hour), int(minute), int(second),
+                        ISODateTimeParser.microseconds(fraction), ISODateTimeParser.tzInfo(offset))
+
+    @staticmethod
+    def microseconds(fraction: Optional[str]) -> int:
+        if fraction is None:
+            return 0
+        return int(fraction[:6].ljust(6, "0"))
+
+    @staticmethod
+    @functools.lru_cache(maxsize=512)
+    def tzInfo(offset: Optional[str]) -> Optional[FixedOffset]:
+        if offset is None:
+            return None
+        if offset in ("Z", "z"):
+            name = "+00:00"
+        elif len(offset) == 5:
+            name = offset[:3] + ":" + offset[3:]
+        else:
+            name = offset
+        sign = -1 if name[0] == "-" else 1
+        return FixedOffset(sign * int(name[1:3]), sign * int(name[4:6]), name)
@@ -0,0 +1,133 @@
+#
+# Copyright 2016 Goldman Sachs.
+#
+# Licensed under the Apache License, Version 2.0 (the "License") you may not use self file except in compliance with the License.
+#
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations under the License.
+#
+import asyncio
+import functools
+import itertools
+import os
+from collections import deque
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, AsyncIterable, AsyncIterator, Callable, Iterable, List, Optional, Union
+
+from jdmn.runtime.DMNDecision import DMNDecision
+from jdmn.runtime.DMNRuntimeException import DMNRuntimeException
+from jdmn.runtime.ExecutionContext import ExecutionContext
+from jdmn.runtime.ParallelDecisionExecutor import applyChunk, initializeWorker
+
+
+def applyChunkWith(decision: DMNDecision, executionContextFactory: Optional[Callable[[], ExecutionContext]], inputs: List[dict]) -> List[Any]:
+    executionContext = None if executionContextFactory is None else executionContextFactory()
+    return list(decision.applyRequests(inputs, executionContext))
+
+
+class AsyncDecisionRunner:
+    """
+    Evaluates a decision from asyncio code, the evaluation runs in a pool of worker threads or processes.
+
+    At most maxInFlight evaluations (single requests or chunks of a batch) are submitted at any time, callers wait
+    for a free slot. Cancelling a caller cancels its evaluation if it has not started yet, a running evaluation
+    keeps its slot until it completes. In thread mode all workers share one decision instance, in process mode
+    each worker builds its own, as in ParallelDecisionExecutor.
+    """
+
+    def __init__(self, decisionClass: Callable[[], DMNDecision], maxWorkers: int = None, processes: bool = False, maxInFlight: int = None,
+                 chunkSize: int = 100, executionContextFactory: Callable[[], ExecutionContext] = None, mpContext=None):
+        if maxInFlight is not None and maxInFlight < 1:
+            raise DMNRuntimeException(f"Max in flight must be positive, found '{maxInFlight}'")
+        if chunkSize < 1:
+            raise DMNRuntimeException(f"Chunk size must be positive, found '{chunkSize}'")
+        self.chunkSize = chunkSize
+        self.executor: Executor
+        if processes:
+            self.executor = ProcessPoolExecutor(max_workers=maxWorkers, mp_context=mpContext,
+                                                initializer=initializeWorker, initargs=(decisionClass, executionContextFactory))
+            self.function = applyChunk
+        else:
+            self.executor = ThreadPoolExecutor(max_workers=maxWorkers, thread_name_prefix="jdmn-decision")
+            self.function = functools.partial(applyChunkWith, decisionClass(), executionContextFactory)
+        self.maxInFlight = maxInFlight or 2 * (maxWorkers or os.cpu_count() or 1)
+        # Bound to the running loop on first use
+        self.loop: Optional[asyncio.AbstractEventLoop] = None
+        self.semaphore: Optional[asyncio.Semaphore] = None
+
+    async def applyRequestAsync(self, input_: dict) -> Any:
+        outputs = await self.submit([input_])
+        return outputs[0]
+
+    async def applyRequestsAsync(self, inputs: Union[Iterable[dict], AsyncIterable[dict]], chunkSize: int = None) -> AsyncIterator[Any]:
+        # Outputs are yielded in input order. Pending chunks are cancelled when the iteration is closed or cancelled
+        pending = deque()
+        try:
+            async for chunk in self.chunks(inputs, chunkSize or self.chunkSize):
+                if len(pending) >= self.maxInFlight:
+                    for output in await pending.popleft():
+                        yield output
+                pending.append(asyncio.ensure_future(self.submit(chunk)))
+            while pending:
+                for output in await pending.popleft():
+                    yield output
+        finally:
+            for future in pending:
+                future.cancel()
+
+    async def submit(self, inputs: List[dict]) -> List[Any]:
+        loop = asyncio.get_running_loop()
+        semaphore = self.getSemaphore(loop)
+        await semaphore.acquire()
+        try:
+            future = self.executor.submit(self.function, inputs)
+        except BaseException:
+            semaphore.release()
+            raise
+        # The slot is released when the work is done or cancelled, not when the caller stops waiting
+        future.add_done_callback(functools.partial(self.releaseSlot, loop, semaphore))
+        return await asyncio.wrap_future(future)
+
+    def getSemaphore(self, loop: asyncio.AbstractEventLoop) -> asyncio.Semaphore:
+        # A semaphore cannot be shared by event loops, e.g. by successive asyncio.run() calls
+        if self.loop is not loop:
+            self.loop = loop
+            self.semaphore = asyncio.Semaphore(self.maxInFlight)
+        return self.semaphore
+
+    @staticmethod
+    def releaseSlot(loop: asyncio.AbstractEventLoop, semaphore: asyncio.Semaphore, future: Future) -> None:
+        if not loop.is_closed():
+            loop.call_soon_threadsafe(semaphore.release)
+
+    @staticmethod
+    async def chunks(inputs: Union[Iterable[dict], AsyncIterable[dict]], chunkSize: int) -> AsyncIterator[List[dict]]:
+        if hasattr(inputs, "__aiter__"):
+            chunk = []
+            async for input_ in inputs:
+                chunk.append(input_)
+                if len(chunk) == chunkSize:
+                    yield chunk
+                    chunk = []
+            if chunk:
+                yield chunk
+        else:
+            iterator = iter(inputs)
+            while True:
+                chunk = list(itertools.islice(iterator, chunkSize))
+                if not chunk:
+                    return
+                yield chunk
+
+    def shutdown(self, wait: bool = True) -> None:
+        self.executor.shutdown(wait=wait, cancel_futures=not wait)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, excType, excValue, traceback):
+        await asyncio.get_running_loop().run_in_executor(None, self.shutdown)
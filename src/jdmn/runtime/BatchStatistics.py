@@ -0,0 +1,56 @@
+#
+# Copyright 2016 Goldman Sachs.
+#
+# Licensed under the Apache License, Version 2.0 (the "License") you may not use self file except in compliance with the License.
+#
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations under the License.
+#
+import time
+from typing import Optional
+
+
+class BatchStatistics:
+    # Times are in milliseconds, as the durations reported to the event listeners
+
+    def __init__(self):
+        self.count = 0
+        self.totalTime = 0.0
+        self.minTime: Optional[float] = None
+        self.maxTime: Optional[float] = None
+        self.startTime: Optional[int] = None
+        self.endTime: Optional[int] = None
+
+    def start(self) -> None:
+        if self.startTime is None:
+            self.startTime = time.perf_counter_ns()
+
+    def record(self, duration: float) -> None:
+        self.count += 1
+        self.totalTime += duration
+        if self.minTime is None or duration < self.minTime:
+            self.minTime = duration
+        if self.maxTime is None or duration > self.maxTime:
+            self.maxTime = duration
+        self.endTime = time.perf_counter_ns()
+
+    def meanTime(self) -> Optional[float]:
+        return None if self.count == 0 else self.totalTime / self.count
+
+    def elapsedTime(self) -> float:
+        if self.startTime is None or self.endTime is None:
+            return 0.0
+        return (self.endTime - self.startTime) / 1_000_000
+
+    def throughput(self) -> Optional[float]:
+        # Requests per second over the wall-clock time of the batch
+        elapsed = self.elapsedTime()
+        return None if elapsed == 0 else self.count * 1000 / elapsed
+
+    def __str__(self):
+        return f"BatchStatistics(count={self.count}, total={self.totalTime:.3f}ms, min={self.minTime}ms, max={self.maxTime}ms, " \
+               f"mean={self.meanTime()}ms, throughput={self.throughput()}/s)"
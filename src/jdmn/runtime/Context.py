@@ -10,10 +10,27 @@
 # "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.  See the License for the
 # specific language governing permissions and limitations under the License.
 #
-from typing import Any
+from typing import Any, Mapping
+
+
+def bindingsHash(bindings: Mapping) -> int:
+    # Independent of the order of the bindings, consistent with Context.__eq__
+    return hash(frozenset((key, valueHash(value)) for key, value in bindings.items()))
+
+
+def valueHash(value: Any) -> int:
+    # Lists and dicts are common values, they are hashed by content
+    if isinstance(value, list):
+        return hash(tuple(valueHash(element) for element in value))
+    elif isinstance(value, dict):
+        return bindingsHash(value)
+    else:
+        return hash(value)
 
 
 class Context:
+    __slots__ = ("name", "map")
+
     def __init__(self, name: str = None):
         self.name = name
         self.map = {}
@@ -25,11 +42,12 @@ class Context:
         return self.map
 
     def get(self, name: str, *args) -> Any:
-        o = self.map[name]
+        # None for missing keys
+        o = self.map.get(name)
         if o is not None:
             return o
         for key in args:
-            o = self.map[key]
+            o = self.map.get(key)
             if o is not None:
                 return o
         return None
@@ -54,12 +72,11 @@ class Context:
     def __eq__(self, other) -> bool:
         if self is other:
             return True
-        if other is None or self.__class__ != other.__class__:
+        if not isinstance(other, Context):
             return False
 
-        return self.map == other.map
+        return self.getBindings() == other.getBindings()
 
     def __hash__(self):
-        result = 0
-        result = 31 * result + (0 if self.map is None else hash(self.map))
-        return result
+        # Not cached, the context is mutable
+        return bindingsHash(self.getBindings())
@@ -10,9 +10,45 @@
 # "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.  See the License for the
 # specific language governing permissions and limitations under the License.
 #
+import time
+from typing import Any, Callable, Iterable, Iterator
+
+from jdmn.runtime.BatchStatistics import BatchStatistics
 from jdmn.runtime.ExecutionContext import ExecutionContext
+from jdmn.runtime.annotation.AnnotationSet import AnnotationSet
 
 
 class DMNDecision:
     def applyRequest(self, input_: dict, executionContext_: ExecutionContext):
         raise NotImplementedError()
+
+    def evaluateRequest(self, input_: dict, executionContext_: ExecutionContext) -> Any:
+        # Evaluation of one request in a batch
+        return self.applyRequest(input_, executionContext_)
+
+    def applyRequests(self, inputs: Iterable[dict], executionContext_: ExecutionContext = None, statistics: BatchStatistics = None,
+                      annotationsCallback: Callable[[dict, AnnotationSet], None] = None) -> Iterator[Any]:
+        # Evaluate the inputs one by one and stream back the outputs.
+        # The event listener and the external function executor are shared by all requests,
+        # the cache is cleared and the annotations are reset before each request.
+        # The annotations of each request are passed to annotationsCallback with its input, before the output is yielded.
+        if executionContext_ is None:
+            executionContext_ = ExecutionContext()
+        if statistics is not None:
+            statistics.start()
+        eventListener = executionContext_.eventListener
+        externalFunctionExecutor = executionContext_.externalFunctionExecutor
+        cache = executionContext_.cache
+        for input_ in inputs:
+            cache.clear()
+            annotations = AnnotationSet()
+            requestContext = ExecutionContext(annotations, eventListener, externalFunctionExecutor, cache)
+            if statistics is None:
+                output = self.evaluateRequest(input_, requestContext)
+            else:
+                startTime = time.perf_counter_ns()
+                output = self.evaluateRequest(input_, requestContext)
+                statistics.record((time.perf_counter_ns() - startTime) / 1_000_000)
+            if annotationsCallback is not None:
+                annotationsCallback(input_, annotations)
+            yield output
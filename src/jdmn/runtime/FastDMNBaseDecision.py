@@ -0,0 +1,58 @@
+#
+# Copyright 2016 Goldman Sachs.
+#
+# Licensed under the Apache License, Version 2.0 (the "License") you may not use self file except in compliance with the License.
+#
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations under the License.
+#
+from typing import Any, Dict
+
+from jdmn.feel.lib.FastStandardFEELLib import FastStandardFEELLib
+from jdmn.runtime.DMNDecision import DMNDecision
+from jdmn.runtime.ExecutionContext import ExecutionContext
+
+
+class FastDMNBaseDecision(DMNDecision, FastStandardFEELLib):
+    """
+    Decision that uses the operators of FastStandardFEELLib, which raise on errors.
+
+    evaluateRequest() is the single error boundary: when the evaluation raises, the cache and the annotations are
+    reset and the request is evaluated again by safeDecision(), where failing operators log the error and return null.
+    The output is the same as with DefaultDMNBaseDecision, but the event listener also receives the events of the
+    failed evaluation. Calls to apply() outside applyRequests() have no error boundary.
+    """
+
+    def __init__(self):
+        FastStandardFEELLib.__init__(self)
+        self.safeDecisionCopy = None
+
+    def evaluateRequest(self, input_: dict, executionContext_: ExecutionContext) -> Any:
+        try:
+            return self.applyRequest(input_, executionContext_)
+        except Exception:
+            executionContext_.annotations.clear()
+            executionContext_.cache.clear()
+            return self.safeDecision().applyRequest(input_, executionContext_)
+
+    def safeDecision(self, copies: Dict[int, 'FastDMNBaseDecision'] = None) -> 'FastDMNBaseDecision':
+        # Copy with the BaseFEELLib operators, the fast decisions it references (e.g. required decisions) are copied too.
+        # Built on first use, concurrent requests may build it twice
+        if self.safeDecisionCopy is not None:
+            return self.safeDecisionCopy
+        if copies is None:
+            copies = {}
+        decision = copies.get(id(self))
+        if decision is None:
+            decision = self.safeCopy()
+            decision.safeDecisionCopy = decision
+            copies[id(self)] = decision
+            for name, value in vars(self).items():
+                if isinstance(value, FastDMNBaseDecision):
+                    setattr(decision, name, value.safeDecision(copies))
+            self.safeDecisionCopy = decision
+        return decision
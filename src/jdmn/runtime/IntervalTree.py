@@ -0,0 +1,139 @@
+#
+# Copyright 2016 Goldman Sachs.
+#
+# Licensed under the Apache License, Version 2.0 (the "License") you may not use self file except in compliance with the License.
+#
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations under the License.
+#
+from datetime import date, datetime, time, timedelta
+from decimal import Decimal
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from isodate import Duration
+
+from jdmn.feel.lib.type.time.DefaultCalendarType import DefaultCalendarType
+
+#
+# An interval is a tuple (start, startIncluded, end, endIncluded, value).
+# A None start (end) means the interval is unbounded to the left (right).
+# All the endpoints stored in a tree must be mutually comparable.
+#
+INTERVAL = Tuple[Any, bool, Any, bool, Any]
+
+CALENDAR_TYPE = DefaultCalendarType()
+
+# Types with a total order, mapped to the value used by the FEEL comparators
+INDEX_KEY_MAP: Dict[type, Callable[[Any], Any]] = {
+    Decimal: lambda value: value,
+    str: lambda value: value,
+    date: CALENDAR_TYPE.dateValue,
+    datetime: CALENDAR_TYPE.dateTimeValue,
+    time: CALENDAR_TYPE.timeValue,
+    Duration: CALENDAR_TYPE.durationValue,
+    timedelta: CALENDAR_TYPE.durationValue,
+}
+
+
+def indexKey(value: Any) -> Any:
+    # Endpoint of an interval for a FEEL value
+    keyFunction = INDEX_KEY_MAP.get(type(value))
+    return value if keyFunction is None else keyFunction(value)
+
+
+class IntervalTree:
+    """
+    Static centered interval tree that respects open and closed bounds.
+    Stabbing queries run in O(log n + k).
+    """
+
+    def __init__(self, intervals: List[INTERVAL]):
+        self.size = len(intervals)
+        self.root = self.build(list(intervals))
+
+    def stab(self, point: Any) -> List[Any]:
+        result = []
+        node = self.root
+        while node is not None:
+            for interval in node.overflow:
+                if self.contains(interval, point):
+                    result.append(interval[4])
+            center = node.center
+            if center is None:
+                break
+            if point < center:
+                for interval in node.byStart:
+                    if not self.startsBefore(interval, point):
+                        break
+                    result.append(interval[4])
+            elif center < point:
+                for interval in node.byEnd:
+                    if not self.endsAfter(interval, point):
+                        break
+                    result.append(interval[4])
+            else:
+                result.extend([interval[4] for interval in node.byStart])
+            if point < center:
+                node = node.left
+            elif center < point:
+                node = node.right
+            else:
+                node = None
+        return result
+
+    def build(self, intervals: List[INTERVAL]) -> Optional['IntervalTreeNode']:
+        if len(intervals) == 0:
+            return None
+
+        endpoints = sorted([e for interval in intervals for e in (interval[0], interval[2]) if e is not None])
+        if len(endpoints) == 0:
+            # Unbounded on both sides
+            return IntervalTreeNode(None, [], intervals)
+        center = endpoints[len(endpoints) // 2]
+
+        middle = []
+        left = []
+        right = []
+        for interval in intervals:
+            if self.contains(interval, center):
+                middle.append(interval)
+            elif not self.endsAfter(interval, center):
+                left.append(interval)
+            else:
+                right.append(interval)
+        if len(middle) == 0 and (len(left) == 0 or len(right) == 0):
+            # Open intervals with equal endpoints, no progress possible
+            return IntervalTreeNode(None, [], intervals)
+
+        node = IntervalTreeNode(center, middle, [])
+        node.left = self.build(left)
+        node.right = self.build(right)
+        return node
+
+    @staticmethod
+    def startsBefore(interval: INTERVAL, point: Any) -> bool:
+        start = interval[0]
+        return start is None or start < point or (interval[1] and start == point)
+
+    @staticmethod
+    def endsAfter(interval: INTERVAL, point: Any) -> bool:
+        end = interval[2]
+        return end is None or point < end or (interval[3] and end == point)
+
+    def contains(self, interval: INTERVAL, point: Any) -> bool:
+        return self.startsBefore(interval, point) and self.endsAfter(interval, point)
+
+
+class IntervalTreeNode:
+    def __init__(self, center: Any, intervals: List[INTERVAL], overflow: List[INTERVAL]):
+        self.center = center
+        # Included bounds first for equal endpoints, the matching intervals are always a prefix
+        self.byStart = sorted(intervals, key=lambda i: (0,) if i[0] is None else (1, i[0], 0 if i[1] else 1))
+        self.byEnd = sorted(intervals, key=lambda i: (2,) if i[2] is None else (1, i[2], 1 if i[3] else 0), reverse=True)
+        self.overflow = overflow
+        self.left = None
+        self.right = None
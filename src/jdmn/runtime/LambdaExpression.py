@@ -11,8 +11,20 @@
 # specific language governing permissions and limitations under the License.
 #
 class LambdaExpression:
-    def __init__(self, lambda_):
+    __slots__ = ("lambda_", "key", "descending")
+
+    def __init__(self, lambda_, key=None, descending: bool = False):
         self.lambda_ = lambda_
+        # Sort key when the lambda is 'function(x, y) key(x) < key(y)' (or '>' when descending)
+        self.key = key
+        self.descending = descending
+
+    @staticmethod
+    def fromKey(key, descending: bool = False) -> 'LambdaExpression':
+        if descending:
+            return LambdaExpression(lambda x, y: key(x) > key(y), key, True)
+        else:
+            return LambdaExpression(lambda x, y: key(x) < key(y), key, False)
 
     def apply(self, *args):
         res = self.lambda_(*args)
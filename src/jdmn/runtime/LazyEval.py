@@ -23,6 +23,7 @@ import typing
 
 class LazyEval:
     LOGGER = logging.getLogger(__name__)
+    __slots__ = ("supplier", "isValueSet", "value")
 
     def __init__(self, supplier: typing.Callable):
         self.supplier = supplier
@@ -14,6 +14,8 @@ from typing import Any
 
 
 class Pair:
+    __slots__ = ("left", "right")
+
     def __init__(self, left: Any, right: Any):
         self.left = left
         self.right = right
@@ -0,0 +1,84 @@
+#
+# Copyright 2016 Goldman Sachs.
+#
+# Licensed under the Apache License, Version 2.0 (the "License") you may not use self file except in compliance with the License.
+#
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations under the License.
+#
+import itertools
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, Iterable, Iterator, List, Optional
+
+from jdmn.runtime.DMNDecision import DMNDecision
+from jdmn.runtime.DMNRuntimeException import DMNRuntimeException
+from jdmn.runtime.ExecutionContext import ExecutionContext
+
+# Decision built once in each worker process
+WORKER_STATE = {}
+
+
+def initializeWorker(decisionClass: Callable[[], DMNDecision], executionContextFactory: Optional[Callable[[], ExecutionContext]]) -> None:
+    WORKER_STATE["decision"] = decisionClass()
+    WORKER_STATE["executionContextFactory"] = executionContextFactory
+
+
+def applyChunk(inputs: List[dict]) -> List[Any]:
+    decision = WORKER_STATE["decision"]
+    executionContextFactory = WORKER_STATE["executionContextFactory"]
+    executionContext = None if executionContextFactory is None else executionContextFactory()
+    return list(decision.applyRequests(inputs, executionContext))
+
+
+class ParallelDecisionExecutor:
+    """
+    Evaluates a decision for many inputs across a pool of worker processes.
+
+    Only the decision class, the input dicts and the outputs are pickled. Each worker builds its own
+    decision instance and evaluates the inputs in chunks of chunkSize. Outputs are returned in input order.
+    """
+
+    def __init__(self, decisionClass: Callable[[], DMNDecision], maxWorkers: int = None, chunkSize: int = 100,
+                 executionContextFactory: Callable[[], ExecutionContext] = None, mpContext=None):
+        if chunkSize < 1:
+            raise DMNRuntimeException(f"Chunk size must be positive, found '{chunkSize}'")
+        self.chunkSize = chunkSize
+        self.executor = ProcessPoolExecutor(max_workers=maxWorkers, mp_context=mpContext,
+                                            initializer=initializeWorker, initargs=(decisionClass, executionContextFactory))
+        # Bound the number of chunks in flight to keep memory flat for large input streams
+        self.maxPendingChunks = 2 * (maxWorkers or os.cpu_count() or 1)
+
+    def applyRequests(self, inputs: Iterable[dict]) -> Iterator[Any]:
+        pending = deque()
+        for chunk in self.chunks(inputs):
+            pending.append(self.executor.submit(applyChunk, chunk))
+            if len(pending) >= self.maxPendingChunks:
+                yield from pending.popleft().result()
+        while pending:
+            yield from pending.popleft().result()
+
+    def applyRequest(self, input_: dict) -> Any:
+        return self.executor.submit(applyChunk, [input_]).result()[0]
+
+    def chunks(self, inputs: Iterable[dict]) -> Iterator[List[dict]]:
+        iterator = iter(inputs)
+        while True:
+            chunk = list(itertools.islice(iterator, self.chunkSize))
+            if not chunk:
+                return
+            yield chunk
+
+    def shutdown(self, wait: bool = True) -> None:
+        self.executor.shutdown(wait=wait)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, excType, excValue, traceback):
+        self.shutdown()
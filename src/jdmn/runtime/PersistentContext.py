@@ -0,0 +1,145 @@
+#
+# Copyright 2016 Goldman Sachs.
+#
+# Licensed under the Apache License, Version 2.0 (the "License") you may not use self file except in compliance with the License.
+#
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations under the License.
+#
+from types import MappingProxyType
+from typing import Any, Mapping, Optional
+
+from jdmn.runtime.Context import Context, bindingsHash
+from jdmn.runtime.DMNRuntimeException import DMNRuntimeException
+
+# Deeper chains are flattened, lookups walk at most MAX_DEPTH + 1 overlays
+MAX_DEPTH = 8
+# Values that can change after they are bound, see __hash__
+MUTABLE_TYPES = (list, dict, Context)
+
+
+class PersistentContext(Context):
+    """
+    Immutable context with structural sharing: plus() and extend() return a new context that stores only the new
+    bindings and chains to this one, so enriching a context while passing it down a DRG does not copy it.
+    The hash is computed once, persistent contexts can be used as cache keys. Values are not copied: when a value is a
+    list, a dict or a mutable context, directly or inside a nested persistent context or tuple, the hash is recomputed
+    every time instead.
+    """
+    __slots__ = ("parent", "depth", "flat", "hashCode")
+
+    def __init__(self, bindings: Mapping = None, name: str = None, parent: Optional['PersistentContext'] = None):
+        self.name = name
+        # Own overlay, shadows the bindings of the parents
+        self.map = {} if bindings is None else dict(bindings)
+        self.parent = parent
+        self.depth = 0 if parent is None else parent.depth + 1
+        self.flat = self.map if parent is None else None
+        self.hashCode = None
+
+    @staticmethod
+    def of(context: Any) -> 'PersistentContext':
+        if isinstance(context, PersistentContext):
+            return context
+        elif isinstance(context, Context):
+            return PersistentContext(context.getBindings(), context.getName())
+        else:
+            return PersistentContext(context)
+
+    def plus(self, key: Any, value: Any) -> 'PersistentContext':
+        if self.depth >= MAX_DEPTH:
+            return self.extend({key: value})
+        context = PersistentContext.__new__(PersistentContext)
+        context.name = self.name
+        context.map = {key: value}
+        context.parent = self
+        context.depth = self.depth + 1
+        context.flat = None
+        context.hashCode = None
+        return context
+
+    def extend(self, bindings: Mapping) -> 'PersistentContext':
+        if self.depth >= MAX_DEPTH:
+            merged = dict(self.getBindings())
+            merged.update(bindings)
+            return PersistentContext(merged, self.name)
+        return PersistentContext(bindings, self.name, self)
+
+    def get(self, name: str, *args) -> Any:
+        o = self.lookup(name)
+        if o is not None:
+            return o
+        for key in args:
+            o = self.lookup(key)
+            if o is not None:
+                return o
+        return None
+
+    def lookup(self, key: Any) -> Any:
+        if self.flat is not None:
+            return self.flat.get(key)
+        context = self
+        while context is not None:
+            bindings = context.map
+            if key in bindings:
+                return bindings[key]
+            context = context.parent
+        return None
+
+    def getBindings(self) -> Mapping:
+        # Read-only view, flattened once
+        if self.flat is None:
+            flat = dict(self.parent.getBindings())
+            flat.update(self.map)
+            self.flat = flat
+        return MappingProxyType(self.flat)
+
+    def put(self, key: Any, value: Any) -> Any:
+        raise DMNRuntimeException("PersistentContext is immutable, use plus() or extend()")
+
+    def keySet(self):
+        return self.getBindings().keys()
+
+    def __str__(self):
+        return str(dict(self.getBindings()))
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, PersistentContext) and self.hashCode is not None and other.hashCode is not None and self.hashCode != other.hashCode:
+            return False
+        return Context.__eq__(self, other)
+
+    def __hash__(self):
+        if self.hashCode is not None:
+            return self.hashCode
+        bindings = self.getBindings()
+        hashCode = bindingsHash(bindings)
+        if all(self.isHashFinal(value) for value in bindings.values()):
+            self.hashCode = hashCode
+        return hashCode
+
+    @staticmethod
+    def isHashFinal(value: Any) -> bool:
+        # Called after hashing the value: a nested persistent context cached its hash only if it cannot change
+        if isinstance(value, PersistentContext):
+            return value.hashCode is not None
+        elif isinstance(value, MUTABLE_TYPES):
+            return False
+        elif isinstance(value, (tuple, frozenset)):
+            return all(PersistentContext.isHashFinal(element) for element in value)
+        else:
+            return True
+
+    def __getstate__(self):
+        # Pickled flat and without the cached hash, which is not valid in another process
+        return self.name, dict(self.getBindings())
+
+    def __setstate__(self, state):
+        self.name, self.map = state
+        self.parent = None
+        self.depth = 0
+        self.flat = self.map
+        self.hashCode = None
@@ -13,16 +13,40 @@
 import datetime
 import decimal
 import typing
-from typing import Any
+from typing import Any, Dict
 
 import isodate
 from jdmn.runtime.DMNRuntimeException import DMNRuntimeException
 
 comparable = typing.Optional[typing.Union[decimal.Decimal, str, datetime.date, datetime.time, datetime.datetime, datetime.timedelta, isodate.Duration]]
+# Same types as comparable, isinstance() is much faster with a tuple than with a typing.Union
+COMPARABLE_TYPES = (decimal.Decimal, str, datetime.date, datetime.time, datetime.datetime, datetime.timedelta, isodate.Duration, type(None))
+
+# Ranges shared by Range.of(), bounded so that ranges built from data cannot grow it forever
+INTERN_TABLE_SIZE = 4096
+INTERNED_RANGES: Dict[tuple, 'Range'] = {}
+
+
+def endpointKey(value: Any) -> Any:
+    # Equal only for identical endpoints: Decimal('1') == Decimal('1.0'), datetimes with different offsets can be equal
+    # and Duration(years=1) == Duration(months=12). str() is the exact representation of a Decimal, like as_tuple() but faster;
+    # the other keys are tuples, so it cannot be equal to the key of a string endpoint
+    valueType = type(value)
+    if valueType is decimal.Decimal:
+        return str(value)
+    elif valueType is datetime.datetime or valueType is datetime.time:
+        return valueType, value, value.utcoffset(), value.tzinfo
+    elif valueType is isodate.Duration:
+        return valueType, value.years, value.months, value.tdelta
+    else:
+        return valueType, value
 
 
 class Range:
+    __slots__ = ("startIncluded", "start", "endIncluded", "end", "operator", "hashCode")
+
     def __init__(self, *args):
+        self.hashCode = None
         if len(args) == 0:
             self.startIncluded = False
             self.start = None
@@ -36,7 +60,7 @@ class Range:
             self.end = args[3]
             self.operator = None
             # Check if both ends are comparable types
-            if not isinstance(self.start, comparable) or not isinstance(self.end, comparable):
+            if not isinstance(self.start, COMPARABLE_TYPES) or not isinstance(self.end, COMPARABLE_TYPES):
                 raise DMNRuntimeException("Invalid range: start type {} and type {} must be comparable.".format(type(self.start), type(self.end)))
             if self.start is not None and self.end is not None:
                 # Check if endpoints have same type
@@ -86,11 +110,34 @@ class Range:
                     self.endIncluded = False
                 case _:
                     raise DMNRuntimeException("Illegal operator '{}'".format(self.operator))
-            if not isinstance(self.start, comparable):
+            if not isinstance(self.start, COMPARABLE_TYPES):
                 raise DMNRuntimeException("Invalid range: endpoint most be comparable {}.".format(type(endpoint)))
         else:
             raise DMNRuntimeException("Illegal Range constructor '{}'".format(*args))
 
+    @staticmethod
+    def of(*args) -> 'Range':
+        # Same arguments as the constructor. Constant tests (e.g. '> 10' or '[1..5]') are validated once and then
+        # share one instance, which must not be modified. Building the key allocates and costs more than the constructor,
+        # so call it once where the test is defined, e.g. a module-level constant of the generated decision, and not
+        # per evaluation: reading the constant allocates nothing.
+        try:
+            if len(args) == 2:
+                key = (args[0], endpointKey(args[1]))
+            elif len(args) == 4:
+                key = (args[0], endpointKey(args[1]), args[2], endpointKey(args[3]))
+            else:
+                return Range(*args)
+            range_ = INTERNED_RANGES.get(key)
+        except TypeError:
+            # Unhashable argument, the constructor reports it
+            return Range(*args)
+        if range_ is None:
+            range_ = Range(*args)
+            if len(INTERNED_RANGES) < INTERN_TABLE_SIZE:
+                range_ = INTERNED_RANGES.setdefault(key, range_)
+        return range_
+
     def isStartIncluded(self) -> bool:
         return self.startIncluded
 
@@ -125,13 +172,25 @@ class Range:
         return True
 
     def __hash__(self):
+        # Ranges are not modified after construction
+        if self.hashCode is not None:
+            return self.hashCode
         result = 0
         result = 31 * result + (0 if self.startIncluded is None else hash(self.startIncluded))
         result = 31 * result + (0 if self.start is None else hash(self.start))
         result = 31 * result + (0 if self.endIncluded is None else hash(self.endIncluded))
         result = 31 * result + (0 if self.end is None else hash(self.end))
         result = 31 * result + (0 if self.operator is None else hash(self.operator))
+        self.hashCode = result
         return result
 
+    def __getstate__(self):
+        # The cached hash is not valid in another process
+        return self.startIncluded, self.start, self.endIncluded, self.end, self.operator
+
+    def __setstate__(self, state):
+        self.startIncluded, self.start, self.endIncluded, self.end, self.operator = state
+        self.hashCode = None
+
     def __str__(self):
         return "Range({},{},{},{},{})".format(self.startIncluded, self.start, self.end, self.endIncluded, self.operator)
@@ -14,6 +14,8 @@ from typing import List
 
 
 class RuleOutput:
+    __slots__ = ("matched",)
+
     def __init__(self, matched: bool):
         self.matched = matched
 
@@ -15,11 +15,13 @@ import typing
 
 class Annotation:
     # Index starts from 1
+    __slots__ = ("decisionName", "ruleIndex", "annotation", "hashCode")
 
     def __init__(self, decisionName: str, ruleIndex: int, annotation: str):
         self.decisionName = decisionName
         self.ruleIndex = ruleIndex
         self.annotation = annotation
+        self.hashCode = None
 
     def __eq__(self, other: typing.Any) -> bool:
         if self is other:
@@ -37,11 +39,23 @@ class Annotation:
         return True
 
     def __hash__(self):
+        # Annotations are not modified after construction
+        if self.hashCode is not None:
+            return self.hashCode
         result = 0
         result = 31 * result + (0 if self.decisionName is None else hash(self.decisionName))
         result = 31 * result + (0 if self.ruleIndex is None else hash(self.ruleIndex))
         result = 31 * result + (0 if self.annotation is None else hash(self.annotation))
+        self.hashCode = result
         return result
 
+    def __getstate__(self):
+        # The cached hash is not valid in another process
+        return self.decisionName, self.ruleIndex, self.annotation
+
+    def __setstate__(self, state):
+        self.decisionName, self.ruleIndex, self.annotation = state
+        self.hashCode = None
+
     def __str__(self) -> str:
         return f"Annotation('{self.decisionName}', {self.ruleIndex}, '{self.annotation}')"
@@ -0,0 +1,107 @@
+#
+# Copyright 2016 Goldman Sachs.
+#
+# Licensed under the Apache License, Version 2.0 (the "License") you may not use self file except in compliance with the License.
+#
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations under the License.
+#
+import copy
+import functools
+from typing import Any, Callable, Dict
+
+from jdmn.runtime.DMNDecision import DMNDecision
+from jdmn.runtime.Context import Context
+from jdmn.runtime.ExecutionContext import ExecutionContext
+from jdmn.runtime.PersistentContext import PersistentContext
+from jdmn.runtime.cache.Fingerprint import fingerprint
+from jdmn.runtime.cache.LRUCache import LRUCache
+from jdmn.runtime.listener.DRGElement import DRGElement
+
+# Element name -> memoization, for statistics
+MEMOIZED_ELEMENTS: Dict[str, 'Memoized'] = {}
+
+
+def copyOutput(value: Any) -> Any:
+    # Lists, dicts and contexts are copied by content, other values are immutable
+    if isinstance(value, list):
+        return [copyOutput(element) for element in value]
+    elif isinstance(value, dict):
+        return {key: copyOutput(element) for key, element in value.items()}
+    elif isinstance(value, PersistentContext):
+        # Immutable, but its values can be lists or mutable contexts
+        bindings = value.getBindings()
+        copies = {key: copyOutput(element) for key, element in bindings.items()}
+        if all(copies[key] is element for key, element in bindings.items()):
+            return value
+        return PersistentContext(copies, value.getName())
+    elif isinstance(value, Context):
+        context = copy.copy(value)
+        context.map = copyOutput(value.map)
+        return context
+    else:
+        return value
+
+
+class Memoized:
+    """
+    Opt-in memoization of a DRG element, decorates the apply method of the element:
+
+        @Memoized(DRG_ELEMENT_METADATA, maxEntries=1000)
+        def apply(self, applicant, context_: ExecutionContext):
+
+    The outputs are cached in a bounded LRU cache keyed by a fingerprint of the arguments. The decision and the
+    execution context are not part of the key, and a hit does not send events to the listener or add annotations,
+    so only pure elements should be memoized. Calls with arguments that cannot be fingerprinted are not cached.
+    Lists, dicts and contexts in the outputs are copied when cached and on every hit, so callers can modify them.
+    Fingerprinting large contexts costs microseconds, cheap elements are faster without memoization.
+    """
+
+    def __init__(self, element: DRGElement = None, maxEntries: int = 1000, ttl: float = None):
+        self.element = element
+        self.cache = LRUCache(maxEntries, ttl=ttl)
+        self.skips = 0
+
+    def __call__(self, function: Callable) -> Callable:
+        cache = self.cache
+        excludedTypes = (DMNDecision, ExecutionContext)
+
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs) -> Any:
+            try:
+                key = (tuple([fingerprint(arg) for arg in args if not isinstance(arg, excludedTypes)]),
+                       frozenset([(name, fingerprint(arg)) for name, arg in kwargs.items() if not isinstance(arg, excludedTypes)]))
+            except TypeError:
+                with cache.lock:
+                    self.skips += 1
+                return function(*args, **kwargs)
+
+            try:
+                return copyOutput(cache.lookup(key))
+            except KeyError:
+                pass
+            output = function(*args, **kwargs)
+            cache.bind(key, copyOutput(output))
+            return output
+
+        wrapper.memoized = self
+        name = function.__qualname__ if self.element is None else self.element.name
+        MEMOIZED_ELEMENTS[name] = self
+        return wrapper
+
+    def statistics(self) -> Dict[str, int]:
+        with self.cache.lock:
+            statistics = self.cache.statistics()
+            statistics["skips"] = self.skips
+        return statistics
+
+    def clear(self) -> None:
+        self.cache.clear()
+
+    @staticmethod
+    def elementStatistics() -> Dict[str, Dict[str, int]]:
+        return {name: memoized.statistics() for name, memoized in MEMOIZED_ELEMENTS.items()}
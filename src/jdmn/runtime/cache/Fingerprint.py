@@ -0,0 +1,56 @@
+#
+# Copyright 2016 Goldman Sachs.
+#
+# Licensed under the Apache License, Version 2.0 (the "License") you may not use self file except in compliance with the License.
+#
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations under the License.
+#
+import datetime
+import decimal
+from typing import Any, Hashable
+
+import isodate
+
+from jdmn.runtime.Context import Context
+from jdmn.runtime.Range import Range, endpointKey
+
+# Immutable FEEL values, used as they are
+SCALAR_TYPES = {bool, datetime.date, datetime.timedelta}
+# Immutable FEEL values that are equal to values with another representation (e.g. Decimal('1') and Decimal('1.00'))
+EXACT_TYPES = {decimal.Decimal, datetime.datetime, datetime.time, isodate.Duration}
+
+
+def fingerprint(value: Any) -> Hashable:
+    # Hashable key, equal only for identical FEEL values of the same type: an element can return different outputs
+    # for equal values (e.g. string(1) and string(1.00)). Lists, dicts and contexts are fingerprinted by content,
+    # other unhashable values raise TypeError
+    valueType = type(value)
+    if valueType in SCALAR_TYPES:
+        # The type separates True from Decimal(1)
+        return valueType, value
+    elif valueType in EXACT_TYPES:
+        return valueType, endpointKey(value)
+    elif valueType is Range:
+        return Range, value.startIncluded, fingerprint(value.start), value.endIncluded, fingerprint(value.end), value.operator
+    elif value is None or valueType is str:
+        return value
+    elif isinstance(value, list):
+        # The concrete type separates e.g. subclasses with the same content
+        return valueType, tuple([fingerprint(element) for element in value])
+    elif isinstance(value, Context):
+        # By content, never by the cached hash of a persistent context
+        return valueType, bindingsFingerprint(value.getBindings())
+    elif isinstance(value, dict):
+        return valueType, bindingsFingerprint(value)
+    else:
+        hash(value)
+        return valueType, value
+
+
+def bindingsFingerprint(bindings: dict) -> Hashable:
+    return frozenset([(key, fingerprint(value)) for key, value in bindings.items()])
@@ -0,0 +1,132 @@
+#
+# Copyright 2016 Goldman Sachs.
+#
+# Licensed under the Apache License, Version 2.0 (the "License") you may not use self file except in compliance with the License.
+#
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations under the License.
+#
+import logging
+import sys
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict
+
+from jdmn.runtime.DMNRuntimeException import DMNRuntimeException
+from jdmn.runtime.cache.Cache import Cache
+
+
+class LRUCache(Cache):
+    """
+    Thread-safe cache bounded by number of entries and by memory, with optional time to live.
+
+    The least recently used entries are evicted first. A miss is counted by contains() or lookup(),
+    a hit by lookup(), so the usual contains() / lookup() sequence is counted once. Expired entries are removed
+    when they are accessed and counted as expirations, not as evictions.
+
+    As in DefaultCache, lookup() raises KeyError for a missing key; a null value is a valid binding. An entry can
+    expire or be evicted by another thread between contains() and lookup(), callers that share the cache or use a
+    time to live should call lookup() and catch KeyError.
+
+    The memory bound uses sizeOf() for each key and value. The default, sys.getsizeof(), is shallow: the elements
+    of lists, dicts and contexts are not counted, pass a deep size function to bound nested values.
+    """
+
+    LOGGER = logging.getLogger(__name__)
+
+    def __init__(self, maxEntries: int = 1000, maxMemory: int = None, ttl: float = None,
+                 sizeOf: Callable[[Any], int] = sys.getsizeof, clock: Callable[[], float] = time.monotonic):
+        if maxEntries is not None and maxEntries < 1:
+            raise DMNRuntimeException(f"Max entries must be positive, found '{maxEntries}'")
+        if maxMemory is not None and maxMemory < 1:
+            raise DMNRuntimeException(f"Max memory must be positive, found '{maxMemory}'")
+        if ttl is not None and ttl <= 0:
+            raise DMNRuntimeException(f"TTL must be positive, found '{ttl}'")
+        self.maxEntries = maxEntries
+        self.maxMemory = maxMemory
+        self.ttl = ttl
+        self.sizeOf = sizeOf
+        self.clock = clock
+        # key -> (value, size, expiry time)
+        self.bindings: OrderedDict = OrderedDict()
+        self.memory = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.lock = threading.RLock()
+
+    def contains(self, key: str) -> bool:
+        with self.lock:
+            if self.getEntry(key) is None:
+                self.misses += 1
+                return False
+            return True
+
+    def bind(self, key: str, value: Any) -> None:
+        size = self.sizeOf(key) + self.sizeOf(value) if self.maxMemory is not None else 0
+        expiry = None if self.ttl is None else self.clock() + self.ttl
+        with self.lock:
+            self.remove(key)
+            if self.maxMemory is not None and size > self.maxMemory:
+                self.LOGGER.debug("Skip binding '%s', size %s exceeds max memory", key, size)
+                return
+            self.bindings[key] = (value, size, expiry)
+            self.memory += size
+            self.evict()
+
+    def lookup(self, key: str) -> Any:
+        with self.lock:
+            entry = self.getEntry(key)
+            if entry is None:
+                self.misses += 1
+                raise KeyError(key)
+            self.hits += 1
+            self.bindings.move_to_end(key)
+            return entry[0]
+
+    def clear(self) -> None:
+        with self.lock:
+            self.bindings.clear()
+            self.memory = 0
+
+    def size(self) -> int:
+        with self.lock:
+            return len(self.bindings)
+
+    def statistics(self) -> Dict[str, int]:
+        with self.lock:
+            return {
+                "entries": len(self.bindings),
+                "memory": self.memory,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "expirations": self.expirations
+            }
+
+    def getEntry(self, key: str):
+        entry = self.bindings.get(key)
+        if entry is not None and entry[2] is not None and entry[2] <= self.clock():
+            self.remove(key)
+            self.expirations += 1
+            return None
+        return entry
+
+    def remove(self, key: str) -> None:
+        entry = self.bindings.pop(key, None)
+        if entry is not None:
+            self.memory -= entry[1]
+
+    def evict(self) -> None:
+        while self.bindings and (
+                (self.maxEntries is not None and len(self.bindings) > self.maxEntries)
+                or (self.maxMemory is not None and self.memory > self.maxMemory)):
+            key, (_, size, _) = self.bindings.popitem(last=False)
+            self.memory -= size
+            self.evictions += 1
@@ -0,0 +1,63 @@
+#
+# Copyright 2016 Goldman Sachs.
+#
+# Licensed under the Apache License, Version 2.0 (the "License") you may not use self file except in compliance with the License.
+#
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations under the License.
+#
+import asyncio
+import inspect
+from typing import Any, Callable, Dict, List, Tuple
+
+from jdmn.runtime.DMNRuntimeException import DMNRuntimeException
+from jdmn.runtime.external.ExternalFunctionExecutor import ExternalFunctionExecutor
+
+
+class AsyncExternalFunctionExecutor(ExternalFunctionExecutor):
+    """
+    Executes external functions registered by class name and method name, plain or coroutine functions.
+
+    Decisions call execute() synchronously. When a loop is given, coroutines are scheduled on it and the calling
+    worker thread waits for the result, so they can use clients bound to the loop of the application.
+    Without a loop, coroutines run to completion in the calling thread (e.g. in worker processes).
+    """
+
+    def __init__(self, loop: asyncio.AbstractEventLoop = None, timeout: float = None):
+        self.loop = loop
+        self.timeout = timeout
+        self.functions: Dict[Tuple[str, str], Callable] = {}
+
+    def register(self, className: str, methodName: str, function: Callable) -> 'AsyncExternalFunctionExecutor':
+        self.functions[(className, methodName)] = function
+        return self
+
+    def execute(self, className: str, methodName: str, args: List[Any]) -> Any:
+        function = self.functions.get((className, methodName))
+        if function is None:
+            raise DMNRuntimeException(f"Cannot find external function '{className}.{methodName}'")
+
+        result = function(*args)
+        if not inspect.isawaitable(result):
+            return result
+        if self.loop is None:
+            return asyncio.run(self.awaitResult(result))
+        if self.isLoopThread():
+            if inspect.iscoroutine(result):
+                result.close()
+            raise DMNRuntimeException(f"Cannot wait for '{className}.{methodName}' on the thread of its event loop, evaluate the decision in a worker thread")
+        return asyncio.run_coroutine_threadsafe(self.awaitResult(result), self.loop).result(self.timeout)
+
+    def isLoopThread(self) -> bool:
+        try:
+            return asyncio.get_running_loop() is self.loop
+        except RuntimeError:
+            return False
+
+    @staticmethod
+    async def awaitResult(awaitable) -> Any:
+        return await awaitable
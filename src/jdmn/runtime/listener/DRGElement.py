@@ -15,6 +15,8 @@ from jdmn.runtime.annotation.HitPolicy import HitPolicy
 
 
 class DRGElement:
+    __slots__ = ("namespace", "name", "label", "elementKind", "expressionKind", "hitPolicy", "rulesCount")
+
     def __init__(self, namespace: str, name: str, label: str, elementKind: DRGElementKind, expressionKind: ExpressionKind, hitPolicy: HitPolicy, rulesCount: int):
         self.namespace = namespace
         self.name = name
@@ -18,6 +18,10 @@ from jdmn.runtime.listener.Rule import Rule
 
 
 class EventListener:
+    # True when all the callbacks are no-ops, so callers can skip building the event arguments
+    def isNop(self) -> bool:
+        return False
+
     def startDRGElement(self, element: DRGElement, arguments: Arguments) -> None:
         raise NotImplementedError()
 
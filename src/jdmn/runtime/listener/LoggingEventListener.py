@@ -10,6 +10,7 @@
 # "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.  See the License for the
 # specific language governing permissions and limitations under the License.
 #
+import logging
 from typing import Any
 
 from jdmn.runtime.listener.Arguments import Arguments
@@ -22,6 +23,10 @@ class LoggingEventListener(EventListener):
     def __init__(self, logger):
         self.logger = logger
 
+    def isNop(self) -> bool:
+        # All the events are logged at INFO or DEBUG level
+        return not self.logger.isEnabledFor(logging.INFO)
+
     def startDRGElement(self, element: DRGElement, arguments: Arguments) -> None:
         self.logger.info("Start %s '%s' with inputs '%s'", element.elementKind.displayName, element.name, arguments)
 
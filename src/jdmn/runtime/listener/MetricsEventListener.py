@@ -0,0 +1,222 @@
+#
+# Copyright 2016 Goldman Sachs.
+#
+# Licensed under the Apache License, Version 2.0 (the "License") you may not use self file except in compliance with the License.
+#
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations under the License.
+#
+import bisect
+import os
+import threading
+import weakref
+from typing import Any, Dict, List, Optional, Tuple
+
+from jdmn.runtime.listener.Arguments import Arguments
+from jdmn.runtime.listener.DRGElement import DRGElement
+from jdmn.runtime.listener.EventListener import EventListener
+from jdmn.runtime.listener.Rule import Rule
+
+# Elements with the same name can be defined in different models
+ElementKey = Tuple[str, str]
+NO_ELEMENT: ElementKey = ("", "")
+
+
+class ThreadMetrics:
+    # Metrics recorded by one thread. The lock is not contended while the owning thread records,
+    # snapshot() and reset() take it to read or clear the metrics without losing concurrent updates
+    def __init__(self, bucketCount: int, thread: Optional[threading.Thread] = None):
+        self.bucketCount = bucketCount
+        self.thread = None if thread is None else weakref.ref(thread)
+        self.lock = threading.Lock()
+        self.calls: Dict[ElementKey, int] = {}
+        self.durationSums: Dict[ElementKey, float] = {}
+        self.histograms: Dict[ElementKey, List[int]] = {}
+        self.ruleHits: Dict[Tuple[str, str, int], int] = {}
+        self.columnFailures: Dict[Tuple[str, str, int, int], int] = {}
+        self.currentElement = None
+
+    def isAlive(self) -> bool:
+        thread = None if self.thread is None else self.thread()
+        return thread is not None and thread.is_alive()
+
+    def clear(self) -> None:
+        self.calls = {}
+        self.durationSums = {}
+        self.histograms = {}
+        self.ruleHits = {}
+        self.columnFailures = {}
+
+    def addTo(self, other: 'ThreadMetrics') -> None:
+        for key, count in self.calls.items():
+            other.calls[key] = other.calls.get(key, 0) + count
+        for key, duration in self.durationSums.items():
+            other.durationSums[key] = other.durationSums.get(key, 0) + duration
+        for key, histogram in self.histograms.items():
+            total = other.histograms.setdefault(key, [0] * other.bucketCount)
+            for i, bucketCount in enumerate(histogram):
+                total[i] += bucketCount
+        for key, count in self.ruleHits.items():
+            other.ruleHits[key] = other.ruleHits.get(key, 0) + count
+        for key, count in self.columnFailures.items():
+            other.columnFailures[key] = other.columnFailures.get(key, 0) + count
+
+
+class MetricsEventListener(EventListener):
+    """
+    Event listener that aggregates per DRG element call counts, latency histograms,
+    rule hit counts and column failure counts.
+
+    Elements are identified by (namespace, name). Each thread records into its own ThreadMetrics,
+    snapshot() merges them. The metrics of threads that have exited are merged into one total
+    and released. Durations are in milliseconds, as passed to endDRGElement.
+    """
+
+    DEFAULT_BUCKETS = (1, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+
+    def __init__(self, buckets: Tuple[float, ...] = DEFAULT_BUCKETS, prefix: str = "jdmn"):
+        self.buckets = tuple(sorted(buckets))
+        self.prefix = prefix
+        self.local = threading.local()
+        self.threadMetrics: List[ThreadMetrics] = []
+        # Metrics of the threads that have exited
+        self.exitedMetrics = ThreadMetrics(len(self.buckets) + 1)
+        self.lock = threading.Lock()
+
+    def isNop(self) -> bool:
+        return False
+
+    def startDRGElement(self, element: DRGElement, arguments: Arguments) -> None:
+        pass  # nothing to do
+
+    def endDRGElement(self, element: DRGElement, arguments: Arguments, output: Any, duration: int) -> None:
+        metrics = self.getThreadMetrics()
+        key = (element.namespace, element.name)
+        # Last bucket is +Inf
+        bucket = bisect.bisect_left(self.buckets, duration)
+        with metrics.lock:
+            metrics.calls[key] = metrics.calls.get(key, 0) + 1
+            metrics.durationSums[key] = metrics.durationSums.get(key, 0) + duration
+            histogram = metrics.histograms.get(key)
+            if histogram is None:
+                histogram = [0] * metrics.bucketCount
+                metrics.histograms[key] = histogram
+            histogram[bucket] += 1
+
+    def startRule(self, element: DRGElement, rule: Rule) -> None:
+        # matchColumn has no element, remember the one of the current rule
+        self.getThreadMetrics().currentElement = element
+
+    def matchRule(self, element: DRGElement, rule: Rule) -> None:
+        metrics = self.getThreadMetrics()
+        key = (element.namespace, element.name, rule.index)
+        with metrics.lock:
+            metrics.ruleHits[key] = metrics.ruleHits.get(key, 0) + 1
+
+    def endRule(self, element: DRGElement, rule: Rule, result: Any) -> None:
+        pass  # nothing to do
+
+    def matchColumn(self, rule: Rule, columnIndex: int, result: Any) -> None:
+        if result is None or result is False:
+            metrics = self.getThreadMetrics()
+            element = metrics.currentElement
+            key = (*(NO_ELEMENT if element is None else (element.namespace, element.name)), rule.index, columnIndex)
+            with metrics.lock:
+                metrics.columnFailures[key] = metrics.columnFailures.get(key, 0) + 1
+
+    def getThreadMetrics(self) -> ThreadMetrics:
+        metrics = getattr(self.local, "metrics", None)
+        if metrics is None:
+            metrics = ThreadMetrics(len(self.buckets) + 1, threading.current_thread())
+            self.local.metrics = metrics
+            with self.lock:
+                self.releaseExitedThreads()
+                self.threadMetrics.append(metrics)
+        return metrics
+
+    def releaseExitedThreads(self) -> None:
+        # Called with self.lock held
+        alive = []
+        for metrics in self.threadMetrics:
+            if metrics.isAlive():
+                alive.append(metrics)
+            else:
+                with metrics.lock:
+                    metrics.addTo(self.exitedMetrics)
+        self.threadMetrics = alive
+
+    def reset(self) -> None:
+        with self.lock:
+            self.releaseExitedThreads()
+            self.exitedMetrics.clear()
+            for metrics in self.threadMetrics:
+                with metrics.lock:
+                    metrics.clear()
+
+    #
+    # Export
+    #
+    def snapshot(self) -> Dict[str, Any]:
+        total = ThreadMetrics(len(self.buckets) + 1)
+        with self.lock:
+            self.releaseExitedThreads()
+            self.exitedMetrics.addTo(total)
+            for metrics in self.threadMetrics:
+                with metrics.lock:
+                    metrics.addTo(total)
+        elements = {
+            key: {"count": count, "sum": total.durationSums.get(key, 0), "buckets": total.histograms.get(key, [0] * total.bucketCount)}
+            for key, count in total.calls.items()
+        }
+        return {
+            "buckets": list(self.buckets),
+            "elements": elements,
+            "ruleHits": total.ruleHits,
+            "columnFailures": total.columnFailures
+        }
+
+    def toPrometheus(self) -> str:
+        snapshot = self.snapshot()
+        prefix = self.prefix
+        lines = []
+
+        lines.append(f"# HELP {prefix}_drg_element_duration_ms Duration of DRG element evaluations in milliseconds.")
+        lines.append(f"# TYPE {prefix}_drg_element_duration_ms histogram")
+        for (namespace, name), entry in sorted(snapshot["elements"].items()):
+            label = self.elementLabels(namespace, name)
+            cumulative = 0
+            for bound, bucketCount in zip(list(self.buckets) + ["+Inf"], entry["buckets"]):
+                cumulative += bucketCount
+                lines.append(f'{prefix}_drg_element_duration_ms_bucket{{{label},le="{bound}"}} {cumulative}')
+            lines.append(f"{prefix}_drg_element_duration_ms_sum{{{label}}} {entry['sum']}")
+            lines.append(f"{prefix}_drg_element_duration_ms_count{{{label}}} {entry['count']}")
+
+        lines.append(f"# HELP {prefix}_rule_hits_total Number of times a decision table rule matched.")
+        lines.append(f"# TYPE {prefix}_rule_hits_total counter")
+        for (namespace, name, ruleIndex), count in sorted(snapshot["ruleHits"].items()):
+            lines.append(f'{prefix}_rule_hits_total{{{self.elementLabels(namespace, name)},rule="{ruleIndex}"}} {count}')
+
+        lines.append(f"# HELP {prefix}_column_failures_total Number of times a decision table input entry did not match.")
+        lines.append(f"# TYPE {prefix}_column_failures_total counter")
+        for (namespace, name, ruleIndex, columnIndex), count in sorted(snapshot["columnFailures"].items()):
+            lines.append(f'{prefix}_column_failures_total{{{self.elementLabels(namespace, name)},rule="{ruleIndex}",column="{columnIndex}"}} {count}')
+
+        return "\n".join(lines) + "\n"
+
+    def writePrometheus(self, path: str) -> None:
+        # Write and rename, so that scrapers never see a partial file
+        temporaryPath = f"{path}.{os.getpid()}.tmp"
+        with open(temporaryPath, "w", encoding="utf-8") as file:
+            file.write(self.toPrometheus())
+        os.replace(temporaryPath, path)
+
+    def elementLabels(self, namespace: str, name: str) -> str:
+        return f'namespace="{self.escape(namespace)}",element="{self.escape(name)}"'
+
+    @staticmethod
+    def escape(value: str) -> str:
+        return str(value).replace("\\", "\\\\").replace("\"", "\\\"").replace("\n", "\\n")
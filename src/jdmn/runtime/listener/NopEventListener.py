@@ -10,18 +10,32 @@
 # "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.  See the License for the
 # specific language governing permissions and limitations under the License.
 #
-from typing import Any
+from typing import Any, Dict
 
 from jdmn.runtime.listener.EventListener import EventListener
 from jdmn.runtime.listener.Arguments import Arguments
 from jdmn.runtime.listener.DRGElement import DRGElement
 from jdmn.runtime.listener.Rule import Rule
 
+EVENT_METHODS = ("startDRGElement", "endDRGElement", "startRule", "matchRule", "endRule", "matchColumn")
+
+# Listener class -> True when it overrides none of the event methods
+NOP_CLASSES: Dict[type, bool] = {}
+
 
 class NopEventListener(EventListener):
     def __init__(self):
         EventListener.__init__(self)
 
+    def isNop(self) -> bool:
+        # Subclasses that override an event method are sent all events
+        listenerClass = type(self)
+        nop = NOP_CLASSES.get(listenerClass)
+        if nop is None:
+            nop = all(getattr(listenerClass, name) is getattr(NopEventListener, name) for name in EVENT_METHODS)
+            NOP_CLASSES[listenerClass] = nop
+        return nop
+
     def startDRGElement(self, element: DRGElement, arguments: Arguments) -> None:
         pass  # nothing to do
 
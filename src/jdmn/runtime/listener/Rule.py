@@ -12,6 +12,7 @@
 #
 class Rule:
     # Rule index starts from 1
+    __slots__ = ("index", "annotation")
 
     def __init__(self, index: int, annotation: str):
         self.index = index + 1
@@ -0,0 +1,111 @@
+#
+# Copyright 2016 Goldman Sachs.
+#
+# Licensed under the Apache License, Version 2.0 (the "License") you may not use self file except in compliance with the License.
+#
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations under the License.
+#
+import functools
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+
+from jdmn.feel.lib.type.range.DefaultRangeLib import DefaultRangeLib
+from jdmn.runtime.IntervalTree import IntervalTree, indexKey
+from jdmn.runtime.LambdaExpression import LambdaExpression
+from jdmn.runtime.Range import Range
+
+RANGE_LIB = DefaultRangeLib()
+
+
+class ColumnIndex:
+    """
+    Index of the input entries of one decision table column.
+
+    An input entry is one of
+        None            - irrelevant input, matches any value
+        Range           - unary comparison or interval test, e.g. Range("<", 10) or Range(True, 1, False, 5),
+                          ranges without endpoints are evaluated by DefaultRangeLib.includes()
+        list            - disjunction of input entries
+        callable        - predicate for tests that cannot be indexed, e.g. lambda x: x is None
+        LambdaExpression - same as callable
+        other           - equality test
+
+    Equality tests are indexed in a hash map and range tests in one interval tree per endpoint type.
+    """
+
+    def __init__(self, entries: List[Tuple[int, Any]]):
+        self.anyRules: Set[int] = set()
+        self.equalities: Dict[Tuple[type, Any], Set[int]] = {}
+        self.predicates: List[Tuple[int, Callable[[Any], Any]]] = []
+        intervals: Dict[type, list] = {}
+        for ruleIndex, entry in entries:
+            self.addEntry(ruleIndex, entry, intervals)
+        self.trees: Dict[type, IntervalTree] = {key: IntervalTree(value) for key, value in intervals.items()}
+
+    def filter(self, value: Any, candidates: Optional[Set[int]]) -> Set[int]:
+        hits = set()
+        if value is not None:
+            valueType = type(value)
+            key = indexKey(value)
+            try:
+                equalityHits = self.equalities.get((valueType, key))
+            except TypeError:
+                # Unhashable value
+                equalityHits = None
+            if equalityHits is not None:
+                hits.update(equalityHits)
+            tree = self.trees.get(valueType)
+            if tree is not None:
+                hits.update(tree.stab(key))
+        for ruleIndex, predicate in self.predicates:
+            if (candidates is None or ruleIndex in candidates) and ruleIndex not in hits:
+                result = predicate(value)
+                if result is not None and result is not False:
+                    hits.add(ruleIndex)
+
+        if candidates is None:
+            return self.anyRules | hits
+        else:
+            return (candidates & self.anyRules) | (candidates & hits)
+
+    def addEntry(self, ruleIndex: int, entry: Any, intervals: Dict[type, list]) -> None:
+        if entry is None:
+            self.anyRules.add(ruleIndex)
+        elif isinstance(entry, (list, tuple, set, frozenset)):
+            for child in entry:
+                self.addEntry(ruleIndex, child, intervals)
+        elif isinstance(entry, Range):
+            self.addRange(ruleIndex, entry, intervals)
+        elif isinstance(entry, LambdaExpression):
+            self.predicates.append((ruleIndex, entry.apply))
+        elif callable(entry):
+            self.predicates.append((ruleIndex, entry))
+        else:
+            self.addEquality(ruleIndex, entry)
+
+    def addRange(self, ruleIndex: int, range_: Range, intervals: Dict[type, list]) -> None:
+        start = range_.getStart()
+        end = range_.getEnd()
+        if start is None and end is None:
+            # Nothing to index, e.g. Range("!=", x) does not keep its endpoint: evaluated by the range lib for this rule only
+            self.predicates.append((ruleIndex, functools.partial(RANGE_LIB.includes, range_)))
+            return
+
+        if start is not None and end is not None and start == end and range_.isStartIncluded() and range_.isEndIncluded():
+            self.addEquality(ruleIndex, start)
+        else:
+            endpointType = type(end) if start is None else type(start)
+            startKey = None if start is None else indexKey(start)
+            endKey = None if end is None else indexKey(end)
+            intervals.setdefault(endpointType, []).append((startKey, range_.isStartIncluded(), endKey, range_.isEndIncluded(), ruleIndex))
+
+    def addEquality(self, ruleIndex: int, value: Any) -> None:
+        try:
+            self.equalities.setdefault((type(value), indexKey(value)), set()).add(ruleIndex)
+        except TypeError:
+            # Unhashable value, e.g. list or context
+            self.predicates.append((ruleIndex, lambda x: x == value))
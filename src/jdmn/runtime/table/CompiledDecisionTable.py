@@ -0,0 +1,78 @@
+#
+# Copyright 2016 Goldman Sachs.
+#
+# Licensed under the Apache License, Version 2.0 (the "License") you may not use self file except in compliance with the License.
+#
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations under the License.
+#
+from typing import List, Optional, Set
+
+from jdmn.runtime.DMNRuntimeException import DMNRuntimeException
+from jdmn.runtime.LazyEval import LazyEval
+from jdmn.runtime.RuleOutputList import RuleOutputList
+from jdmn.runtime.listener.DRGElement import DRGElement
+from jdmn.runtime.listener.EventListener import EventListener
+from jdmn.runtime.table.ColumnIndex import ColumnIndex
+from jdmn.runtime.table.DecisionTableRule import DecisionTableRule
+
+
+class CompiledDecisionTable:
+    """
+    Decision table with one index per input column.
+
+    The matching rules are found by intersecting the index hits of each column instead of
+    evaluating every rule test, and are returned in rule order.
+    """
+
+    def __init__(self, element: DRGElement, rules: List[DecisionTableRule]):
+        self.element = element
+        self.rules = rules
+        columnCount = len(rules[0].inputEntries) if rules else 0
+        for rule in rules:
+            if len(rule.inputEntries) != columnCount:
+                raise DMNRuntimeException(f"Rule {rule.index} has {len(rule.inputEntries)} input entries, expected {columnCount}")
+        self.columns = [ColumnIndex([(rule.index, rule.inputEntries[i]) for rule in rules]) for i in range(columnCount)]
+        self.rulesByIndex = {rule.index: rule for rule in rules}
+
+    def matchingRules(self, *inputs) -> List[DecisionTableRule]:
+        if len(inputs) != len(self.columns):
+            raise DMNRuntimeException(f"Expected {len(self.columns)} inputs, found {len(inputs)}")
+
+        candidates: Optional[Set[int]] = None
+        for column, input_ in zip(self.columns, inputs):
+            if isinstance(input_, LazyEval):
+                input_ = input_.getOrCompute()
+            try:
+                candidates = column.filter(input_, candidates)
+            except TypeError:
+                # Value not comparable with the column tests
+                candidates = set()
+            if not candidates:
+                return []
+
+        if candidates is None:
+            return list(self.rules)
+        return [self.rulesByIndex[index] for index in sorted(candidates)]
+
+    def applyRules(self, eventListener: EventListener, *inputs) -> RuleOutputList:
+        ruleOutputList = RuleOutputList()
+        if eventListener.isNop():
+            for rule in self.matchingRules(*inputs):
+                output = rule.output(*inputs)
+                output.setMatched(True)
+                ruleOutputList.add(output)
+            return ruleOutputList
+
+        for rule in self.matchingRules(*inputs):
+            eventListener.startRule(self.element, rule.rule)
+            eventListener.matchRule(self.element, rule.rule)
+            output = rule.output(*inputs)
+            output.setMatched(True)
+            eventListener.endRule(self.element, rule.rule, output)
+            ruleOutputList.add(output)
+        return ruleOutputList
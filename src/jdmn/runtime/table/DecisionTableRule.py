@@ -0,0 +1,27 @@
+#
+# Copyright 2016 Goldman Sachs.
+#
+# Licensed under the Apache License, Version 2.0 (the "License") you may not use self file except in compliance with the License.
+#
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations under the License.
+#
+from typing import Any, Callable, List
+
+from jdmn.runtime.RuleOutput import RuleOutput
+from jdmn.runtime.listener.Rule import Rule
+
+
+class DecisionTableRule:
+    # Rule index starts from 0, as in the generated rule methods
+
+    def __init__(self, index: int, annotation: str, inputEntries: List[Any], output: Callable[..., RuleOutput]):
+        self.index = index
+        self.annotation = annotation
+        self.inputEntries = inputEntries
+        self.output = output
+        self.rule = Rule(index, annotation)
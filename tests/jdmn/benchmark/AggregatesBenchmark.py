@@ -0,0 +1,63 @@
+#
+# Copyright 2016 Goldman Sachs.
+#
+# Licensed under the Apache License, Version 2.0 (the "License") you may not use self file except in compliance with the License.
+#
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations under the License.
+#
+import random
+from decimal import Decimal
+
+from jdmn.benchmark.BenchmarkUtils import printResults, timePerCall
+from jdmn.feel.lib.type.numeric.DefaultNumericLib import DefaultNumericLib
+from jdmn.feel.lib.type.numeric.DefaultNumericType import DefaultNumericType
+
+SIZES = [1000, 100000]
+
+
+def sortedMedian(operands):
+    # Previous implementation
+    sortedList = sorted(operands, key=float)
+    size = len(sortedList)
+    if size % 2 == 0:
+        return (sortedList[size // 2] + sortedList[size // 2 - 1]) / 2
+    return sortedList[size // 2]
+
+
+def twoPassStddev(lib, operands):
+    # Previous implementation
+    mean = lib.mean(operands)
+    variance = Decimal(0)
+    for e in operands:
+        dm = e - mean
+        variance += dm * dm
+    return lib.sqrt(DefaultNumericType.decimalNumericDivide(variance, Decimal(len(operands) - 1)))
+
+
+def main():
+    lib = DefaultNumericLib()
+    rnd = random.Random(16)
+    for size in SIZES:
+        amounts = [Decimal(rnd.randint(0, 10 ** 7)) / 100 for _ in range(size)]
+        printResults(f"median of {size} amounts", [
+            ("sorted(key=float)", timePerCall(lambda: sortedMedian(amounts), number=1, repeat=3)),
+            ("DefaultNumericLib.median", timePerCall(lambda: lib.median(amounts), number=1, repeat=3)),
+        ])
+        printResults(f"stddev of {size} amounts", [
+            ("two pass", timePerCall(lambda: twoPassStddev(lib, amounts), number=1, repeat=3)),
+            ("DefaultNumericLib.stddev", timePerCall(lambda: lib.stddev(amounts), number=1, repeat=3)),
+        ])
+        printResults(f"count/sum/mean/min/max/stddev of {size} amounts", [
+            ("separate calls", timePerCall(lambda: (lib.count(amounts), lib.sum(amounts), lib.mean(amounts), lib.min(amounts), lib.max(amounts), lib.stddev(amounts)),
+                                           number=1, repeat=3)),
+            ("DefaultNumericLib.describe", timePerCall(lambda: lib.describe(amounts), number=1, repeat=3)),
+        ])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+#
+# Copyright 2016 Goldman Sachs.
+#
+# Licensed under the Apache License, Version 2.0 (the "License") you may not use self file except in compliance with the License.
+#
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations under the License.
+#
+import asyncio
+import time
+from decimal import Decimal
+
+from jdmn.benchmark.BenchmarkUtils import printResults
+from jdmn.runtime.AsyncDecisionRunner import AsyncDecisionRunner
+from jdmn.runtime.ExecutionContext import ExecutionContext
+from jdmn.runtime.FastDMNBaseDecision import FastDMNBaseDecision
+
+COUNT = 5000
+INPUTS = [{"x": Decimal(i), "y": Decimal(7)} for i in range(COUNT)]
+
+
+class RatioDecision(FastDMNBaseDecision):
+    def applyRequest(self, input_: dict, executionContext_: ExecutionContext):
+        return self.numericDivide(input_["x"], input_["y"])
+
+
+async def runInExecutor(decision):
+    # One executor call per request, as done before by the service
+    loop = asyncio.get_running_loop()
+    return await asyncio.gather(*[loop.run_in_executor(None, decision.applyRequest, input_, ExecutionContext()) for input_ in INPUTS])
+
+
+async def applyRequestAsync(runner):
+    return await asyncio.gather(*[runner.applyRequestAsync(input_) for input_ in INPUTS])
+
+
+async def applyRequestsAsync(runner):
+    return [output async for output in runner.applyRequestsAsync(INPUTS)]
+
+
+def timePerRequest(coroutineFunction, argument) -> float:
+    best = None
+    for _ in range(3):
+        startTime = time.perf_counter_ns()
+        asyncio.run(coroutineFunction(argument))
+        elapsed = (time.perf_counter_ns() - startTime) / COUNT
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def main():
+    runner = AsyncDecisionRunner(RatioDecision, maxWorkers=4)
+    printResults(f"evaluate {COUNT} requests from asyncio", [
+        ("run_in_executor per request", timePerRequest(runInExecutor, RatioDecision())),
+        ("applyRequestAsync per request", timePerRequest(applyRequestAsync, runner)),
+        ("applyRequestsAsync, chunks of 100", timePerRequest(applyRequestsAsync, runner)),
+    ])
+    runner.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,32 @@
+#
+# Copyright 2016 Goldman Sachs.
+#
+# Licensed under the Apache License, Version 2.0 (the "License") you may not use self file except in compliance with the License.
+#
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations under the License.
+#
+#
+# Helpers for the micro benchmarks in this package.
+# Benchmarks are not collected by pytest, run them as modules, e.g.
+#     PYTHONPATH=src:tests python -m jdmn.benchmark.EventListenerBenchmark
+#
+import timeit
+from typing import Callable, List, Tuple
+
+
+def timePerCall(function: Callable[[], object], number: int = 10000, repeat: int = 5) -> float:
+    # Best time per call in nanoseconds
+    timer = timeit.Timer(function)
+    return min(timer.repeat(repeat=repeat, number=number)) / number * 1_000_000_000
+
+
+def printResults(title: str, results: List[Tuple[str, float]]) -> None:
+    print(title)
+    baseline = results[0][1] if results else None
+    for name, value in results:
+        print(f"    {name:<50} {value:>12.1f} ns/op {baseline / value:>8.2f}x")
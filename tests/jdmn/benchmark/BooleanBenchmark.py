@@ -0,0 +1,58 @@
+#
+# Copyright 2016 Goldman Sachs.
+#
+# Licensed under the Apache License, Version 2.0 (the "License") you may not use self file except in compliance with the License.
+#
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations under the License.
+#
+from jdmn.benchmark.BenchmarkUtils import printResults, timePerCall
+from jdmn.feel.lib.type.bool.DefaultBooleanType import DefaultBooleanType
+
+
+class AllocatingTernaryLogic:
+    # Previous implementation, instantiated on every call
+    def and_(self, first, second):
+        if self.isFalse(first) or self.isFalse(second):
+            return False
+        elif self.isTrue(first) and self.isTrue(second):
+            return True
+        else:
+            return None
+
+    @staticmethod
+    def isTrue(obj):
+        return isinstance(obj, bool) and obj is True
+
+    @staticmethod
+    def isFalse(obj):
+        return isinstance(obj, bool) and obj is False
+
+
+def foldedAnd(*operands):
+    # Previous n-ary and
+    result = operands[0]
+    for opd in operands[1:]:
+        result = AllocatingTernaryLogic().and_(result, opd)
+    return result
+
+
+def main():
+    booleanType = DefaultBooleanType()
+    printResults("binary and", [
+        ("allocating", timePerCall(lambda: AllocatingTernaryLogic().and_(True, None))),
+        ("DefaultBooleanType.binaryBooleanAnd", timePerCall(lambda: booleanType.binaryBooleanAnd(True, None))),
+    ])
+    conditions = [False] + [True] * 9
+    printResults("and of 10 conditions, first is false", [
+        ("pairwise fold", timePerCall(lambda: foldedAnd(*conditions))),
+        ("DefaultBooleanType.booleanAnd", timePerCall(lambda: booleanType.booleanAnd(*conditions))),
+    ])
+
+
+if __name__ == "__main__":
+    main()
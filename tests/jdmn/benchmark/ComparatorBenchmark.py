@@ -0,0 +1,76 @@
+#
+# Copyright 2016 Goldman Sachs.
+#
+# Licensed under the Apache License, Version 2.0 (the "License") you may not use self file except in compliance with the License.
+#
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations under the License.
+#
+from datetime import date, datetime, time, timedelta, timezone
+from decimal import Decimal
+
+from isodate import Duration
+
+from jdmn.benchmark.BenchmarkUtils import printResults, timePerCall
+from jdmn.feel.lib.type.range.DefaultRangeLib import COMPARATOR_MAP
+
+PAIRS = {
+    Decimal: (Decimal("123.45"), Decimal("678.9")),
+    str: ("approved", "declined"),
+    date: (date(2020, 1, 1), date(2021, 6, 30)),
+    time: (time(10, 0, 0, tzinfo=timezone.utc), time(11, 30, 0, tzinfo=timezone.utc)),
+    datetime: (datetime(2020, 1, 1, 10, tzinfo=timezone.utc), datetime(2020, 1, 2, 10, tzinfo=timezone.utc)),
+    Duration: (Duration(years=1), Duration(months=18)),
+    timedelta: (timedelta(days=1), timedelta(days=2)),
+}
+
+
+def lambdaEqualTo(comparator, first, second):
+    # Previous implementation, four closures per call
+    return comparator.applyOperator(first, second, [
+        lambda: True,
+        lambda: False,
+        lambda: False,
+        lambda: type(first) is type(second) and comparator.compareTo(first, second) == 0
+    ])
+
+
+def lambdaLessThan(comparator, first, second):
+    return comparator.applyOperator(first, second, [
+        lambda: None,
+        lambda: None,
+        lambda: None,
+        lambda: type(first) is type(second) and comparator.compareTo(first, second) < 0
+    ])
+
+
+def lambdaLessEqualThan(comparator, first, second):
+    # Previous implementation, lessThan or equalTo
+    lessThan = lambdaLessThan(comparator, first, second)
+    return True if lessThan is True else lambdaEqualTo(comparator, first, second) if lessThan is False else None
+
+
+def main():
+    for key, comparator in COMPARATOR_MAP.items():
+        first, second = PAIRS[key]
+        name = f"{type(comparator).__name__}[{key.__name__}]"
+        printResults(f"{name} equalTo", [
+            ("lambdas", timePerCall(lambda: lambdaEqualTo(comparator, first, second))),
+            ("direct", timePerCall(lambda: comparator.equalTo(first, second))),
+        ])
+        printResults(f"{name} lessThan", [
+            ("lambdas", timePerCall(lambda: lambdaLessThan(comparator, first, second))),
+            ("direct", timePerCall(lambda: comparator.lessThan(first, second))),
+        ])
+        printResults(f"{name} lessEqualThan", [
+            ("lambdas", timePerCall(lambda: lambdaLessEqualThan(comparator, first, second))),
+            ("direct", timePerCall(lambda: comparator.lessEqualThan(first, second))),
+        ])
+
+
+if __name__ == "__main__":
+    main()
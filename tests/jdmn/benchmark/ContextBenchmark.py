@@ -0,0 +1,59 @@
+#
+# Copyright 2016 Goldman Sachs.
+#
+# Licensed under the Apache License, Version 2.0 (the "License") you may not use self file except in compliance with the License.
+#
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations under the License.
+#
+from decimal import Decimal
+
+from jdmn.benchmark.BenchmarkUtils import printResults, timePerCall
+from jdmn.runtime.Context import Context
+from jdmn.runtime.PersistentContext import PersistentContext
+
+# Input data of a decision, enriched with one output per level of the DRG
+INPUTS = {f"input{i}": Decimal(i) for i in range(50)}
+LEVELS = 6
+OUTPUTS = [(f"decision{level}", Decimal(level)) for level in range(LEVELS)]
+
+
+def copyDown():
+    context = Context()
+    context.getBindings().update(INPUTS)
+    for key, value in OUTPUTS:
+        copy = Context()
+        copy.getBindings().update(context.getBindings())
+        copy.add(key, value)
+        context = copy
+    return context.get("input0")
+
+
+def shareDown(base=PersistentContext(INPUTS)):
+    context = base
+    for key, value in OUTPUTS:
+        context = context.plus(key, value)
+    return context.get("input0")
+
+
+def main():
+    printResults(f"enrich a {len(INPUTS)} entry context through {LEVELS} decisions", [
+        ("Context copy", timePerCall(copyDown)),
+        ("PersistentContext.plus", timePerCall(shareDown)),
+    ])
+    context = Context()
+    context.getBindings().update(INPUTS)
+    persistent = PersistentContext(INPUTS)
+    hash(persistent)
+    printResults("hash", [
+        ("Context", timePerCall(lambda: hash(context))),
+        ("PersistentContext (cached)", timePerCall(lambda: hash(persistent))),
+    ])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,34 @@
+#
+# Copyright 2016 Goldman Sachs.
+#
+# Licensed under the Apache License, Version 2.0 (the "License") you may not use self file except in compliance with the License.
+#
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations under the License.
+#
+from jdmn.benchmark.BenchmarkUtils import printResults, timePerCall
+from jdmn.feel.lib.type.time.DefaultDateTimeLib import DefaultDateTimeLib
+
+LITERALS = {
+    "date": "2020-01-01",
+    "time": "12:30:00.123+0100",
+    "dateAndTime": "2020-01-01T12:30:00Z",
+}
+
+
+def main():
+    uncached = DefaultDateTimeLib(literalCacheSize=None)
+    cached = DefaultDateTimeLib()
+    for function, literal in LITERALS.items():
+        printResults(f"{function}(\"{literal}\")", [
+            ("no literal cache", timePerCall(lambda: getattr(uncached, function)(literal))),
+            ("literal cache", timePerCall(lambda: getattr(cached, function)(literal))),
+        ])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,46 @@
+#
+# Copyright 2016 Goldman Sachs.
+#
+# Licensed under the Apache License, Version 2.0 (the "License") you may not use self file except in compliance with the License.
+#
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations under the License.
+#
+import random
+from decimal import Decimal
+
+from jdmn.benchmark.BenchmarkUtils import printResults, timePerCall
+from jdmn.feel.lib.type.list.DefaultListLib import DefaultListLib
+
+SIZES = [1000, 10000, 100000]
+# The linear scan is quadratic, skip it for the largest lists
+MAX_LINEAR_SIZE = 10000
+
+
+def linearDistinctValues(list_):
+    result = []
+    for element in list_:
+        if element not in result:
+            result.append(element)
+    return result
+
+
+def main():
+    lib = DefaultListLib()
+    rnd = random.Random(8)
+    for size in SIZES:
+        # Customer ids with ~50% duplicates
+        ids = [Decimal(rnd.randint(0, size // 2)) for _ in range(size)]
+        results = []
+        if size <= MAX_LINEAR_SIZE:
+            results.append(("linear scan", timePerCall(lambda: linearDistinctValues(ids), number=1, repeat=1)))
+        results.append(("DefaultListLib.distinctValues", timePerCall(lambda: lib.distinctValues(ids), number=1, repeat=3)))
+        printResults(f"distinctValues of {size} ids", results)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,47 @@
+#
+# Copyright 2016 Goldman Sachs.
+#
+# Licensed under the Apache License, Version 2.0 (the "License") you may not use self file except in compliance with the License.
+#
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations under the License.
+#
+import logging
+
+from jdmn.benchmark.BenchmarkUtils import printResults, timePerCall
+from jdmn.feel.lib.BaseFEELLib import BaseFEELLib
+from jdmn.runtime.listener.LoggingEventListener import LoggingEventListener
+from jdmn.runtime.listener.NopEventListener import NopEventListener
+from jdmn.runtime.listener.Rule import Rule
+
+COLUMNS = 5
+
+
+class EagerNopEventListener(NopEventListener):
+    # Listener that does nothing but is still called for every event
+    def isNop(self) -> bool:
+        return False
+
+
+def ruleBenchmark(eventListener) -> float:
+    rule = Rule(0, "")
+    operands = [True] * COLUMNS
+    return timePerCall(lambda: BaseFEELLib.ruleMatches(eventListener, rule, *operands), number=100000)
+
+
+def main():
+    disabledLogger = logging.getLogger("jdmn.benchmark.disabled")
+    disabledLogger.setLevel(logging.WARNING)
+    printResults(f"ruleMatches with {COLUMNS} columns", [
+        ("NopEventListener called for every column", ruleBenchmark(EagerNopEventListener())),
+        ("LoggingEventListener (INFO disabled)", ruleBenchmark(LoggingEventListener(disabledLogger))),
+        ("NopEventListener (isNop)", ruleBenchmark(NopEventListener())),
+    ])
+
+
+if __name__ == "__main__":
+    main()
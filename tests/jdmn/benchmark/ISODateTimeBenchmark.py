@@ -0,0 +1,59 @@
+#
+# Copyright 2016 Goldman Sachs.
+#
+# Licensed under the Apache License, Version 2.0 (the "License") you may not use self file except in compliance with the License.
+#
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations under the License.
+#
+import random
+from datetime import datetime, timedelta
+
+import isodate
+
+from jdmn.benchmark.BenchmarkUtils import printResults, timePerCall
+from jdmn.feel.lib.type.time.DefaultDateTimeLib import DefaultDateTimeLib
+
+SIZE = 10000
+
+
+def timestampCorpus():
+    # Distinct timestamps as found in input feeds: UTC, offsets and fractions of seconds
+    rnd = random.Random(3)
+    start = datetime(2020, 1, 1)
+    corpus = []
+    for _ in range(SIZE):
+        value = start + timedelta(seconds=rnd.randint(0, 3 * 365 * 86400), microseconds=rnd.randint(0, 999999))
+        text = value.strftime("%Y-%m-%dT%H:%M:%S")
+        kind = rnd.random()
+        if kind < 0.4:
+            text += "Z"
+        elif kind < 0.7:
+            text += f".{value.microsecond // 1000:03d}" + rnd.choice(["+01:00", "-05:00", "+0530"])
+        elif kind < 0.9:
+            text += f".{value.microsecond:06d}Z"
+        corpus.append(text)
+    return corpus
+
+
+def isodateParseDateTime(lib, literal):
+    datestring, timestring = lib.fixDateTimeFormat(literal).split("T")
+    return datetime.combine(isodate.parse_date(datestring, defaultday=0, defaultmonth=0), isodate.parse_time(timestring))
+
+
+def main():
+    corpus = timestampCorpus()
+    lib = DefaultDateTimeLib(literalCacheSize=None)
+    printResults(f"parse {SIZE} timestamps (time per timestamp)", [
+        ("isodate", timePerCall(lambda: [isodateParseDateTime(lib, literal) for literal in corpus], number=1) / SIZE),
+        ("DefaultDateTimeLib.parseDateTime", timePerCall(lambda: [lib.parseDateTime(literal) for literal in corpus], number=1) / SIZE),
+        ("DefaultDateTimeLib.dateAndTime", timePerCall(lambda: [lib.dateAndTime(literal) for literal in corpus], number=1) / SIZE),
+    ])
+
+
+if __name__ == "__main__":
+    main()
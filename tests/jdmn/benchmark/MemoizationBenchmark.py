@@ -0,0 +1,58 @@
+#
+# Copyright 2016 Goldman Sachs.
+#
+# Licensed under the Apache License, Version 2.0 (the "License") you may not use self file except in compliance with the License.
+#
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations under the License.
+#
+from decimal import Decimal
+
+from jdmn.benchmark.BenchmarkUtils import printResults, timePerCall
+from jdmn.runtime.Context import Context
+from jdmn.runtime.ExecutionContext import ExecutionContext
+from jdmn.runtime.FastDMNBaseDecision import FastDMNBaseDecision
+from jdmn.runtime.annotation.Memoized import Memoized
+
+# Same customer profile hitting the same sub-decision
+APPLICANT = Context().add("age", Decimal(42)).add("income", Decimal("5500.50")).add("debts", [Decimal(100), Decimal(250), Decimal(75)])
+CONTEXT = ExecutionContext()
+
+
+# Age band and debt ratio band of each rule, first hit
+RULES = [(Decimal(18 + 5 * (i // 5)), Decimal(23 + 5 * (i // 5)), Decimal(i % 5) / 10, Decimal(i % 5 + 1) / 10, Decimal(i)) for i in range(40)]
+
+
+class Score(FastDMNBaseDecision):
+    def apply(self, applicant, context_: ExecutionContext):
+        age = applicant.get("age")
+        ratio = self.numericDivide(self.sum(applicant.get("debts")), applicant.get("income"))
+        for minAge, maxAge, minRatio, maxRatio, score in RULES:
+            if self.numericGreaterEqualThan(age, minAge) and self.numericLessThan(age, maxAge) \
+                    and self.numericGreaterEqualThan(ratio, minRatio) and self.numericLessThan(ratio, maxRatio):
+                return score
+        return None
+
+
+class MemoizedScore(Score):
+    @Memoized(maxEntries=100)
+    def apply(self, applicant, context_: ExecutionContext):
+        return Score.apply(self, applicant, context_)
+
+
+def main():
+    score = Score()
+    memoizedScore = MemoizedScore()
+    printResults(f"score of a repeated applicant, {len(RULES)} rules", [
+        ("evaluate", timePerCall(lambda: score.apply(APPLICANT, CONTEXT))),
+        ("@Memoized", timePerCall(lambda: memoizedScore.apply(APPLICANT, CONTEXT))),
+    ])
+    print(f"    statistics: {MemoizedScore.apply.memoized.statistics()}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+#
+# Copyright 2016 Goldman Sachs.
+#
+# Licensed under the Apache License, Version 2.0 (the "License") you may not use self file except in compliance with the License.
+#
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations under the License.
+#
+from jdmn.benchmark.BenchmarkUtils import printResults, timePerCall
+from jdmn.feel.lib.DefaultStandardFEELLib import DefaultStandardFEELLib
+from jdmn.feel.lib.FastStandardFEELLib import FastStandardFEELLib
+
+
+def operatorFamilies(lib: DefaultStandardFEELLib):
+    n1 = lib.number("123.45")
+    n2 = lib.number("67.8")
+    d1 = lib.date("2020-01-01")
+    d2 = lib.date("2021-06-30")
+    t1 = lib.time("12:00:00Z")
+    t2 = lib.time("13:30:00Z")
+    dt1 = lib.dateAndTime("2020-01-01T12:00:00Z")
+    dt2 = lib.dateAndTime("2021-06-30T13:30:00Z")
+    du1 = lib.duration("P1DT2H")
+    du2 = lib.duration("PT30M")
+    return {
+        "numeric": [("numericAdd", n1, n2), ("numericMultiply", n1, n2), ("numericEqual", n1, n2), ("numericLessThan", n1, n2)],
+        "boolean": [("booleanAnd", True, False), ("booleanOr", False, True), ("booleanNot", True)],
+        "string": [("stringEqual", "abc", "abd"), ("stringLessThan", "abc", "abd"), ("stringAdd", "abc", "abd")],
+        "date": [("dateEqual", d1, d2), ("dateLessThan", d1, d2), ("dateAddDuration", d1, du1)],
+        "time": [("timeEqual", t1, t2), ("timeLessThan", t1, t2)],
+        "date and time": [("dateTimeEqual", dt1, dt2), ("dateTimeLessThan", dt1, dt2), ("dateTimeAddDuration", dt1, du1)],
+        "duration": [("durationEqual", du1, du2), ("durationLessThan", du1, du2), ("durationAdd", du1, du2)],
+    }
+
+
+def familyBenchmark(lib: DefaultStandardFEELLib, operations) -> float:
+    calls = [(getattr(lib, name), args) for name, *args in operations]
+
+    def run():
+        for function, args in calls:
+            function(*args)
+
+    return timePerCall(run, number=20000) / len(calls)
+
+
+def main():
+    defaultLib = DefaultStandardFEELLib()
+    fastLib = FastStandardFEELLib()
+    for family, operations in operatorFamilies(defaultLib).items():
+        printResults(f"{family} operators", [
+            ("DefaultStandardFEELLib", familyBenchmark(defaultLib, operations)),
+            ("FastStandardFEELLib", familyBenchmark(fastLib, operations)),
+        ])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,45 @@
+#
+# Copyright 2016 Goldman Sachs.
+#
+# Licensed under the Apache License, Version 2.0 (the "License") you may not use self file except in compliance with the License.
+#
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations under the License.
+#
+import random
+from decimal import Decimal
+
+from jdmn.benchmark.BenchmarkUtils import printResults, timePerCall
+from jdmn.feel.lib.DefaultStandardFEELLib import DefaultStandardFEELLib
+from jdmn.runtime.Range import Range
+
+SIZES = [1000, 50000]
+
+
+def main():
+    lib = DefaultStandardFEELLib()
+    rnd = random.Random(20)
+    for size in SIZES:
+        # Tariff bands of random width, some of them overlapping
+        bands = []
+        for _ in range(size):
+            start = Decimal(rnd.randint(0, 10 * size))
+            bands.append(Range(True, start, rnd.random() < 0.5, start + rnd.randint(1, 50)))
+        points = [Decimal(rnd.randint(0, 10 * size)) for _ in range(20)]
+        index = lib.rangeIndex(bands)
+
+        printResults(f"bands containing a point, {size} bands", [
+            ("includes() loop", timePerCall(lambda: [[band for band in bands if lib.includes(band, point)] for point in points], number=1, repeat=1) / len(points)),
+            ("rangesContaining", timePerCall(lambda: [lib.rangesContaining(index, point) for point in points], number=10, repeat=3) / len(points)),
+        ])
+        printResults(f"build index, {size} bands", [
+            ("rangeIndex", timePerCall(lambda: lib.rangeIndex(bands), number=1, repeat=3)),
+        ])
+
+
+if __name__ == "__main__":
+    main()
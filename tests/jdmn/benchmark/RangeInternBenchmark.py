@@ -0,0 +1,73 @@
+#
+# Copyright 2016 Goldman Sachs.
+#
+# Licensed under the Apache License, Version 2.0 (the "License") you may not use self file except in compliance with the License.
+#
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations under the License.
+#
+import tracemalloc
+from decimal import Decimal
+
+from jdmn.benchmark.BenchmarkUtils import printResults, timePerCall
+from jdmn.runtime.Range import Range
+
+COUNT = 10000
+ONE = Decimal(1)
+FIVE = Decimal(5)
+TEN = Decimal(10)
+# Constant tests interned once at module level, like the constants of a generated decision
+GREATER_THAN_TEN = Range.of(">", TEN)
+ONE_TO_FIVE = Range.of(True, ONE, True, FIVE)
+
+
+def transientBytesPerCall(function):
+    # Largest amount of memory allocated while a call runs, the result included, freed or not
+    function()
+    tracemalloc.start()
+    peak = 0
+    for _ in range(COUNT):
+        before = tracemalloc.get_traced_memory()[0]
+        tracemalloc.reset_peak()
+        function()
+        peak = max(peak, tracemalloc.get_traced_memory()[1] - before)
+    tracemalloc.stop()
+    return peak
+
+
+def retainedBytesPerCall(function):
+    # Memory still held after COUNT calls, the results are kept like rule tests kept by a decision
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    results = [function() for _ in range(COUNT)]
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    size = sum(stat.size_diff for stat in after.compare_to(before, "filename"))
+    return (size - results.__sizeof__()) / COUNT
+
+
+def main():
+    tests = {
+        "> 10": [
+            ("Range(...)", lambda: Range(">", TEN)),
+            ("Range.of(...) per evaluation", lambda: Range.of(">", TEN)),
+            ("Range.of(...) module constant", lambda: GREATER_THAN_TEN),
+        ],
+        "[1..5]": [
+            ("Range(...)", lambda: Range(True, ONE, True, FIVE)),
+            ("Range.of(...) per evaluation", lambda: Range.of(True, ONE, True, FIVE)),
+            ("Range.of(...) module constant", lambda: ONE_TO_FIVE),
+        ],
+    }
+    for name, variants in tests.items():
+        printResults(f"unary test '{name}'", [(variant, timePerCall(function)) for variant, function in variants])
+        for variant, function in variants:
+            print(f"    {variant:<50} transient {transientBytesPerCall(function):>6} bytes, retained {retainedBytesPerCall(function):>6.0f} bytes per evaluation")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,31 @@
+#
+# Copyright 2016 Goldman Sachs.
+#
+# Licensed under the Apache License, Version 2.0 (the "License") you may not use self file except in compliance with the License.
+#
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations under the License.
+#
+from jdmn.benchmark.BenchmarkUtils import printResults, timePerCall
+from jdmn.feel.lib.type.string.DefaultStringLib import DefaultStringLib
+
+
+def main():
+    lib = DefaultStringLib()
+    input_ = "ACME Corporation, account 12345-678"
+    printResults("matches()", [
+        ("elementpath", timePerCall(lambda: len(lib.evaluateXPath(input_, "/root[matches(., '\\d+-\\d+', 'i')]")) != 0, number=2000)),
+        ("translated", timePerCall(lambda: lib.matches(input_, "\\d+-\\d+", "i"), number=2000)),
+    ])
+    printResults("replace()", [
+        ("elementpath", timePerCall(lambda: lib.evaluateXPath(input_, "replace(/root, '(\\d+)-(\\d+)', '$2/$1', '')"), number=2000)),
+        ("translated", timePerCall(lambda: lib.replace(input_, "(\\d+)-(\\d+)", "$2/$1", ""), number=2000)),
+    ])
+
+
+if __name__ == "__main__":
+    main()
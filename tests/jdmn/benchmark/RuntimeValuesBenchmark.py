@@ -0,0 +1,76 @@
+#
+# Copyright 2016 Goldman Sachs.
+#
+# Licensed under the Apache License, Version 2.0 (the "License") you may not use self file except in compliance with the License.
+#
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations under the License.
+#
+import tracemalloc
+from decimal import Decimal
+
+from jdmn.benchmark.BenchmarkUtils import printResults, timePerCall
+from jdmn.runtime.Context import Context
+from jdmn.runtime.LambdaExpression import LambdaExpression
+from jdmn.runtime.LazyEval import LazyEval
+from jdmn.runtime.Pair import Pair
+from jdmn.runtime.Range import COMPARABLE_TYPES, Range, comparable
+from jdmn.runtime.RuleOutput import RuleOutput
+from jdmn.runtime.annotation.Annotation import Annotation
+from jdmn.runtime.listener.DRGElement import DRGElement
+from jdmn.runtime.listener.Rule import Rule
+
+COUNT = 10000
+ONE = Decimal(1)
+TEN = Decimal(10)
+
+FACTORIES = {
+    Range: lambda cls: cls(True, ONE, False, TEN),
+    Pair: lambda cls: cls(ONE, TEN),
+    Context: lambda cls: cls(),
+    Annotation: lambda cls: cls("decision", 1, "annotation"),
+    Rule: lambda cls: cls(0, "annotation"),
+    DRGElement: lambda cls: cls("ns", "decision", "Decision", None, None, None, 2),
+    RuleOutput: lambda cls: cls(True),
+    LazyEval: lambda cls: cls(lambda: ONE),
+    LambdaExpression: lambda cls: cls(lambda x: x),
+}
+
+
+def withDict(cls):
+    # Same class without __slots__, as before
+    members = {name: value for name, value in vars(cls).items() if name not in ("__slots__", "__dict__", "__weakref__") and name not in getattr(cls, "__slots__", ())}
+    return type(cls.__name__, cls.__bases__, members)
+
+
+def bytesPerObject(factory):
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    objects = [factory() for _ in range(COUNT)]
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    size = sum(stat.size_diff for stat in after.compare_to(before, "filename"))
+    # The list of objects is not part of the cost
+    return (size - objects.__sizeof__()) / COUNT
+
+
+def main():
+    printResults("Range endpoint type check", [
+        ("isinstance(typing.Union)", timePerCall(lambda: isinstance(ONE, comparable))),
+        ("isinstance(tuple)", timePerCall(lambda: isinstance(ONE, COMPARABLE_TYPES))),
+    ])
+    for cls, factory in FACTORIES.items():
+        dictClass = withDict(cls)
+        print(f"{cls.__name__}: {bytesPerObject(lambda: factory(dictClass)):.0f} bytes with __dict__, {bytesPerObject(lambda: factory(cls)):.0f} bytes with __slots__")
+        printResults(f"{cls.__name__} construction", [
+            ("__dict__", timePerCall(lambda: factory(dictClass))),
+            ("__slots__", timePerCall(lambda: factory(cls))),
+        ])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,40 @@
+#
+# Copyright 2016 Goldman Sachs.
+#
+# Licensed under the Apache License, Version 2.0 (the "License") you may not use self file except in compliance with the License.
+#
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations under the License.
+#
+import random
+
+from jdmn.benchmark.BenchmarkUtils import printResults, timePerCall
+from jdmn.feel.lib.DefaultStandardFEELLib import DefaultStandardFEELLib
+from jdmn.runtime.Context import Context
+from jdmn.runtime.LambdaExpression import LambdaExpression
+
+SIZE = 100000
+
+
+def main():
+    lib = DefaultStandardFEELLib()
+    rnd = random.Random(4)
+    customers = [Context().add("id", lib.number(str(i))).add("score", lib.number(str(rnd.randint(0, 1000)))) for i in range(SIZE)]
+
+    # sort(customers, function(x, y) x.score < y.score) as generated today
+    precedes = LambdaExpression(lambda *args: (x := args[0], y := args[1], lib.numericLessThan(lib.getValue(x, "score"), lib.getValue(y, "score"))))
+    byScore = LambdaExpression.fromKey(lambda x: lib.getValue(x, "score"))
+
+    printResults(f"sort {SIZE} contexts by score", [
+        ("sort() with precedes lambda", timePerCall(lambda: lib.sort(customers, precedes), number=1, repeat=1)),
+        ("sort() with key lambda", timePerCall(lambda: lib.sort(customers, byScore), number=1, repeat=3)),
+        ("sortBy()", timePerCall(lambda: lib.sortBy(customers, lambda x: lib.getValue(x, "score")), number=1, repeat=3)),
+    ])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+#
+# Copyright 2016 Goldman Sachs.
+#
+# Licensed under the Apache License, Version 2.0 (the "License") you may not use self file except in compliance with the License.
+#
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations under the License.
+#
+from decimal import Decimal
+
+from jdmn.benchmark.BenchmarkUtils import printResults, timePerCall
+from jdmn.feel.lib.DefaultStandardFEELLib import DefaultStandardFEELLib
+from jdmn.runtime.Context import Context
+
+
+def chainedIs(lib, value1, value2):
+    # Previous implementation, one wrapper call per candidate type
+    if value1 is None or value2 is None:
+        return value1 == value2
+    elif type(value1) is not type(value2):
+        return False
+    elif lib.isNumber(value1):
+        return lib.numericType.numericIs(value1, value2)
+    elif lib.isBoolean(value1):
+        return lib.booleanType.booleanIs(value1, value2)
+    elif lib.isString(value1):
+        return lib.stringType.stringIs(value1, value2)
+    elif lib.isDate(value1):
+        return lib.dateType.dateIs(value1, value2)
+    elif lib.isTime(value1):
+        return lib.timeType.timeIs(value1, value2)
+    elif lib.isDateTime(value1):
+        return lib.dateTimeType.dateTimeIs(value1, value2)
+    elif lib.isDuration(value1):
+        return lib.durationType.durationIs(value1, value2)
+    elif lib.isList(value1):
+        return lib.listType.listIs(value1, value2)
+    elif lib.isRange(value1):
+        return lib.rangeType.rangeIs(value1, value2)
+    elif lib.isContext(value1):
+        return lib.contextType.contextIs(value1, value2)
+    return False
+
+
+def main():
+    lib = DefaultStandardFEELLib()
+    cases = {
+        "number": (Decimal(10), Decimal(10)),
+        "list": ([Decimal(1)], [Decimal(1)]),
+        "context": (Context().add("a", Decimal(1)), Context().add("a", Decimal(1))),
+    }
+    for name, (first, second) in cases.items():
+        printResults(f"is({name}, {name})", [
+            ("isX() chain", timePerCall(lambda: chainedIs(lib, first, second))),
+            ("type dispatch", timePerCall(lambda: lib.is_(first, second))),
+        ])
+
+
+if __name__ == "__main__":
+    main()
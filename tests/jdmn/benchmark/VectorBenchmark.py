@@ -0,0 +1,39 @@
+#
+# Copyright 2016 Goldman Sachs.
+#
+# Licensed under the Apache License, Version 2.0 (the "License") you may not use self file except in compliance with the License.
+#
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations under the License.
+#
+import random
+from decimal import Decimal
+
+from jdmn.benchmark.BenchmarkUtils import printResults, timePerCall
+from jdmn.feel.lib.DefaultStandardFEELLib import DefaultStandardFEELLib
+from jdmn.feel.lib.VectorFEELLib import VectorFEELLib
+
+SIZE = 100000
+
+
+def main():
+    rnd = random.Random(1)
+    first = [Decimal(rnd.randint(0, 10000)) / 100 for _ in range(SIZE)]
+    second = [None if rnd.random() < 0.01 else Decimal(rnd.randint(0, 10000)) / 100 for _ in range(SIZE)]
+    scalarLib = DefaultStandardFEELLib()
+    vectorLib = VectorFEELLib()
+    for operator in ["numericAdd", "numericMultiply", "numericLessThan"]:
+        scalarOperator = getattr(scalarLib, operator)
+        vectorOperator = getattr(vectorLib, operator)
+        printResults(f"{operator} over {SIZE} records (time per column)", [
+            ("DefaultStandardFEELLib per record", timePerCall(lambda: [scalarOperator(x, y) for x, y in zip(first, second)], number=1, repeat=3)),
+            ("VectorFEELLib", timePerCall(lambda: vectorOperator(first, second), number=1, repeat=3)),
+        ])
+
+
+if __name__ == "__main__":
+    main()
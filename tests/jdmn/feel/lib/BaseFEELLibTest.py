@@ -10,8 +10,15 @@
 # "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.  See the License for the
 # specific language governing permissions and limitations under the License.
 #
+import logging
+from typing import Any
+
 from jdmn.feel.lib.FEELOperatorsTest import FEELOperatorsTest
 from jdmn.runtime.Context import Context
+from jdmn.runtime.LazyEval import LazyEval
+from jdmn.runtime.listener.LoggingEventListener import LoggingEventListener
+from jdmn.runtime.listener.NopEventListener import NopEventListener
+from jdmn.runtime.listener.Rule import Rule
 
 
 class BaseFEELLibTest(FEELOperatorsTest):
@@ -348,3 +355,30 @@ class BaseFEELLibTest(FEELOperatorsTest):
         self.assertIsNone(self.getLib().getValue(Context(), "a"))
 
         self.assertEqual(self.makeNumber("1"), self.getLib().getValue(Context().add("a", self.makeNumber("1")), "a"))
+
+    #
+    # Decision table functions
+    #
+    def testRuleMatches(self):
+        rule = Rule(0, "")
+        listener = RecordingEventListener()
+        self.assertFalse(listener.isNop())
+        self.assertTrue(self.getLib().ruleMatches(listener, rule, True, LazyEval(lambda: True)))
+        self.assertFalse(self.getLib().ruleMatches(listener, rule, True, None, True))
+        self.assertFalse(self.getLib().ruleMatches(listener, rule))
+        self.assertEqual([1, 2, 1, 2], listener.columns)
+
+        nopListener = NopEventListener()
+        self.assertTrue(nopListener.isNop())
+        self.assertTrue(self.getLib().ruleMatches(nopListener, rule, True, LazyEval(lambda: True)))
+        self.assertFalse(self.getLib().ruleMatches(nopListener, rule, True, False))
+        self.assertFalse(self.getLib().ruleMatches(LoggingEventListener(logging.getLogger("disabled")), rule, None))
+
+
+class RecordingEventListener(NopEventListener):
+    def __init__(self):
+        super().__init__()
+        self.columns = []
+
+    def matchColumn(self, rule: Rule, columnIndex: int, result: Any) -> None:
+        self.columns.append(columnIndex)
@@ -736,6 +736,22 @@ class BaseStandardFEELLibTest(BaseFEELLibTest):
         self.assertTrue(self.getLib().is_(Context().add("a", self.makeNumber(1)), Context().add("a", self.makeNumber(1))))
         self.assertFalse(self.getLib().is_(Context().add("a", self.makeNumber(1)), Context()))
 
+        self.assertFalse(self.getLib().is_(object(), object()))
+
+    def testEqual(self):
+        self.assertTrue(self.getLib().equal(None, None))
+        self.assertFalse(self.getLib().equal(None, self.makeNumber(1)))
+        self.assertFalse(self.getLib().equal(self.makeNumber(1), "1"))
+
+        self.assertTrue(self.getLib().equal(self.makeNumber("1"), self.makeNumber("1.00")))
+        self.assertTrue(self.getLib().equal("abc", "abc"))
+        self.assertFalse(self.getLib().equal(True, False))
+        self.assertTrue(self.getLib().equal(self.makeDate("2012-12-25"), self.makeDate("2012-12-25")))
+        self.assertTrue(self.getLib().equal(self.makeDuration("P1Y"), self.makeDuration("P12M")))
+        self.assertTrue(self.getLib().equal([self.makeNumber(1)], [self.makeNumber(1)]))
+        self.assertTrue(self.getLib().equal(Context().add("a", self.makeNumber(1)), Context().add("a", self.makeNumber(1))))
+        self.assertIsNone(self.getLib().equal(object(), object()))
+
     #
     # Temporal functions
     #
@@ -885,6 +901,21 @@ class BaseStandardFEELLibTest(BaseFEELLibTest):
             "4"
         ]))
 
+    def testFlattenLazy(self):
+        self.assertIsNone(self.getLib().flatten(None, True))
+
+        numbers = [self.makeNumber(1), [[self.makeNumber(2)], [], self.makeNumber(3)], self.makeNumber(4)]
+        self.assertEqual(self.makeNumber(10), self.getLib().sum(self.getLib().flatten(numbers, True)))
+        self.assertEqual(self.makeNumber(4), self.getLib().count(self.getLib().flatten(numbers, True)))
+        self.assertTrue(self.getLib().listContains(self.getLib().flatten(numbers, True), self.makeNumber(2)))
+        self.assertIsNone(self.getLib().sum(self.getLib().flatten([[]], True)))
+
+        # Nesting deeper than the recursion limit
+        deep = "1"
+        for _ in range(5000):
+            deep = [deep, "2"]
+        self.assertEqual(["1"] + ["2"] * 5000, self.getLib().flatten(deep))
+
     def testProduct(self):
         self.assertIsNone(self.getLib().product())
         self.assertIsNone(self.getLib().product(None))
@@ -938,6 +969,21 @@ class BaseStandardFEELLibTest(BaseFEELLibTest):
         self.assertEqual(self.makeNumberList(1, 6), self.getLib().mode(self.makeNumber(6), self.makeNumber(1), self.makeNumber(9), self.makeNumber(6), self.makeNumber(1)))
         self.assertEqual(self.makeNumberList(1, 6), self.getLib().mode(self.makeNumberList(6, 1, 9, 6, 1)))
 
+    def testDescribe(self):
+        self.assertIsNone(self.getLib().describe())
+        self.assertIsNone(self.getLib().describe([]))
+        self.assertIsNone(self.getLib().describe(self.makeNumberList(2, None, 5)))
+
+        statistics = self.getLib().describe(self.makeNumberList(2, 4, 7, 5))
+        self.assertEqualsNumber(self.makeNumber(4), statistics.get("count"))
+        self.assertEqualsNumber(self.makeNumber(18), statistics.get("sum"))
+        self.assertEqualsNumber(self.makeNumber("4.5"), statistics.get("mean"))
+        self.assertEqualsNumber(self.makeNumber(2), statistics.get("min"))
+        self.assertEqualsNumber(self.makeNumber(7), statistics.get("max"))
+        self.assertEqualsNumber(self.makeNumber("2.0816659994661"), statistics.get("stddev"))
+
+        self.assertIsNone(self.getLib().describe(self.makeNumber(3)).get("stddev"))
+
     def testCollect(self):
         self.getLib().collect(None, None)
         self.getLib().collect([], None)
@@ -954,3 +1000,23 @@ class BaseStandardFEELLibTest(BaseFEELLibTest):
         self.assertEqual([], self.getLib().sort([], None))
 
         self.assertEqual(["1", "2", "3"], self.getLib().sort(["3", "1", "2"], comparator))
+
+    def testSortBy(self):
+        people = [Context().add("name", "c").add("age", self.makeNumber(30)),
+                  Context().add("name", "a").add("age", None),
+                  Context().add("name", "b").add("age", self.makeNumber(20)),
+                  Context().add("name", "d").add("age", self.makeNumber(30))]
+        age = LambdaExpression(lambda *args: (x := args[0], self.getLib().getValue(x, "age")))
+
+        self.assertIsNone(self.getLib().sortBy(None, age))
+        self.assertEqual(["b", "c", "d", "a"], [p.get("name") for p in self.getLib().sortBy(people, age)])
+        self.assertEqual(["c", "d", "b", "a"], [p.get("name") for p in self.getLib().sortBy(people, age, True)])
+
+        # sort() uses the key when the precedes function is built from one
+        byAge = LambdaExpression.fromKey(lambda x: x.get("age"))
+        self.assertEqual(["b", "c", "d", "a"], [p.get("name") for p in self.getLib().sort(people, byAge)])
+        self.assertTrue(byAge.apply(people[2], people[0]))
+
+        numbers = [self.makeNumber(n) for n in [3, 1, 2]]
+        descending = LambdaExpression.fromKey(lambda x: x, True)
+        self.assertEqual(self.getLib().sort(numbers, LambdaExpression(descending.lambda_)), self.getLib().sort(numbers, descending))
@@ -0,0 +1,46 @@
+#
+# Copyright 2016 Goldman Sachs.
+#
+# Licensed under the Apache License, Version 2.0 (the "License") you may not use self file except in compliance with the License.
+#
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations under the License.
+#
+from decimal import Decimal
+
+from jdmn.feel.lib import DefaultStandardFEELLibTest as base
+from jdmn.feel.lib.FastStandardFEELLib import FastStandardFEELLib
+
+
+class FastStandardFEELLibTest(base.DefaultStandardFEELLibTest):
+    """
+    Base test class for FastStandardFEELLib
+    """
+    __test__ = True
+
+    @staticmethod
+    def getLib() -> FastStandardFEELLib:
+        return FastStandardFEELLib()
+
+    def testFailingOperatorsRaise(self):
+        lib = self.getLib()
+        self.assertRaises(Exception, lambda: lib.numericAdd(Decimal(1), "a"))
+        self.assertRaises(Exception, lambda: lib.stringAdd("a", 1))
+        self.assertEqual(Decimal(2), lib.numericAdd(Decimal(1), Decimal(1)))
+        self.assertEqual(lib.numericType.numericAdd, lib.numericAdd)
+
+    def testSafeCopyReturnsNull(self):
+        lib = self.getLib().safeCopy()
+        with self.assertLogs(level="ERROR"):
+            self.assertIsNone(lib.numericAdd(Decimal(1), "a"))
+        with self.assertLogs(level="ERROR"):
+            self.assertIsNone(lib.numericDivide(Decimal(1), "a"))
+        with self.assertLogs(level="ERROR"):
+            self.assertIsNone(lib.stringAdd("a", 1))
+        with self.assertLogs(level="ERROR"):
+            self.assertIsNone(lib.durationAdd(lib.duration("P1D"), "a"))
+        self.assertEqual(Decimal(2), lib.numericAdd(Decimal(1), Decimal(1)))
@@ -0,0 +1,94 @@
+#
+# Copyright 2016 Goldman Sachs.
+#
+# Licensed under the Apache License, Version 2.0 (the "License") you may not use self file except in compliance with the License.
+#
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations under the License.
+#
+import random
+from decimal import Decimal
+from unittest import TestCase, skipIf
+
+from jdmn.feel.lib.DefaultStandardFEELLib import DefaultStandardFEELLib
+from jdmn.feel.lib.VectorFEELLib import VectorFEELLib
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+class VectorFEELLibTest(TestCase):
+    """
+    Base test class for VectorFEELLib
+    """
+
+    OPERATORS = [
+        "numericAdd", "numericSubtract", "numericMultiply", "numericDivide",
+        "numericEqual", "numericNotEqual", "numericLessThan", "numericGreaterThan", "numericLessEqualThan", "numericGreaterEqualThan"
+    ]
+
+    def setUp(self):
+        self.lib = VectorFEELLib()
+        self.scalarLib = DefaultStandardFEELLib()
+        rnd = random.Random(11)
+        values = [None, Decimal(0), Decimal("-1.5"), Decimal("2"), Decimal("1E+10"), Decimal("0.333")]
+        self.first = [rnd.choice(values) for _ in range(500)]
+        self.second = [rnd.choice(values) for _ in range(500)]
+
+    def testColumnOperatorsAreSameAsScalar(self):
+        for operator in self.OPERATORS:
+            expected = [getattr(self.scalarLib, operator)(x, y) for x, y in zip(self.first, self.second)]
+            self.assertEqual(expected, getattr(self.lib, operator)(self.first, self.second), operator)
+        self.assertEqual([self.scalarLib.numericUnaryMinus(x) for x in self.first], self.lib.numericUnaryMinus(self.first))
+
+    def testScalarBroadcast(self):
+        for operator in self.OPERATORS:
+            for scalar in [None, Decimal(2)]:
+                expected = [getattr(self.scalarLib, operator)(x, scalar) for x in self.first]
+                self.assertEqual(expected, getattr(self.lib, operator)(self.first, scalar), operator)
+                expected = [getattr(self.scalarLib, operator)(scalar, x) for x in self.first]
+                self.assertEqual(expected, getattr(self.lib, operator)(scalar, tuple(self.first)), operator)
+        self.assertEqual(Decimal(3), self.lib.numericAdd(Decimal(1), Decimal(2)))
+        self.assertEqual(Decimal(-2), self.lib.numericUnaryMinus(Decimal(2)))
+        self.assertIsNone(self.lib.numericUnaryMinus(None))
+        with self.assertLogs(level="ERROR"):
+            self.assertIsNone(self.lib.numericUnaryMinus("ab"))
+
+    def testDifferentLengths(self):
+        with self.assertLogs(level="ERROR"):
+            self.assertIsNone(self.lib.numericAdd([Decimal(1)], [Decimal(1), Decimal(2)]))
+
+    def testFailingElementsAreNull(self):
+        with self.assertLogs(level="ERROR"):
+            self.assertEqual([Decimal(2), None], self.lib.numericAdd([Decimal(1), "a"], [Decimal(1), Decimal(1)]))
+            self.assertEqual([None, Decimal(0)], self.lib.numericDivide([Decimal(1), Decimal(0)], [Decimal(0), Decimal(1)]))
+            self.assertEqual([Decimal(-1), None], self.lib.numericUnaryMinus([Decimal(1), "a"]))
+
+        first = self.first[:50] + ["a"]
+        second = self.second[:50] + [Decimal(1)]
+        with self.assertLogs(level="ERROR"):
+            for operator in self.OPERATORS:
+                expected = [getattr(self.scalarLib, operator)(x, y) for x, y in zip(first, second)]
+                self.assertEqual(expected, getattr(self.lib, operator)(first, second), operator)
+
+    @skipIf(numpy is None, "NumPy is not installed")
+    def testFailingElementsAreNullInArrays(self):
+        first = numpy.array([Decimal(1), "a", None], dtype=object)
+        with self.assertLogs(level="ERROR"):
+            result = self.lib.numericAdd(first, Decimal(1))
+        self.assertIsInstance(result, numpy.ndarray)
+        self.assertEqual([Decimal(2), None, None], list(result))
+
+    def testAggregates(self):
+        columns = [[], [None], [Decimal(1), None], [Decimal(3), Decimal("1.5"), Decimal("-2")], [Decimal(1) / Decimal(3)] * 10]
+        for column in columns:
+            self.assertEqual(self.scalarLib.sum(column), self.lib.sum(column))
+            self.assertEqual(self.scalarLib.mean(column), self.lib.mean(column))
+            self.assertEqual(self.scalarLib.min(column), self.lib.min(column))
+            self.assertEqual(self.scalarLib.max(column), self.lib.max(column))
@@ -0,0 +1,80 @@
+#
+# Copyright 2016 Goldman Sachs.
+#
+# Licensed under the Apache License, Version 2.0 (the "License") you may not use self file except in compliance with the License.
+#
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations under the License.
+#
+from datetime import date, datetime, time, timedelta, timezone
+from decimal import Decimal
+from unittest import TestCase
+
+from isodate import Duration
+
+from jdmn.feel.lib.type.range.DefaultRangeLib import COMPARATOR_MAP
+
+SAMPLES = {
+    Decimal: [Decimal("1"), Decimal("1.0"), Decimal("2"), Decimal("-3.5")],
+    str: ["", "a", "ab", "b"],
+    date: [date(2020, 1, 1), date(2020, 1, 2), date(2019, 12, 31)],
+    time: [time(10, 0, 0), time(10, 0, 1), time(10, 0, 0, tzinfo=timezone(timedelta(hours=1))), time(9, 0, 0, tzinfo=timezone.utc)],
+    datetime: [datetime(2020, 1, 1, 10), datetime(2020, 1, 1, 10, 0, 1), datetime(2020, 1, 1, 9, tzinfo=timezone.utc)],
+    Duration: [Duration(years=1), Duration(months=12), Duration(months=13)],
+    timedelta: [timedelta(days=1), timedelta(hours=24), timedelta(seconds=1)],
+}
+
+
+def referenceEqualTo(comparator, first, second):
+    # Semantics of the list-of-lambdas implementation
+    return comparator.applyOperator(first, second, [
+        lambda: True,
+        lambda: False,
+        lambda: False,
+        lambda: type(first) is type(second) and comparator.compareTo(first, second) == 0
+    ])
+
+
+def referenceLessThan(comparator, first, second):
+    return comparator.applyOperator(first, second, [
+        lambda: None,
+        lambda: None,
+        lambda: None,
+        lambda: type(first) is type(second) and comparator.compareTo(first, second) < 0
+    ])
+
+
+def referenceOr(first, second):
+    if first is True or second is True:
+        return True
+    return False if first is False and second is False else None
+
+
+class ComparableComparatorTest(TestCase):
+    """
+    Base test class for the comparators in COMPARATOR_MAP
+    """
+
+    def testComparatorsMatchReferenceSemantics(self):
+        for key, comparator in COMPARATOR_MAP.items():
+            # Nulls and a value of another type are mixed in
+            other = Decimal("1") if key is not Decimal else "1"
+            values = SAMPLES[key] + [None, other]
+            for first in values:
+                for second in values:
+                    if first is other and second is other:
+                        continue
+                    case = (key, first, second)
+                    self.assertIs(referenceEqualTo(comparator, first, second), comparator.equalTo(first, second), case)
+                    self.assertIs(referenceLessThan(comparator, first, second), comparator.lessThan(first, second), case)
+                    self.assertIs(referenceLessThan(comparator, second, first), comparator.greaterThan(first, second), case)
+                    expectedLessEqual = referenceOr(referenceLessThan(comparator, first, second), referenceEqualTo(comparator, first, second))
+                    self.assertIs(expectedLessEqual, comparator.lessEqualThan(first, second), case)
+                    expectedGreaterEqual = referenceOr(referenceLessThan(comparator, second, first), referenceEqualTo(comparator, first, second))
+                    self.assertIs(expectedGreaterEqual, comparator.greaterEqualThan(first, second), case)
+                    expectedNotEqual = None if referenceEqualTo(comparator, first, second) is None else not referenceEqualTo(comparator, first, second)
+                    self.assertIs(expectedNotEqual, comparator.notEqualTo(first, second), case)
@@ -0,0 +1,60 @@
+#
+# Copyright 2016 Goldman Sachs.
+#
+# Licensed under the Apache License, Version 2.0 (the "License") you may not use self file except in compliance with the License.
+#
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations under the License.
+#
+from datetime import date, datetime
+from decimal import Decimal
+from unittest import TestCase
+
+from jdmn.feel.lib.type.TypeDispatcher import TypeDispatcher
+from jdmn.feel.lib.type.range.DefaultRangeLib import COMPARATOR_MAP, DefaultRangeLib
+
+
+class Amount(Decimal):
+    pass
+
+
+class TypeDispatcherTest(TestCase):
+    """
+    Base test class for TypeDispatcher
+    """
+
+    def testResolve(self):
+        dispatcher = TypeDispatcher({Decimal: "number", date: "date", datetime: "date and time"})
+
+        self.assertEqual("number", dispatcher.resolve(Decimal(1)))
+        self.assertEqual("date", dispatcher.resolve(date(2020, 1, 1)))
+        # The most specific registered type wins
+        self.assertEqual("date and time", dispatcher.resolve(datetime(2020, 1, 1)))
+        self.assertIsNone(dispatcher.resolve("abc"))
+        self.assertIsNone(dispatcher.resolve(None))
+
+    def testSubclassFallbackIsCached(self):
+        dispatcher = TypeDispatcher({Decimal: "number"})
+
+        self.assertNotIn(Amount, dispatcher.cache)
+        self.assertEqual("number", dispatcher.resolve(Amount(1)))
+        self.assertEqual("number", dispatcher.cache[Amount])
+        self.assertIsNone(dispatcher.resolve(1))
+        self.assertIn(int, dispatcher.cache)
+
+    def testRegisterInvalidatesCache(self):
+        dispatcher = TypeDispatcher({Decimal: "number"})
+        self.assertEqual("number", dispatcher.resolve(Amount(1)))
+
+        dispatcher.register(Amount, "amount")
+        self.assertEqual("amount", dispatcher.resolve(Amount(1)))
+        self.assertEqual("number", dispatcher.resolve(Decimal(1)))
+
+    def testResolveComparator(self):
+        self.assertIs(COMPARATOR_MAP[Decimal], DefaultRangeLib.resolveComparator(Decimal(1)))
+        self.assertIs(COMPARATOR_MAP[Decimal], DefaultRangeLib.resolveComparator(Amount(1)))
+        self.assertIsNone(DefaultRangeLib.resolveComparator(True))
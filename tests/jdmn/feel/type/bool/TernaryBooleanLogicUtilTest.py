@@ -0,0 +1,78 @@
+#
+# Copyright 2016 Goldman Sachs.
+#
+# Licensed under the Apache License, Version 2.0 (the "License") you may not use self file except in compliance with the License.
+#
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations under the License.
+#
+from decimal import Decimal
+from unittest import TestCase
+
+from jdmn.feel.lib.type.bool.TernaryBooleanLogicUtil import TernaryBooleanLogicUtil, ternaryAll, ternaryAny, ternaryAnd, ternaryNot, ternaryOr
+
+VALUES = [True, False, None, Decimal(1), Decimal(0), 1, "true"]
+
+
+def isTrue(obj):
+    return isinstance(obj, bool) and obj is True
+
+
+def isFalse(obj):
+    return isinstance(obj, bool) and obj is False
+
+
+def expectedAnd(first, second):
+    if isFalse(first) or isFalse(second):
+        return False
+    return True if isTrue(first) and isTrue(second) else None
+
+
+def expectedOr(first, second):
+    if isTrue(first) or isTrue(second):
+        return True
+    return False if isFalse(first) and isFalse(second) else None
+
+
+def failAfter(*operands):
+    yield from operands
+    raise AssertionError("not short-circuited")
+
+
+class TernaryBooleanLogicUtilTest(TestCase):
+    """
+    Base test class for TernaryBooleanLogicUtil
+    """
+
+    def testNot(self):
+        self.assertIs(False, ternaryNot(True))
+        self.assertIs(True, ternaryNot(False))
+        for value in [None, Decimal(1), 0, "false"]:
+            self.assertIsNone(ternaryNot(value))
+            self.assertIsNone(TernaryBooleanLogicUtil().not_(value))
+
+    def testBinaryOperators(self):
+        for first in VALUES:
+            for second in VALUES:
+                self.assertIs(expectedAnd(first, second), ternaryAnd(first, second), (first, second))
+                self.assertIs(expectedOr(first, second), ternaryOr(first, second), (first, second))
+                self.assertIs(expectedAnd(first, second), TernaryBooleanLogicUtil().and_(first, second), (first, second))
+                self.assertIs(expectedOr(first, second), TernaryBooleanLogicUtil().or_(first, second), (first, second))
+
+    def testNaryOperators(self):
+        self.assertIs(True, ternaryAll([]))
+        self.assertIs(False, ternaryAny([]))
+        self.assertIs(True, ternaryAll([True, True]))
+        self.assertIsNone(ternaryAll([True, None, Decimal(1)]))
+        self.assertIs(False, ternaryAll([None, False, "x"]))
+        self.assertIs(False, ternaryAny([False, False]))
+        self.assertIsNone(ternaryAny([False, None, Decimal(0)]))
+        self.assertIs(True, ternaryAny([None, True, "x"]))
+
+    def testNaryOperatorsShortCircuit(self):
+        self.assertIs(False, ternaryAll(failAfter(True, None, False)))
+        self.assertIs(True, ternaryAny(failAfter(False, None, True)))
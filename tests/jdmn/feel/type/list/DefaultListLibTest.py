@@ -0,0 +1,57 @@
+#
+# Copyright 2016 Goldman Sachs.
+#
+# Licensed under the Apache License, Version 2.0 (the "License") you may not use self file except in compliance with the License.
+#
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations under the License.
+#
+import random
+from datetime import date, timedelta
+from decimal import Decimal
+from unittest import TestCase
+
+from isodate import Duration
+
+from jdmn.feel.lib.type.list.DefaultListLib import DefaultListLib
+from jdmn.runtime.Context import Context
+from jdmn.runtime.Range import Range
+
+
+class DefaultListLibTest(TestCase):
+    """
+    Base test class for DefaultListLib
+    """
+
+    def setUp(self):
+        self.lib = DefaultListLib()
+
+    def testDistinctValuesIsSameAsLinearScan(self):
+        values = [
+            None, True, False, Decimal(1), Decimal("1.0"), Decimal(0), Decimal("2.50"), Decimal("2.5"), "a", "b",
+            date(2020, 1, 1), timedelta(days=1), Duration(days=1), Duration(years=1), Duration(months=12), Duration(months=1),
+            Range(True, Decimal(1), False, Decimal(2)), Range(True, Decimal("1.0"), False, Decimal(2)), Range("<", Decimal(1)),
+            Context().add("a", Decimal(1)), Context().add("a", Decimal("1.0")), Context(),
+            [Decimal(1)], [Decimal("1.0")], []
+        ]
+        rnd = random.Random(5)
+        for _ in range(200):
+            list_ = [rnd.choice(values) for _ in range(rnd.randint(0, 30))]
+            # Same elements, not only equal ones
+            self.assertEqual([id(x) for x in self.linearDistinctValues(list_)], [id(x) for x in self.lib.distinctValues(list_)])
+
+    def testUnion(self):
+        self.assertEqual([Decimal(1), Decimal(2), Decimal(3)], self.lib.union([Decimal(1), Decimal(2)], [Decimal("2.0"), Decimal(3)]))
+        self.assertEqual([], self.lib.distinctValues(None))
+
+    @staticmethod
+    def linearDistinctValues(list_):
+        result = []
+        for element in list_:
+            if element not in result:
+                result.append(element)
+        return result
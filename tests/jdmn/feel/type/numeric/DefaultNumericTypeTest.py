@@ -0,0 +1,75 @@
+#
+# Copyright 2016 Goldman Sachs.
+#
+# Licensed under the Apache License, Version 2.0 (the "License") you may not use self file except in compliance with the License.
+#
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations under the License.
+#
+import decimal
+import random
+from decimal import Decimal
+from unittest import TestCase
+
+from jdmn.feel.lib.type.numeric.DefaultNumericType import DefaultNumericType
+
+
+class DefaultNumericTypeTest(TestCase):
+    """
+    Base test class for DefaultNumericType
+    """
+
+    def setUp(self):
+        self.type = DefaultNumericType()
+        rnd = random.Random(42)
+        literals = ["0", "-0", "1", "-1", "0.1", "3", "7", "1E+30", "1E-30", "123456789012345678901234567890123.45",
+                    "9999999999999999999999999999999999", "0.00000000000000000000000000000000001", "2.5", "-2.5"]
+        for _ in range(200):
+            digits = "".join(rnd.choice("0123456789") for _ in range(rnd.randint(1, 40)))
+            literals.append(f"{rnd.choice(['', '-'])}{digits}E{rnd.randint(-20, 20)}")
+        self.numbers = [Decimal(literal) for literal in literals]
+
+    def testArithmeticIsSameAsLocalContext(self):
+        rnd = random.Random(7)
+        for _ in range(2000):
+            first = rnd.choice(self.numbers)
+            second = rnd.choice(self.numbers)
+            self.assertSame(self.localContext(lambda: first + second), self.type.numericAdd(first, second))
+            self.assertSame(self.localContext(lambda: first - second), self.type.numericSubtract(first, second))
+            self.assertSame(self.localContext(lambda: first * second), self.type.numericMultiply(first, second))
+            expected = None if second.is_zero() else self.localContext(lambda: first / second)
+            self.assertSame(expected, self.type.numericDivide(first, second))
+            self.assertSame(self.localContext(lambda: first.copy_negate()), self.type.numericUnaryMinus(first))
+
+    def testExponentiationIsSameAsLocalContext(self):
+        for first in [Decimal("2"), Decimal("-3"), Decimal("1.5"), Decimal("10"), Decimal("0.1")]:
+            for second in [Decimal(n) for n in range(-10, 40)] + [Decimal("0.5")]:
+                try:
+                    expected = self.localContext(lambda: first ** second)
+                except decimal.InvalidOperation:
+                    self.assertRaises(decimal.InvalidOperation, lambda: self.type.numericExponentiation(first, second))
+                    continue
+                self.assertSame(expected, self.type.numericExponentiation(first, second))
+
+    def testNullOperands(self):
+        self.assertIsNone(self.type.numericAdd(None, Decimal(1)))
+        self.assertIsNone(self.type.numericSubtract(Decimal(1), None))
+        self.assertIsNone(self.type.numericMultiply(None, None))
+        self.assertIsNone(self.type.numericDivide(Decimal(1), Decimal(0)))
+        self.assertIsNone(self.type.numericUnaryMinus(None))
+        self.assertIsNone(self.type.numericExponentiation(None, Decimal(1)))
+
+    def assertSame(self, expected, actual):
+        # Same value and same representation, e.g. exponent and sign of zero
+        self.assertEqual(str(expected), str(actual))
+
+    @staticmethod
+    def localContext(function):
+        with decimal.localcontext() as ctx:
+            ctx.rounding = DefaultNumericType.DECIMAL128.rounding
+            ctx.prec = DefaultNumericType.DECIMAL128.prec
+            return function()
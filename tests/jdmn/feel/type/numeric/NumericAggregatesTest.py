@@ -0,0 +1,69 @@
+#
+# Copyright 2016 Goldman Sachs.
+#
+# Licensed under the Apache License, Version 2.0 (the "License") you may not use self file except in compliance with the License.
+#
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations under the License.
+#
+import random
+import statistics
+from decimal import Decimal
+from unittest import TestCase
+
+from jdmn.feel.lib.type.numeric.NumericAggregates import NumericAggregates
+
+
+class NumericAggregatesTest(TestCase):
+    """
+    Base test class for NumericAggregates
+    """
+
+    def setUp(self):
+        rnd = random.Random(16)
+        self.numbers = [Decimal(rnd.randint(-10 ** 6, 10 ** 6)) / 100 for _ in range(1001)]
+
+    def testAggregates(self):
+        aggregates = NumericAggregates.of(iter(self.numbers))
+        self.assertEqual(len(self.numbers), aggregates.count)
+        self.assertEqual(sum(self.numbers), aggregates.sum)
+        self.assertEqual(min(self.numbers), aggregates.min)
+        self.assertEqual(max(self.numbers), aggregates.max)
+        self.assertAlmostEqual(statistics.mean(self.numbers), aggregates.mean(), delta=Decimal("1E-25"))
+        self.assertAlmostEqual(statistics.stdev(self.numbers), aggregates.stddev(), delta=Decimal("1E-20"))
+
+        self.assertIsNone(NumericAggregates.of([Decimal(1), None]))
+        self.assertIsNone(NumericAggregates.of([]).mean())
+        self.assertIsNone(NumericAggregates.of([Decimal(1)]).stddev())
+
+    def testVarianceIsStableForLargeOffsets(self):
+        offset = Decimal("1E+20")
+        aggregates = NumericAggregates.of([offset + 4, offset + 7, offset + 13, offset + 16])
+        self.assertEqual(Decimal(30), aggregates.variance())
+
+    def testMedian(self):
+        for size in [1, 2, 3, 64, 65, 200, 1001]:
+            values = self.numbers[:size]
+            self.assertEqual(statistics.median(values), NumericAggregates.median(iter(values)), size)
+
+        # Precision beyond float
+        values = [Decimal("1.0000000000000000000001"), Decimal("1.0000000000000000000003"), Decimal("1.0000000000000000000002")]
+        self.assertEqual(Decimal("1.0000000000000000000002"), NumericAggregates.median(values))
+
+        duplicates = [Decimal(v) for v in [5, 1, 5, 5, 2, 5] * 20]
+        self.assertEqual(Decimal(5), NumericAggregates.median(duplicates))
+        self.assertIsNone(NumericAggregates.median([]))
+
+    def testSelect(self):
+        ordered = sorted(self.numbers)
+        for k in [0, 1, 500, 999, 1000]:
+            self.assertEqual(ordered[k], NumericAggregates.select(self.numbers, k))
+
+    def testMode(self):
+        self.assertEqual([], NumericAggregates.mode(iter([])))
+        self.assertIsNone(NumericAggregates.mode([Decimal(1), "1"]))
+        self.assertEqual([Decimal(1), Decimal(6)], NumericAggregates.mode(iter([Decimal(v) for v in [6, 1, 9, 6, 1]])))
@@ -223,6 +223,40 @@ class AbstractRangeLibTest(TestCase):
         self.assertFalse(self.feelLib.coincides(self.makeRange("(", 1, 5, ")"), self.makeRange("[", 1, 5, "]")))
         self.assertFalse(self.feelLib.coincides(self.makeRange("[", 1, 5, "]"), self.makeRange("[", 2, 6, "]")))
 
+    def testRangeIndex(self):
+        self.assertIsNone(self.feelLib.rangeIndex(None))
+        self.assertIsNone(self.feelLib.rangesContaining(None, self.makePoint(1)))
+
+        bands = [self.makeRange("[", 1, 10, ")"), self.makeRange("[", 10, 20, ")"), self.makeRange("[", 5, 15, "]"), self.makeRange("(", 20, 30, "]")]
+        index = self.feelLib.rangeIndex(bands)
+        self.assertIsNone(self.feelLib.rangesContaining(index, None))
+
+        self.assertEqual([bands[0], bands[2]], self.feelLib.rangesContaining(index, self.makePoint(5)))
+        self.assertEqual([bands[1], bands[2]], self.feelLib.rangesContaining(index, self.makePoint(10)))
+        self.assertEqual([bands[1]], self.feelLib.rangesContaining(index, self.makePoint(19)))
+        self.assertEqual([], self.feelLib.rangesContaining(index, self.makePoint(20)))
+
+        self.assertEqual([bands[1], bands[2]], self.feelLib.rangesOverlapping(index, self.makeRange("[", 10, 20, "]")))
+        self.assertEqual([bands[1], bands[2], bands[3]], self.feelLib.rangesOverlapping(index, self.makeRange("[", 15, 21, "]")))
+        self.assertEqual([bands[1], bands[2]], self.feelLib.rangesIncluding(index, self.makeRange("[", 10, 15, "]")))
+        self.assertEqual([bands[2]], self.feelLib.rangesIncluding(index, self.makeRange("[", 8, 15, "]")))
+        self.assertEqual([bands[1], bands[2]], self.feelLib.rangesDuring(index, self.makeRange("[", 5, 20, "]")))
+
+    def testRangeIndexIsSameAsLib(self):
+        # All the ranges with endpoints in 1..4, including degenerate ranges and ranges without end
+        ranges = [Range(startIncluded, self.makePoint(start), endIncluded, self.makePoint(end))
+                  for start in range(1, 5) for end in range(start, 5) for startIncluded in (True, False) for endIncluded in (True, False)]
+        ranges += [Range(operator, self.makePoint(n)) for operator in (">", ">=", "<") for n in (2, 3)]
+        index = self.feelLib.rangeIndex(ranges)
+
+        for point in range(1, 6):
+            expected = [r for r in ranges if self.feelLib.includes(r, self.makePoint(point)) is True]
+            self.assertEqual(expected, self.feelLib.rangesContaining(index, self.makePoint(point)))
+        for query in ranges:
+            self.assertEqual([r for r in ranges if self.feelLib.overlaps(r, query) is True], self.feelLib.rangesOverlapping(index, query))
+            self.assertEqual([r for r in ranges if self.feelLib.includes(r, query) is True], self.feelLib.rangesIncluding(index, query))
+            self.assertEqual([r for r in ranges if self.feelLib.during(r, query) is True], self.feelLib.rangesDuring(index, query))
+
     def makeRange(self, startIncluded: STRING, start: int, end: int, endIncluded: STRING) -> RANGE:
         return Range(startIncluded == "[", self.makePoint(start), endIncluded == "]", self.makePoint(end))
 
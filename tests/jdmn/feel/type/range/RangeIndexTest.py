@@ -0,0 +1,114 @@
+#
+# Copyright 2016 Goldman Sachs.
+#
+# Licensed under the Apache License, Version 2.0 (the "License") you may not use self file except in compliance with the License.
+#
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations under the License.
+#
+import random
+from datetime import date
+from decimal import Decimal
+from unittest import TestCase
+
+from isodate import Duration
+
+from jdmn.feel.lib.type.range.DefaultRangeLib import DefaultRangeLib
+from jdmn.feel.lib.type.range.RangeIndex import RangeIndex
+from jdmn.runtime.Range import Range
+
+# Integer endpoints, half steps tell open from closed bounds
+SAMPLES = [Decimal(n) / 2 for n in range(-4, 32)]
+
+
+def randomRange(rnd):
+    # Degenerate ranges such as (3..3] are frequent, DefaultRangeLib is null for most tests on ranges without start or end
+    start = Decimal(rnd.randint(0, 10))
+    end = start + rnd.randint(0, 3)
+    if rnd.random() < 0.05:
+        return rnd.choice([Range(), Range("!=", start)])
+    if rnd.random() < 0.1:
+        return Range(rnd.choice(["<", "<="]), end)
+    if rnd.random() < 0.1:
+        return Range(rnd.choice([">", ">="]), start)
+    return Range(rnd.random() < 0.5, start, rnd.random() < 0.5, end)
+
+
+class RangeIndexTest(TestCase):
+    """
+    Base test class for RangeIndex
+    """
+
+    def setUp(self):
+        rnd = random.Random(20)
+        self.lib = DefaultRangeLib()
+        self.ranges = [randomRange(rnd) for _ in range(200)]
+        self.queries = [randomRange(rnd) for _ in range(150)] + [Range(), Range(False, Decimal(3), False, Decimal(3))]
+        self.index = RangeIndex(self.ranges, self.lib)
+
+    def testStab(self):
+        for point in SAMPLES:
+            expected = [r for r in self.ranges if self.lib.includes(r, point) is True]
+            self.assertEqual(expected, self.index.stab(point), point)
+
+    def testOverlapping(self):
+        for query in self.queries:
+            expected = [r for r in self.ranges if self.lib.overlaps(r, query) is True]
+            self.assertEqual(expected, self.index.overlapping(query), str(query))
+
+    def testIncluding(self):
+        for query in self.queries:
+            expected = [r for r in self.ranges if self.lib.includes(r, query) is True]
+            self.assertEqual(expected, self.index.including(query), str(query))
+
+    def testDuring(self):
+        for query in self.queries:
+            expected = [r for r in self.ranges if self.lib.during(r, query) is True]
+            self.assertEqual(expected, self.index.during(query), str(query))
+
+    def testDegenerateRanges(self):
+        ranges = [Range(False, Decimal(9), True, Decimal(9)), Range(True, Decimal(9), False, Decimal(9)), Range(False, Decimal(9), False, Decimal(9))]
+        index = RangeIndex(ranges, self.lib)
+
+        self.assertEqual(ranges[:2], index.stab(Decimal(9)))
+        self.assertEqual(ranges, index.overlapping(Range(True, Decimal(9), True, Decimal(10))))
+        self.assertEqual(ranges, index.during(Range(True, Decimal(8), True, Decimal(10))))
+        self.assertEqual([], index.stab(Decimal(8)))
+
+    def testEndpointTypes(self):
+        ranges = [Range(True, date(2020, 1, 1), False, date(2021, 1, 1)), Range(True, Decimal(1), True, Decimal(5)), Range(True, "a", True, "m")]
+        index = RangeIndex(ranges, self.lib)
+
+        self.assertEqual([ranges[0]], index.stab(date(2020, 6, 1)))
+        self.assertEqual([], index.stab(date(2021, 1, 1)))
+        self.assertEqual([ranges[1]], index.stab(Decimal(5)))
+        self.assertEqual([ranges[2]], index.stab("c"))
+        self.assertEqual([], index.stab(None))
+        self.assertEqual([ranges[1]], index.overlapping(Range(True, Decimal(0), True, Decimal(2))))
+
+    def testInvertedDurations(self):
+        # The Range constructor does not check the order of Duration endpoints
+        ranges = [Range(True, Duration(years=2), True, Duration(years=1)), Range(True, Duration(years=1), True, Duration(years=3))]
+        index = RangeIndex(ranges, self.lib)
+        queries = [Range(True, Duration(years=1), True, Duration(years=2)), Range(True, Duration(years=3), True, Duration(years=1))]
+
+        for point in [Duration(years=n) for n in range(5)]:
+            self.assertEqual([r for r in ranges if self.lib.includes(r, point) is True], index.stab(point))
+        for query in queries:
+            self.assertEqual([r for r in ranges if self.lib.overlaps(r, query) is True], index.overlapping(query))
+            self.assertEqual([r for r in ranges if self.lib.includes(r, query) is True], index.including(query))
+            self.assertEqual([r for r in ranges if self.lib.during(r, query) is True], index.during(query))
+
+    def testRangesWithoutEndpoints(self):
+        ranges = [Range("!=", Decimal(1)), Range(), Range("<", Decimal(5)), Range(True, Decimal(1), True, Decimal(5))]
+        index = RangeIndex(ranges, self.lib)
+
+        self.assertEqual([ranges[3]], index.stab(Decimal(1)))
+        self.assertEqual([], index.stab("a"))
+        self.assertEqual([ranges[3]], index.overlapping(Range(True, Decimal(0), True, Decimal(2))))
+        self.assertEqual([], index.overlapping(Range(">", Decimal(0))))
+        self.assertEqual([], index.during(Range()))
@@ -10,7 +10,13 @@
 # "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.  See the License for the
 # specific language governing permissions and limitations under the License.
 #
+import pickle
+from datetime import datetime, time, timedelta, timezone
+from decimal import Decimal
 from unittest import TestCase
+from unittest.mock import patch
+
+from isodate import Duration
 
 from jdmn.runtime.Range import Range
 
@@ -116,6 +122,58 @@ class RangeTest(TestCase):
         with self.assertRaises(DMNRuntimeException):
             Range("=", 4)
 
+    def testHashIsCached(self):
+        r = Range(True, self.makeNumber(1), False, self.makeNumber(3))
+        self.assertIsNone(r.hashCode)
+        self.assertEqual(hash(Range(True, self.makeNumber(1), False, self.makeNumber(3))), hash(r))
+        self.assertEqual(r.__hash__(), r.hashCode)
+        self.assertFalse(hasattr(r, "__dict__"))
+
+    def testPickleDropsCachedHash(self):
+        r = Range("<=", self.makeNumber(3))
+        hash(r)
+        copy = pickle.loads(pickle.dumps(r))
+        self.assertEqual(r, copy)
+        self.assertIsNone(copy.hashCode)
+        self.assertEqual(hash(r), hash(copy))
+
+    def testOf(self):
+        r = Range.of(">", self.makeNumber(10))
+        self.assertIs(r, Range.of(">", self.makeNumber(10)))
+        self.assertEqual(Range(">", self.makeNumber(10)), r)
+        self.assertIsNot(r, Range.of(">=", self.makeNumber(10)))
+
+        interval = Range.of(True, self.makeNumber(1), False, self.makeNumber(5))
+        self.assertIs(interval, Range.of(True, self.makeNumber(1), False, self.makeNumber(5)))
+        self.assertIsNot(interval, Range.of(True, self.makeNumber(1), True, self.makeNumber(5)))
+
+        # Equal endpoints of different types are not shared
+        self.assertIs(timedelta, type(Range.of("<", timedelta(days=1)).getEnd()))
+        self.assertIs(Duration, type(Range.of("<", Duration(days=1)).getEnd()))
+
+        # Equal endpoints with different representations are not shared
+        self.assertEqual("1.0", str(Range.of("<", Decimal("1.0")).getEnd()))
+        self.assertEqual("1", str(Range.of("<", Decimal("1")).getEnd()))
+        utc = datetime(2020, 1, 1, 12, tzinfo=timezone.utc)
+        plusOne = datetime(2020, 1, 1, 13, tzinfo=timezone(timedelta(hours=1)))
+        self.assertIs(utc, Range.of(True, utc, True, utc).getStart())
+        self.assertIs(plusOne, Range.of(True, plusOne, True, plusOne).getStart())
+        utcTime = time(12, tzinfo=timezone.utc)
+        plusOneTime = time(13, tzinfo=timezone(timedelta(hours=1)))
+        self.assertIs(utcTime, Range.of(">", utcTime).getStart())
+        self.assertIs(plusOneTime, Range.of(">", plusOneTime).getStart())
+        self.assertEqual(1, Range.of("<", Duration(years=1)).getEnd().years)
+        self.assertEqual(12, Range.of("<", Duration(months=12)).getEnd().months)
+
+        self.assertEqual(Range(), Range.of())
+        with self.assertRaises(DMNRuntimeException):
+            Range.of("abc", 4)
+
+    def testOfIsBounded(self):
+        with patch("jdmn.runtime.Range.INTERN_TABLE_SIZE", 0):
+            r = Range.of("<", self.makeNumber(12345))
+            self.assertIsNot(r, Range.of("<", self.makeNumber(12345)))
+
     @staticmethod
     def makeNumber(number: int):
         return DefaultNumericLib.number(str(number))
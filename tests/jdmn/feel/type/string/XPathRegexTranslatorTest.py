@@ -0,0 +1,82 @@
+#
+# Copyright 2016 Goldman Sachs.
+#
+# Licensed under the Apache License, Version 2.0 (the "License") you may not use self file except in compliance with the License.
+#
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations under the License.
+#
+from unittest import TestCase
+
+from jdmn.feel.lib.DefaultStandardFEELLib import DefaultStandardFEELLib
+from jdmn.feel.lib.type.string.DefaultStringLib import DefaultStringLib
+from jdmn.feel.lib.type.string.XPathRegexTranslator import XPathRegexTranslator
+
+
+class XPathRegexTranslatorTest(TestCase):
+    """
+    Base test class for XPathRegexTranslator
+    """
+
+    INPUTS = ["", "abc", "abracadabra", "ABC def", "line1\nline2\n", "a.b*c", "tab\there", "12 34", "x$y", "über Straße", " a b "]
+    PATTERNS = ["", "a", "^a", "a$", "^abc$", "a.c", "a.*a", "a.*?a", "[a-c]+", "[^a-c]", "\\d+", "\\D", "\\s", "\\S+", "b{1,2}", "(a)(b)?",
+                "(ab)|(a)", "b{1,2}?", "a??", "^line2$", "line1.line2", "\\.", "\\$", "[.*]", "(a)\\1", "x\\$y", "ß", "a b", "[a b]", "\\n"]
+    FLAGS = ["", "i", "m", "s", "x", "q", "sm", "ix"]
+    REPLACEMENTS = ["#", "[$1]", "$0$0", "\\$", "\\\\", "$12", ""]
+
+    def testMatchesIsSameAsXPath(self):
+        for pattern in self.PATTERNS:
+            for flags in self.FLAGS:
+                for input_ in self.INPUTS:
+                    expected = self.xpathMatches(input_, pattern, flags)
+                    if XPathRegexTranslator.compileMatches(pattern, flags) is not None:
+                        actual = DefaultStringLib().evaluateMatches(input_, pattern, flags)
+                        self.assertEqual(expected, actual, (input_, pattern, flags))
+
+    def testReplaceIsSameAsXPath(self):
+        for pattern in self.PATTERNS:
+            for flags in self.FLAGS:
+                for replacement in self.REPLACEMENTS:
+                    function = XPathRegexTranslator.compileReplace(pattern, replacement, flags)
+                    if function is None:
+                        continue
+                    for input_ in self.INPUTS:
+                        expected = self.xpathReplace(input_, pattern, replacement, flags)
+                        self.assertEqual(expected, function(input_), (input_, pattern, replacement, flags))
+
+    def testUntranslatedConstructs(self):
+        for pattern in ["\\w", "\\p{Lu}", "\\i\\c*", "[a-z-[aeiou]]", "(?i)a", "a{,2}", "\\b", "[]a]"]:
+            self.assertIsNone(XPathRegexTranslator.compileMatches(pattern, ""), pattern)
+        for pattern in ["a++", ".*+", "a?+", "a**", "a{2}+", "a{2}{3}", "a*??", "a]", "a}", "[a--]"]:
+            self.assertIsNone(XPathRegexTranslator.compileMatches(pattern, ""), pattern)
+        self.assertIsNone(XPathRegexTranslator.compileMatches("\\D^", "m"))
+        self.assertIsNone(XPathRegexTranslator.compileMatches("a", "k"))
+        self.assertIsNone(XPathRegexTranslator.compileReplace("a*", "b", ""))
+        self.assertIsNone(XPathRegexTranslator.compileReplace("a", "$", ""))
+
+    def testFallback(self):
+        lib = DefaultStringLib()
+        self.assertTrue(lib.matches("Ab", "\\w+", ""))
+        self.assertTrue(lib.matches("a&amp;b", "a&b", ""))
+        self.assertEqual("a-b", lib.replace("a\r\nb", "\\n", "-", ""))
+        self.assertFalse(lib.matches("\n", "\\D^", "m"))
+        with self.assertLogs(level="ERROR"):
+            self.assertIsNone(DefaultStandardFEELLib().matches("a-b", ".++"))
+
+    @staticmethod
+    def xpathMatches(input_, pattern, flags):
+        try:
+            return len(DefaultStringLib.evaluateXPath(input_, f"/root[matches(., '{pattern}', '{flags}')]")) != 0
+        except Exception:
+            return None
+
+    @staticmethod
+    def xpathReplace(input_, pattern, replacement, flags):
+        try:
+            return DefaultStringLib.evaluateXPath(input_, f"replace(/root, '{pattern}', '{replacement}', '{flags}')")
+        except Exception:
+            return None
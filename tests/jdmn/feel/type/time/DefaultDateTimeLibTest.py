@@ -0,0 +1,63 @@
+#
+# Copyright 2016 Goldman Sachs.
+#
+# Licensed under the Apache License, Version 2.0 (the "License") you may not use self file except in compliance with the License.
+#
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations under the License.
+#
+from unittest import TestCase
+
+from jdmn.feel.lib.DefaultStandardFEELLib import DefaultStandardFEELLib
+from jdmn.feel.lib.type.time.DefaultDateTimeLib import DefaultDateTimeLib
+from jdmn.runtime.DMNRuntimeException import DMNRuntimeException
+
+
+class DefaultDateTimeLibTest(TestCase):
+    """
+    Base test class for DefaultDateTimeLib
+    """
+
+    DATES = ["2020-01-01", "1999-12-31", "2016-02-29"]
+    TIMES = ["12:00:00", "T12:00:00", "12:00:00Z", "12:00:00.123+0100", "12:00:00-05:30", "12:00:00@Europe/Paris"]
+    DATE_TIMES = ["2020-01-01", "2020-01-01T12:00:00", "2020-01-01T12:00:00z", "2020-01-01T12:00:00.5+01:00", "2020-01-01T12:00:00@Etc/UTC"]
+
+    def testCachedLiteralsAreSameAsParsed(self):
+        cached = DefaultDateTimeLib()
+        uncached = DefaultDateTimeLib(literalCacheSize=None)
+        for _ in range(2):
+            for literal in self.DATES:
+                self.assertEqual(uncached.date(literal), cached.date(literal))
+            for literal in self.TIMES:
+                self.assertEqual(self.describe(uncached.time(literal)), self.describe(cached.time(literal)))
+            for literal in self.DATE_TIMES:
+                self.assertEqual(self.describe(uncached.dateAndTime(literal)), self.describe(cached.dateAndTime(literal)))
+
+        statistics = cached.literalCacheStatistics()
+        literalCount = len(self.DATES) + len(self.TIMES) + len(self.DATE_TIMES)
+        self.assertEqual(literalCount, statistics["hits"])
+        self.assertEqual(literalCount, statistics["misses"])
+        self.assertEqual(0.5, statistics["hitRate"])
+        self.assertEqual({}, uncached.literalCacheStatistics())
+
+    def testInvalidLiteralsAreNotCached(self):
+        lib = DefaultDateTimeLib()
+        for _ in range(2):
+            self.assertRaises(DMNRuntimeException, lambda: lib.date("2020/01/01"))
+        self.assertEqual(0, lib.literalCacheStatistics()["entries"])
+
+    def testPreParseLiterals(self):
+        lib = DefaultStandardFEELLib()
+        literals = lib.preParseLiterals("date", "2020-01-01", "2021-06-30")
+        self.assertEqual({"2020-01-01": lib.date("2020-01-01"), "2021-06-30": lib.date("2021-06-30")}, literals)
+
+        with self.assertLogs(level="ERROR"):
+            self.assertIsNone(lib.preParseLiterals("xxx", "2020-01-01"))
+
+    @staticmethod
+    def describe(value):
+        return value, None if value is None else repr(value.tzinfo)
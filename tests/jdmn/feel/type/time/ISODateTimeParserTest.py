@@ -0,0 +1,88 @@
+#
+# Copyright 2016 Goldman Sachs.
+#
+# Licensed under the Apache License, Version 2.0 (the "License") you may not use self file except in compliance with the License.
+#
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations under the License.
+#
+import random
+from datetime import datetime
+from unittest import TestCase
+
+import isodate
+
+from jdmn.feel.lib.DefaultStandardFEELLib import DefaultStandardFEELLib
+from jdmn.feel.lib.type.time.DefaultDateTimeLib import DefaultDateTimeLib
+from jdmn.feel.lib.type.time.ISODateTimeParser import ISODateTimeParser
+
+
+class ISODateTimeParserTest(TestCase):
+    """
+    Base test class for ISODateTimeParser
+    """
+
+    def setUp(self):
+        rnd = random.Random(2024)
+        self.times = []
+        self.dateTimes = []
+        for _ in range(3000):
+            time_ = f"{rnd.choice(['00', '09', '12', '23', '24'])}:{rnd.choice(['00', '30', '59', '60'])}:{rnd.choice(['00', '07', '59', '60'])}"
+            if rnd.random() < 0.5:
+                time_ += "." + "".join(rnd.choice("0123456789") for _ in range(rnd.randint(1, 9)))
+            time_ += rnd.choice(["", "", "Z", "z", "+0100", "-0530", "+01:00", "-05:30", "+00:00", "-00:00", "+1400", "+99:99"])
+            date_ = f"{rnd.choice(['0000', '0001', '2020', '2021', '9999'])}-{rnd.choice(['01', '02', '12', '13'])}-{rnd.choice(['01', '28', '29', '31', '32'])}"
+            self.times.append(rnd.choice(["", "T"]) + time_)
+            self.dateTimes.append(date_ + "T" + time_)
+
+    def testParseTimeIsSameAsIsodate(self):
+        for literal in self.times:
+            self.assertEqual(self.describe(lambda: self.isodateParseTime(literal)), self.describe(lambda: self.fastParse(ISODateTimeParser.parseTime, literal)), literal)
+
+    def testParseDateTimeIsSameAsIsodate(self):
+        for literal in self.dateTimes:
+            self.assertEqual(self.describe(lambda: self.isodateParseDateTime(literal)), self.describe(lambda: self.fastParse(ISODateTimeParser.parseDateTime, literal)), literal)
+
+    def testOutsideGrammar(self):
+        self.assertIsNone(ISODateTimeParser.parseTime("12:00"))
+        self.assertIsNone(ISODateTimeParser.parseTime("12:00:00\n"))
+        self.assertIsNone(ISODateTimeParser.parseDateTime("2020-01-01 12:00:00"))
+
+    def testNonASCIIDigits(self):
+        lib = DefaultStandardFEELLib()
+        self.assertIsNone(ISODateTimeParser.parseTime("٠١:00:59+01:00"))
+        self.assertIsNone(ISODateTimeParser.parseDateTime("٢٠٢٠-01-01T10:00:00Z"))
+        with self.assertLogs(level="ERROR"):
+            self.assertIsNone(lib.date("١٢٣٤-01-29"))
+        with self.assertLogs(level="ERROR"):
+            self.assertIsNone(lib.time("٠١:00:59+01:00"))
+        with self.assertLogs(level="ERROR"):
+            self.assertIsNone(lib.dateAndTime("٢٠٢٠-01-01T10:00:00Z"))
+
+    @staticmethod
+    def fastParse(parse, literal):
+        result = parse(literal)
+        if result is None:
+            raise ValueError(literal)
+        return result
+
+    @staticmethod
+    def isodateParseTime(literal):
+        return isodate.parse_time(DefaultDateTimeLib.fixDateTimeFormat(literal))
+
+    @staticmethod
+    def isodateParseDateTime(literal):
+        datestring, timestring = DefaultDateTimeLib.fixDateTimeFormat(literal).split("T")
+        return datetime.combine(isodate.parse_date(datestring, defaultday=0, defaultmonth=0), isodate.parse_time(timestring))
+
+    @staticmethod
+    def describe(parse):
+        try:
+            value = parse()
+        except Exception:
+            return "error"
+        return repr(value), repr(value.tzinfo), None if value.tzinfo is None else value.tzinfo.utcoffset(None)
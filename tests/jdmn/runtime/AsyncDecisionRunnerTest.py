@@ -0,0 +1,135 @@
+#
+# Copyright 2016 Goldman Sachs.
+#
+# Licensed under the Apache License, Version 2.0 (the "License") you may not use self file except in compliance with the License.
+#
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations under the License.
+#
+import asyncio
+import os
+import threading
+from decimal import Decimal
+from unittest import TestCase
+
+from jdmn.runtime.AsyncDecisionRunner import AsyncDecisionRunner
+from jdmn.runtime.DMNDecision import DMNDecision
+from jdmn.runtime.ExecutionContext import ExecutionContext
+
+
+class SquareDecision(DMNDecision):
+    def applyRequest(self, input_: dict, executionContext_: ExecutionContext):
+        return input_["x"] * input_["x"], os.getpid()
+
+
+class BlockingDecision(DMNDecision):
+    # Records the evaluations in flight and waits until released
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.release = threading.Event()
+        self.started = []
+        self.running = 0
+        self.maxRunning = 0
+
+    def applyRequest(self, input_: dict, executionContext_: ExecutionContext):
+        with self.lock:
+            self.started.append(input_["x"])
+            self.running += 1
+            self.maxRunning = max(self.maxRunning, self.running)
+        self.release.wait(5)
+        with self.lock:
+            self.running -= 1
+        return input_["x"]
+
+
+class AsyncDecisionRunnerTest(TestCase):
+    """
+    Base test class for AsyncDecisionRunner
+    """
+
+    def testApplyRequestAsync(self):
+        async def run():
+            async with AsyncDecisionRunner(SquareDecision, maxWorkers=2) as runner:
+                return await asyncio.gather(*[runner.applyRequestAsync({"x": Decimal(i)}) for i in range(10)])
+
+        outputs = asyncio.run(run())
+        self.assertEqual([Decimal(i * i) for i in range(10)], [output for output, _ in outputs])
+        self.assertEqual({os.getpid()}, {pid for _, pid in outputs})
+
+    def testApplyRequestsAsyncPreservesOrder(self):
+        async def inputs():
+            for i in range(20):
+                yield {"x": Decimal(i)}
+
+        async def run():
+            async with AsyncDecisionRunner(SquareDecision, maxWorkers=2, maxInFlight=2, chunkSize=3) as runner:
+                fromIterable = [output async for output, _ in runner.applyRequestsAsync({"x": Decimal(i)} for i in range(20))]
+                fromAsyncIterable = [output async for output, _ in runner.applyRequestsAsync(inputs(), chunkSize=4)]
+                return fromIterable, fromAsyncIterable
+
+        fromIterable, fromAsyncIterable = asyncio.run(run())
+        self.assertEqual([Decimal(i * i) for i in range(20)], fromIterable)
+        self.assertEqual(fromIterable, fromAsyncIterable)
+
+    def testRunnerIsReusedAcrossLoops(self):
+        runner = AsyncDecisionRunner(SquareDecision, maxWorkers=1, maxInFlight=1)
+
+        async def run(x):
+            return await asyncio.wait_for(asyncio.gather(*[runner.applyRequestAsync({"x": x}) for _ in range(3)]), 5)
+
+        for i in range(3):
+            outputs = asyncio.run(run(Decimal(i)))
+            self.assertEqual([Decimal(i * i)] * 3, [output for output, _ in outputs])
+        runner.shutdown()
+
+    def testMaxInFlightAndCancellation(self):
+        runner = AsyncDecisionRunner(BlockingDecision, maxWorkers=4, maxInFlight=2)
+        decision = runner.function.args[0]
+
+        async def run():
+            tasks = [asyncio.ensure_future(runner.applyRequestAsync({"x": i})) for i in range(4)]
+            while len(decision.started) < 2:
+                await asyncio.sleep(0.01)
+            tasks[3].cancel()
+            await asyncio.sleep(0.05)
+            self.assertEqual(2, len(decision.started))
+            decision.release.set()
+            return await asyncio.gather(*tasks, return_exceptions=True)
+
+        outputs = asyncio.run(run())
+        runner.shutdown()
+        self.assertEqual([0, 1, 2], outputs[:3])
+        self.assertIsInstance(outputs[3], asyncio.CancelledError)
+        self.assertEqual(2, decision.maxRunning)
+        self.assertEqual([0, 1, 2], sorted(decision.started))
+
+    def testClosingBatchCancelsPendingChunks(self):
+        runner = AsyncDecisionRunner(BlockingDecision, maxWorkers=1, maxInFlight=2, chunkSize=1)
+        decision = runner.function.args[0]
+
+        async def run():
+            outputs = runner.applyRequestsAsync({"x": i} for i in range(10))
+            decision.release.set()
+            first = await outputs.__anext__()
+            await outputs.aclose()
+            return first
+
+        self.assertEqual(0, asyncio.run(run()))
+        runner.shutdown()
+        self.assertLessEqual(len(decision.started), 3)
+
+    def testProcesses(self):
+        async def run():
+            async with AsyncDecisionRunner(SquareDecision, maxWorkers=2, processes=True, chunkSize=5) as runner:
+                single = await runner.applyRequestAsync({"x": Decimal(3)})
+                batch = [output async for output in runner.applyRequestsAsync({"x": Decimal(i)} for i in range(12))]
+                return single, batch
+
+        single, batch = asyncio.run(run())
+        self.assertEqual(Decimal(9), single[0])
+        self.assertEqual([Decimal(i * i) for i in range(12)], [output for output, _ in batch])
+        self.assertNotIn(os.getpid(), {pid for _, pid in batch})
@@ -0,0 +1,38 @@
+#
+# Copyright 2016 Goldman Sachs.
+#
+# Licensed under the Apache License, Version 2.0 (the "License") you may not use self file except in compliance with the License.
+#
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations under the License.
+#
+from decimal import Decimal
+from unittest import TestCase
+
+from jdmn.runtime.Context import Context
+
+
+class ContextTest(TestCase):
+    """
+    Base test class for Context
+    """
+
+    def testGet(self):
+        context = Context().add("a", Decimal(1)).add("b", None)
+        self.assertEqual(Decimal(1), context.get("a"))
+        self.assertIsNone(context.get("b"))
+        self.assertIsNone(context.get("missing"))
+        self.assertEqual(Decimal(1), context.get("missing", "b", "a"))
+
+    def testEqualityAndHash(self):
+        context1 = Context().add("a", Decimal(1)).add("b", [Decimal(2), "x"])
+        context2 = Context().add("b", [Decimal(2), "x"]).add("a", Decimal("1.0"))
+        self.assertEqual(context1, context2)
+        self.assertEqual(hash(context1), hash(context2))
+        self.assertEqual(1, len({context1, context2}))
+        self.assertNotEqual(context1, Context().add("a", Decimal(1)))
+        self.assertNotEqual(context1, None)
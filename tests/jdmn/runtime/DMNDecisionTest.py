@@ -0,0 +1,124 @@
+#
+# Copyright 2016 Goldman Sachs.
+#
+# Licensed under the Apache License, Version 2.0 (the "License") you may not use self file except in compliance with the License.
+#
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations under the License.
+#
+from decimal import Decimal
+from unittest import TestCase
+
+from jdmn.runtime.BatchStatistics import BatchStatistics
+from jdmn.runtime.DMNDecision import DMNDecision
+from jdmn.runtime.ExecutionContext import ExecutionContext
+from jdmn.runtime.FastDMNBaseDecision import FastDMNBaseDecision
+from jdmn.runtime.annotation.Annotation import Annotation
+from jdmn.runtime.listener.NopEventListener import NopEventListener
+
+
+class CachingDecision(DMNDecision):
+    def __init__(self):
+        self.contexts = []
+
+    def applyRequest(self, input_: dict, executionContext_: ExecutionContext):
+        self.contexts.append(executionContext_)
+        cache = executionContext_.cache
+        if not cache.contains("x"):
+            cache.bind("x", input_["x"])
+        return cache.lookup("x") + 1
+
+
+class AnnotatedDecision(DMNDecision):
+    def applyRequest(self, input_: dict, executionContext_: ExecutionContext):
+        if input_["x"] > 0:
+            executionContext_.annotations.addAnnotation("AnnotatedDecision", 0, "positive")
+        return input_["x"]
+
+
+class DivideDecision(FastDMNBaseDecision):
+    def applyRequest(self, input_: dict, executionContext_: ExecutionContext):
+        return self.numericDivide(input_["x"], input_["y"])
+
+
+class IncrementDecision(FastDMNBaseDecision):
+    def apply(self, x, executionContext_: ExecutionContext):
+        return self.numericAdd(x, Decimal(1))
+
+
+class RatioDecision(FastDMNBaseDecision):
+    def __init__(self):
+        FastDMNBaseDecision.__init__(self)
+        self.incrementDecision = IncrementDecision()
+
+    def applyRequest(self, input_: dict, executionContext_: ExecutionContext):
+        executionContext_.annotations.addAnnotation("RatioDecision", 0, "ratio")
+        return [self.incrementDecision.apply(input_["x"], executionContext_), self.numericDivide(input_["x"], input_["y"])]
+
+
+class DMNDecisionTest(TestCase):
+    """
+    Base test class for DMNDecision
+    """
+
+    def testApplyRequests(self):
+        decision = CachingDecision()
+        listener = NopEventListener()
+        executionContext = ExecutionContext(eventListener=listener)
+        statistics = BatchStatistics()
+
+        outputs = decision.applyRequests(({"x": Decimal(i)} for i in range(5)), executionContext, statistics)
+        self.assertEqual([Decimal(i + 1) for i in range(5)], list(outputs))
+
+        self.assertEqual(5, statistics.count)
+        self.assertTrue(statistics.minTime <= statistics.meanTime() <= statistics.maxTime)
+        self.assertIsNotNone(statistics.throughput())
+        self.assertTrue(all(context.eventListener is listener for context in decision.contexts))
+        self.assertEqual(5, len({id(context.annotations) for context in decision.contexts}))
+
+    def testApplyRequestsIsLazy(self):
+        decision = CachingDecision()
+
+        outputs = decision.applyRequests([{"x": Decimal(1)}, {"x": Decimal(2)}])
+        self.assertEqual(0, len(decision.contexts))
+        self.assertEqual(Decimal(2), next(outputs))
+        self.assertEqual(1, len(decision.contexts))
+
+    def testApplyRequestsAnnotations(self):
+        decision = AnnotatedDecision()
+        inputs = [{"x": Decimal(1)}, {"x": Decimal(-1)}, {"x": Decimal(2)}]
+        annotations = []
+
+        outputs = list(decision.applyRequests(inputs, annotationsCallback=lambda input_, annotationSet: annotations.append((input_, annotationSet))))
+        self.assertEqual([Decimal(1), Decimal(-1), Decimal(2)], outputs)
+        self.assertEqual(inputs, [input_ for input_, _ in annotations])
+        self.assertEqual([[Annotation("AnnotatedDecision", 1, "positive")], [], [Annotation("AnnotatedDecision", 1, "positive")]],
+                         [list(annotationSet) for _, annotationSet in annotations])
+
+    def testFastDecisionErrorBoundary(self):
+        decision = DivideDecision()
+
+        inputs = [{"x": Decimal(1), "y": Decimal(2)}, {"x": Decimal(1), "y": "abc"}, {"x": Decimal(3), "y": Decimal(1)}]
+        with self.assertLogs(level="ERROR"):
+            outputs = list(decision.applyRequests(inputs))
+        self.assertEqual([Decimal("0.5"), None, Decimal(3)], outputs)
+
+    def testFastDecisionRetriesWithSafeOperators(self):
+        decision = RatioDecision()
+        inputs = [{"x": Decimal(1), "y": Decimal(2)}, {"x": "a", "y": Decimal(2)}, {"x": Decimal(1), "y": "b"}]
+        annotations = []
+
+        with self.assertLogs(level="ERROR"):
+            outputs = list(decision.applyRequests(inputs, annotationsCallback=lambda input_, annotationSet: annotations.append(list(annotationSet))))
+        self.assertEqual([[Decimal(2), Decimal("0.5")], [None, None], [Decimal(2), None]], outputs)
+        self.assertEqual([[Annotation("RatioDecision", 1, "ratio")]] * 3, annotations)
+
+        safeDecision = decision.safeDecision()
+        self.assertIs(safeDecision, decision.safeDecision())
+        self.assertIsNot(decision.incrementDecision, safeDecision.incrementDecision)
+        self.assertIs(safeDecision.incrementDecision, decision.incrementDecision.safeDecision())
+        self.assertRaises(Exception, lambda: decision.applyRequest(inputs[1], ExecutionContext()))
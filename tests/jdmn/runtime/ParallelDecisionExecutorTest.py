@@ -0,0 +1,45 @@
+#
+# Copyright 2016 Goldman Sachs.
+#
+# Licensed under the Apache License, Version 2.0 (the "License") you may not use self file except in compliance with the License.
+#
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations under the License.
+#
+import os
+from decimal import Decimal
+from unittest import TestCase
+
+from jdmn.runtime.DMNDecision import DMNDecision
+from jdmn.runtime.ExecutionContext import ExecutionContext
+from jdmn.runtime.ParallelDecisionExecutor import ParallelDecisionExecutor
+from jdmn.runtime.listener.NopEventListener import NopEventListener
+
+
+class SquareDecision(DMNDecision):
+    def applyRequest(self, input_: dict, executionContext_: ExecutionContext):
+        return input_["x"] * input_["x"], os.getpid()
+
+
+def makeExecutionContext() -> ExecutionContext:
+    return ExecutionContext(eventListener=NopEventListener())
+
+
+class ParallelDecisionExecutorTest(TestCase):
+    """
+    Base test class for ParallelDecisionExecutor
+    """
+
+    def testApplyRequestsPreservesOrder(self):
+        inputs = [{"x": Decimal(i)} for i in range(50)]
+        with ParallelDecisionExecutor(SquareDecision, maxWorkers=2, chunkSize=7, executionContextFactory=makeExecutionContext) as executor:
+            outputs = list(executor.applyRequests(inputs))
+            single = executor.applyRequest({"x": Decimal(3)})
+
+        self.assertEqual([Decimal(i * i) for i in range(50)], [output for output, _ in outputs])
+        self.assertNotIn(os.getpid(), {pid for _, pid in outputs})
+        self.assertEqual(Decimal(9), single[0])
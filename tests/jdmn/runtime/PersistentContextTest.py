@@ -0,0 +1,102 @@
+#
+# Copyright 2016 Goldman Sachs.
+#
+# Licensed under the Apache License, Version 2.0 (the "License") you may not use self file except in compliance with the License.
+#
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations under the License.
+#
+import pickle
+from decimal import Decimal
+from unittest import TestCase
+
+from jdmn.runtime.Context import Context
+from jdmn.runtime.DMNRuntimeException import DMNRuntimeException
+from jdmn.runtime.PersistentContext import MAX_DEPTH, PersistentContext
+
+
+class PersistentContextTest(TestCase):
+    """
+    Base test class for PersistentContext
+    """
+
+    def testPlusSharesParent(self):
+        base = PersistentContext({"a": Decimal(1), "b": Decimal(2)})
+        enriched = base.plus("b", Decimal(3)).plus("c", None)
+
+        self.assertIs(base, enriched.parent.parent)
+        self.assertEqual({"c": None}, enriched.map)
+        self.assertEqual(Decimal(1), enriched.get("a"))
+        self.assertEqual(Decimal(3), enriched.get("b"))
+        self.assertIsNone(enriched.get("c"))
+        self.assertIsNone(enriched.get("missing"))
+        self.assertEqual(Decimal(1), enriched.get("c", "a"))
+        self.assertEqual(Decimal(2), base.get("b"))
+        self.assertEqual({"a": Decimal(1), "b": Decimal(3), "c": None}, dict(enriched.getBindings()))
+        self.assertEqual(["a", "b", "c"], list(enriched.keySet()))
+
+    def testDeepChainsAreFlattened(self):
+        context = PersistentContext()
+        for i in range(3 * MAX_DEPTH):
+            context = context.plus(i, Decimal(i))
+            self.assertLessEqual(context.depth, MAX_DEPTH)
+        self.assertEqual({i: Decimal(i) for i in range(3 * MAX_DEPTH)}, dict(context.getBindings()))
+
+    def testIsImmutable(self):
+        context = PersistentContext.of(Context().add("a", Decimal(1)))
+        self.assertRaises(DMNRuntimeException, lambda: context.add("b", Decimal(2)))
+        with self.assertRaises(TypeError):
+            context.getBindings()["b"] = Decimal(2)
+        self.assertIsNone(context.get("b"))
+
+    def testEqualityAndHash(self):
+        persistent = PersistentContext({"a": Decimal(1)}).plus("b", [Decimal(2)])
+        mutable = Context().add("b", [Decimal(2)]).add("a", Decimal(1))
+        self.assertEqual(persistent, mutable)
+        self.assertEqual(mutable, persistent)
+        self.assertEqual(hash(mutable), hash(persistent))
+        self.assertEqual(hash(persistent.parent), persistent.parent.hashCode)
+        self.assertNotEqual(persistent, persistent.plus("b", Decimal(2)))
+
+        cache = {persistent: "value"}
+        self.assertEqual("value", cache.get(PersistentContext.of(mutable)))
+
+    def testHashOfMutableValues(self):
+        scores = [Decimal(1)]
+        persistent = PersistentContext({"a": Decimal(1)}).plus("scores", scores).plus("b", Context().add("c", "d"))
+        hash(persistent)
+        self.assertIsNone(persistent.hashCode)
+        scores.append(Decimal(2))
+        mutable = Context().add("a", Decimal(1)).add("scores", [Decimal(1), Decimal(2)]).add("b", Context().add("c", "d"))
+        self.assertEqual(hash(mutable), hash(persistent))
+        self.assertEqual(persistent, mutable)
+
+        nested = PersistentContext({"a": PersistentContext({"b": Decimal(1)})})
+        self.assertEqual(hash(nested), nested.hashCode)
+
+    def testHashOfNestedMutableValues(self):
+        scores = [Decimal(1)]
+        outer = PersistentContext({"inner": PersistentContext({"scores": scores})})
+        hash(outer)
+        self.assertIsNone(outer.hashCode)
+        scores.append(Decimal(2))
+        fresh = PersistentContext({"inner": PersistentContext({"scores": [Decimal(1), Decimal(2)]})})
+        self.assertEqual(fresh, outer)
+        self.assertEqual(hash(fresh), hash(outer))
+
+        tupleValue = PersistentContext({"pair": (PersistentContext({"scores": scores}), Decimal(1))})
+        hash(tupleValue)
+        self.assertIsNone(tupleValue.hashCode)
+
+    def testPickleDropsCachedHash(self):
+        context = PersistentContext({"a": Decimal(1)}, "name").plus("b", "x")
+        hash(context)
+        copy = pickle.loads(pickle.dumps(context))
+        self.assertEqual(context, copy)
+        self.assertEqual("name", copy.getName())
+        self.assertIsNone(copy.hashCode)
+        self.assertIsNone(copy.parent)
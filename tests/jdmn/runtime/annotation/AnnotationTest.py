@@ -0,0 +1,37 @@
+#
+# Copyright 2016 Goldman Sachs.
+#
+# Licensed under the Apache License, Version 2.0 (the "License") you may not use self file except in compliance with the License.
+#
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations under the License.
+#
+import pickle
+from unittest import TestCase
+
+from jdmn.runtime.annotation.Annotation import Annotation
+
+
+class AnnotationTest(TestCase):
+    """
+    Base test class for Annotation
+    """
+
+    def testEquality(self):
+        annotation = Annotation("decision", 1, "annotation")
+        self.assertEqual(Annotation("decision", 1, "annotation"), annotation)
+        self.assertNotEqual(Annotation("decision", 2, "annotation"), annotation)
+        self.assertEqual(hash(Annotation("decision", 1, "annotation")), hash(annotation))
+        self.assertEqual(annotation.__hash__(), annotation.hashCode)
+        self.assertEqual("Annotation('decision', 1, 'annotation')", str(annotation))
+
+    def testPickleDropsCachedHash(self):
+        annotation = Annotation("decision", 1, "annotation")
+        hash(annotation)
+        copy = pickle.loads(pickle.dumps(annotation))
+        self.assertEqual(annotation, copy)
+        self.assertIsNone(copy.hashCode)
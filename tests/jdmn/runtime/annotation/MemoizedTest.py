@@ -0,0 +1,140 @@
+#
+# Copyright 2016 Goldman Sachs.
+#
+# Licensed under the Apache License, Version 2.0 (the "License") you may not use self file except in compliance with the License.
+#
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations under the License.
+#
+import threading
+from decimal import Decimal
+from unittest import TestCase
+
+from jdmn.runtime.Context import Context
+from jdmn.runtime.DMNDecision import DMNDecision
+from jdmn.runtime.ExecutionContext import ExecutionContext
+from jdmn.runtime.PersistentContext import PersistentContext
+from jdmn.runtime.annotation.DRGElementKind import DRGElementKind
+from jdmn.runtime.annotation.ExpressionKind import ExpressionKind
+from jdmn.runtime.annotation.HitPolicy import HitPolicy
+from jdmn.runtime.annotation.Memoized import Memoized, copyOutput
+from jdmn.runtime.listener.DRGElement import DRGElement
+
+
+class EligibilityDecision(DMNDecision):
+    DRG_ELEMENT_METADATA = DRGElement("", "MemoizedEligibility", "", DRGElementKind.DECISION, ExpressionKind.DECISION_TABLE, HitPolicy.UNIQUE, 2)
+
+    def __init__(self):
+        self.calls = 0
+
+    @Memoized(DRG_ELEMENT_METADATA, maxEntries=2)
+    def apply(self, applicant, context_: ExecutionContext):
+        self.calls += 1
+        age = applicant.get("age")
+        return None if age is None else age >= 18
+
+    def applyRequest(self, input_: dict, executionContext_: ExecutionContext):
+        return self.apply(input_.get("applicant"), executionContext_)
+
+
+class ScoresDecision(DMNDecision):
+    DRG_ELEMENT_METADATA = DRGElement("", "MemoizedScores", "", DRGElementKind.DECISION, ExpressionKind.CONTEXT, HitPolicy.UNKNOWN, 1)
+
+    def __init__(self):
+        self.calls = 0
+
+    @Memoized(DRG_ELEMENT_METADATA)
+    def apply(self, applicant, context_: ExecutionContext):
+        self.calls += 1
+        return Context().add("scores", [Decimal(1), Context().add("age", applicant.get("age"))])
+
+
+class MemoizedTest(TestCase):
+    """
+    Base test class for Memoized
+    """
+
+    def setUp(self):
+        EligibilityDecision.apply.memoized.clear()
+
+    def testHitsAndMisses(self):
+        memoized = EligibilityDecision.apply.memoized
+        before = memoized.statistics()
+        decision = EligibilityDecision()
+        inputs = [Context().add("age", Decimal(20)), Context().add("age", Decimal("20.0")), Context().add("age", Decimal(10)),
+                  Context().add("age", None), Context().add("age", None)]
+
+        outputs = [decision.apply(applicant, ExecutionContext()) for applicant in inputs]
+        self.assertEqual([True, True, False, None, None], outputs)
+        self.assertEqual(4, decision.calls)
+
+        after = memoized.statistics()
+        self.assertEqual(1, after["hits"] - before["hits"])
+        self.assertEqual(4, after["misses"] - before["misses"])
+        self.assertEqual(2, after["entries"])
+        self.assertEqual(after, Memoized.elementStatistics()["MemoizedEligibility"])
+
+    def testMutableOutputsAreCopied(self):
+        ScoresDecision.apply.memoized.clear()
+        decision = ScoresDecision()
+        applicant = Context().add("age", Decimal(30))
+        expected = Context().add("scores", [Decimal(1), Context().add("age", Decimal(30))])
+
+        output = decision.apply(applicant, ExecutionContext())
+        output.get("scores").append(Decimal(2))
+        hit = decision.apply(applicant, ExecutionContext())
+        self.assertEqual(expected, hit)
+        hit.get("scores")[1].put("age", None)
+        self.assertEqual(expected, decision.apply(applicant, ExecutionContext()))
+        self.assertEqual(1, decision.calls)
+
+    def testPersistentContextOutputsAreCopied(self):
+        output = PersistentContext({"a": Decimal(1)}).plus("scores", [Decimal(1)])
+        copy = copyOutput(output)
+        self.assertEqual(output, copy)
+        copy.get("scores").append(Decimal(2))
+        self.assertEqual([Decimal(1)], output.get("scores"))
+
+        immutable = PersistentContext({"a": Decimal(1)}).plus("b", PersistentContext({"c": "d"}))
+        self.assertIs(immutable, copyOutput(immutable))
+
+    def testCacheIsSharedByDecisions(self):
+        applicant = Context().add("age", Decimal(30))
+        decision1 = EligibilityDecision()
+        decision2 = EligibilityDecision()
+
+        self.assertTrue(decision1.applyRequest({"applicant": applicant}, ExecutionContext()))
+        self.assertTrue(decision2.applyRequest({"applicant": applicant}, ExecutionContext()))
+        self.assertEqual(1, decision1.calls + decision2.calls)
+
+    def testUnhashableArgumentsAreNotCached(self):
+        memoized = EligibilityDecision.apply.memoized
+        before = memoized.statistics()["skips"]
+        decision = EligibilityDecision()
+        applicant = Context().add("age", Decimal(30)).add("tags", {"a"})
+
+        self.assertTrue(decision.apply(applicant, ExecutionContext()))
+        self.assertTrue(decision.apply(applicant, ExecutionContext()))
+        self.assertEqual(2, decision.calls)
+        self.assertEqual(2, memoized.statistics()["skips"] - before)
+
+    def testSkipsAreCountedByConcurrentCalls(self):
+        memoized = EligibilityDecision.apply.memoized
+        before = memoized.statistics()["skips"]
+        decision = EligibilityDecision()
+        applicant = Context().add("age", Decimal(30)).add("tags", {"a"})
+
+        def run():
+            for _ in range(1000):
+                decision.apply(applicant, ExecutionContext())
+
+        threads = [threading.Thread(target=run) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(4000, memoized.statistics()["skips"] - before)
@@ -0,0 +1,73 @@
+#
+# Copyright 2016 Goldman Sachs.
+#
+# Licensed under the Apache License, Version 2.0 (the "License") you may not use self file except in compliance with the License.
+#
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations under the License.
+#
+from datetime import date, datetime, time, timedelta, timezone
+from decimal import Decimal
+from unittest import TestCase
+
+from isodate import Duration
+
+from jdmn.runtime.Context import Context
+from jdmn.runtime.PersistentContext import PersistentContext
+from jdmn.runtime.Range import Range
+from jdmn.runtime.annotation.AnnotationSet import AnnotationSet
+from jdmn.runtime.cache.Fingerprint import fingerprint
+
+
+class FingerprintTest(TestCase):
+    """
+    Base test class for Fingerprint
+    """
+
+    def testEqualValues(self):
+        self.assertEqual(fingerprint(Decimal("1.00")), fingerprint(Decimal("1.00")))
+        self.assertEqual(fingerprint(date(2020, 1, 1)), fingerprint(date(2020, 1, 1)))
+        self.assertEqual(fingerprint([Decimal(1), None, "a"]), fingerprint([Decimal(1), None, "a"]))
+        self.assertEqual(fingerprint(Range(True, Decimal(1), False, Decimal(2))), fingerprint(Range(True, Decimal(1), False, Decimal(2))))
+        self.assertEqual(fingerprint(Context().add("a", [Decimal(1)]).add("b", {"c": "d"})),
+                         fingerprint(Context().add("b", {"c": "d"}).add("a", [Decimal(1)])))
+
+    def testDifferentValues(self):
+        self.assertNotEqual(fingerprint(True), fingerprint(Decimal(1)))
+        self.assertNotEqual(fingerprint([Decimal(1)]), fingerprint(Decimal(1)))
+        self.assertNotEqual(fingerprint(Context().add("a", Decimal(1))), fingerprint({"a": Decimal(1)}))
+        self.assertNotEqual(fingerprint(Context().add("a", Decimal(1))), fingerprint(Context().add("a", Decimal(2))))
+
+    def testEqualValuesWithDifferentRepresentations(self):
+        utc = datetime(2020, 1, 1, 10, 0, tzinfo=timezone.utc)
+        cet = datetime(2020, 1, 1, 11, 0, tzinfo=timezone(timedelta(hours=1)))
+        self.assertEqual(utc, cet)
+        self.assertNotEqual(fingerprint(utc), fingerprint(cet))
+        self.assertNotEqual(fingerprint(time(10, 0, tzinfo=timezone.utc)), fingerprint(time(11, 0, tzinfo=timezone(timedelta(hours=1)))))
+        self.assertNotEqual(fingerprint(Decimal("1")), fingerprint(Decimal("1.00")))
+        self.assertNotEqual(fingerprint(Decimal("1")), fingerprint("1"))
+        self.assertNotEqual(fingerprint(Duration(years=1)), fingerprint(Duration(months=12)))
+        self.assertNotEqual(fingerprint([Decimal("1")]), fingerprint([Decimal("1.0")]))
+        self.assertNotEqual(fingerprint(Range(">", Decimal("1"))), fingerprint(Range(">", Decimal("1.0"))))
+
+    def testConcreteTypes(self):
+        bindings = {"a": Decimal(1)}
+        self.assertNotEqual(fingerprint(Context().add("a", Decimal(1))), fingerprint(PersistentContext(bindings)))
+        self.assertNotEqual(fingerprint(AnnotationSet()), fingerprint([]))
+        self.assertEqual(fingerprint(PersistentContext(bindings)), fingerprint(PersistentContext(bindings)))
+
+    def testNestedMutableValues(self):
+        scores = [Decimal(1)]
+        outer = PersistentContext({"inner": PersistentContext({"scores": scores})})
+        before = fingerprint(outer)
+        hash(outer)
+        scores.append(Decimal(2))
+        self.assertNotEqual(before, fingerprint(outer))
+        self.assertEqual(fingerprint(PersistentContext({"inner": PersistentContext({"scores": [Decimal(1), Decimal(2)]})})), fingerprint(outer))
+
+    def testUnhashableValues(self):
+        self.assertRaises(TypeError, lambda: fingerprint([set()]))
@@ -0,0 +1,94 @@
+#
+# Copyright 2016 Goldman Sachs.
+#
+# Licensed under the Apache License, Version 2.0 (the "License") you may not use self file except in compliance with the License.
+#
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations under the License.
+#
+import threading
+from unittest import TestCase
+
+from jdmn.runtime.ExecutionContext import ExecutionContext
+from jdmn.runtime.cache.LRUCache import LRUCache
+
+
+class LRUCacheTest(TestCase):
+    """
+    Base test class for LRUCache
+    """
+
+    def testLeastRecentlyUsedIsEvicted(self):
+        cache = LRUCache(maxEntries=2)
+        cache.bind("a", 1)
+        cache.bind("b", 2)
+        self.assertEqual(1, cache.lookup("a"))
+        cache.bind("c", 3)
+
+        self.assertTrue(cache.contains("a"))
+        self.assertFalse(cache.contains("b"))
+        self.assertTrue(cache.contains("c"))
+        self.assertEqual({"entries": 2, "memory": 0, "hits": 1, "misses": 1, "evictions": 1, "expirations": 0}, cache.statistics())
+
+    def testMissingKeyRaises(self):
+        cache = LRUCache()
+        cache.bind("a", None)
+        self.assertIsNone(cache.lookup("a"))
+        self.assertRaises(KeyError, lambda: cache.lookup("b"))
+        self.assertEqual(1, cache.statistics()["misses"])
+
+    def testMaxMemory(self):
+        cache = LRUCache(maxEntries=None, maxMemory=10, sizeOf=lambda x: 1 if isinstance(x, str) else x)
+        cache.bind("a", 4)
+        cache.bind("b", 4)
+        cache.bind("c", 4)
+        self.assertFalse(cache.contains("a"))
+        self.assertEqual(10, cache.statistics()["memory"])
+
+        cache.bind("d", 100)
+        self.assertFalse(cache.contains("d"))
+        self.assertEqual(2, cache.size())
+
+    def testTTL(self):
+        now = [0.0]
+        cache = LRUCache(ttl=5, clock=lambda: now[0])
+        cache.bind("a", 1)
+        now[0] = 4.9
+        self.assertEqual(1, cache.lookup("a"))
+        now[0] = 5.0
+        self.assertRaises(KeyError, lambda: cache.lookup("a"))
+        self.assertEqual(0, cache.size())
+        statistics = cache.statistics()
+        self.assertEqual(1, statistics["expirations"])
+        self.assertEqual(0, statistics["evictions"])
+
+        cache.bind("b", None)
+        self.assertTrue(cache.contains("b"))
+        now[0] = 10.0
+        self.assertRaises(KeyError, lambda: cache.lookup("b"))
+
+    def testConcurrentAccess(self):
+        cache = LRUCache(maxEntries=50)
+
+        def work(offset):
+            for i in range(1000):
+                key = str((offset + i) % 100)
+                try:
+                    cache.lookup(key)
+                except KeyError:
+                    cache.bind(key, i)
+
+        threads = [threading.Thread(target=work, args=(i * 10,)) for i in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertTrue(cache.size() <= 50)
+
+    def testExecutionContext(self):
+        cache = LRUCache(maxEntries=10)
+        self.assertIs(cache, ExecutionContext(cache=cache).cache)
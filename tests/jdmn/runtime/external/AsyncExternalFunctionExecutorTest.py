@@ -0,0 +1,70 @@
+#
+# Copyright 2016 Goldman Sachs.
+#
+# Licensed under the Apache License, Version 2.0 (the "License") you may not use self file except in compliance with the License.
+#
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations under the License.
+#
+import asyncio
+from decimal import Decimal
+from unittest import TestCase
+
+from jdmn.runtime.AsyncDecisionRunner import AsyncDecisionRunner
+from jdmn.runtime.DMNDecision import DMNDecision
+from jdmn.runtime.DMNRuntimeException import DMNRuntimeException
+from jdmn.runtime.ExecutionContext import ExecutionContext
+from jdmn.runtime.external.AsyncExternalFunctionExecutor import AsyncExternalFunctionExecutor
+
+EXECUTOR = AsyncExternalFunctionExecutor(timeout=5)
+
+
+async def rate(currency: str) -> Decimal:
+    await asyncio.sleep(0)
+    return Decimal(2) if currency == "EUR" else Decimal(1)
+
+
+def fee(amount: Decimal) -> Decimal:
+    return amount / 100
+
+
+EXECUTOR.register("rates", "rate", rate).register("fees", "fee", fee)
+
+
+class ConvertDecision(DMNDecision):
+    def applyRequest(self, input_: dict, executionContext_: ExecutionContext):
+        executor = executionContext_.externalFunctionExecutor
+        return input_["amount"] * executor.execute("rates", "rate", [input_["currency"]]) - executor.execute("fees", "fee", [input_["amount"]])
+
+
+def makeExecutionContext() -> ExecutionContext:
+    return ExecutionContext(externalFunctionExecutor=EXECUTOR)
+
+
+class AsyncExternalFunctionExecutorTest(TestCase):
+    """
+    Base test class for AsyncExternalFunctionExecutor
+    """
+
+    def testExecuteWithoutLoop(self):
+        executor = AsyncExternalFunctionExecutor().register("rates", "rate", rate).register("fees", "fee", fee)
+        self.assertEqual(Decimal(2), executor.execute("rates", "rate", ["EUR"]))
+        self.assertEqual(Decimal(1), executor.execute("fees", "fee", [Decimal(100)]))
+        self.assertRaises(DMNRuntimeException, lambda: executor.execute("rates", "missing", []))
+
+    def testExecuteOnApplicationLoop(self):
+        async def run():
+            EXECUTOR.loop = asyncio.get_running_loop()
+            try:
+                self.assertRaises(DMNRuntimeException, lambda: EXECUTOR.execute("rates", "rate", ["EUR"]))
+                async with AsyncDecisionRunner(ConvertDecision, maxWorkers=2, executionContextFactory=makeExecutionContext) as runner:
+                    return await asyncio.gather(runner.applyRequestAsync({"amount": Decimal(100), "currency": "EUR"}),
+                                                runner.applyRequestAsync({"amount": Decimal(100), "currency": "USD"}))
+            finally:
+                EXECUTOR.loop = None
+
+        self.assertEqual([Decimal(199), Decimal(99)], asyncio.run(run()))
@@ -0,0 +1,140 @@
+#
+# Copyright 2016 Goldman Sachs.
+#
+# Licensed under the Apache License, Version 2.0 (the "License") you may not use self file except in compliance with the License.
+#
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations under the License.
+#
+import os
+import tempfile
+import threading
+from unittest import TestCase
+
+from jdmn.runtime.annotation.DRGElementKind import DRGElementKind
+from jdmn.runtime.annotation.ExpressionKind import ExpressionKind
+from jdmn.runtime.annotation.HitPolicy import HitPolicy
+from jdmn.runtime.listener.Arguments import Arguments
+from jdmn.runtime.listener.DRGElement import DRGElement
+from jdmn.runtime.listener.MetricsEventListener import MetricsEventListener
+from jdmn.runtime.listener.Rule import Rule
+
+
+class MetricsEventListenerTest(TestCase):
+    """
+    Base test class for MetricsEventListener
+    """
+
+    def setUp(self):
+        self.element = self.makeElement("http://www.example.com/loans")
+
+    def testSnapshot(self):
+        listener = MetricsEventListener(buckets=(1, 10))
+        self.evaluate(listener, 0)
+        self.evaluate(listener, 5)
+        self.evaluate(listener, 50)
+
+        snapshot = listener.snapshot()
+        key = ("http://www.example.com/loans", "Eligibility")
+        self.assertEqual({"count": 3, "sum": 55, "buckets": [1, 1, 1]}, snapshot["elements"][key])
+        self.assertEqual({(*key, 1): 3}, snapshot["ruleHits"])
+        self.assertEqual({(*key, 2, 2): 3}, snapshot["columnFailures"])
+
+    def testElementsAreKeyedByNamespace(self):
+        listener = MetricsEventListener(buckets=(1, 10))
+        self.evaluate(listener, 5)
+        self.evaluate(listener, 5, self.makeElement("http://www.example.com/cards"))
+
+        snapshot = listener.snapshot()
+        self.assertEqual(1, snapshot["elements"][("http://www.example.com/loans", "Eligibility")]["count"])
+        self.assertEqual(1, snapshot["elements"][("http://www.example.com/cards", "Eligibility")]["count"])
+        self.assertEqual(2, len(snapshot["ruleHits"]))
+        self.assertEqual(2, len(snapshot["columnFailures"]))
+
+    def testThreadsAreMerged(self):
+        listener = MetricsEventListener()
+        threads = [threading.Thread(target=lambda: [self.evaluate(listener, 1) for _ in range(100)]) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(400, listener.snapshot()["elements"][("http://www.example.com/loans", "Eligibility")]["count"])
+        listener.reset()
+        self.assertEqual({}, listener.snapshot()["elements"])
+
+    def testExitedThreadsAreReleased(self):
+        listener = MetricsEventListener()
+        for _ in range(3):
+            thread = threading.Thread(target=lambda: self.evaluate(listener, 1))
+            thread.start()
+            thread.join()
+
+        snapshot = listener.snapshot()
+        self.assertEqual(3, snapshot["elements"][("http://www.example.com/loans", "Eligibility")]["count"])
+        self.assertEqual([], listener.threadMetrics)
+        listener.reset()
+        self.assertEqual({}, listener.snapshot()["elements"])
+
+    def testResetDoesNotLoseConcurrentUpdates(self):
+        listener = MetricsEventListener()
+        stop = threading.Event()
+
+        def record():
+            while not stop.is_set():
+                self.evaluate(listener, 1)
+
+        threads = [threading.Thread(target=record) for _ in range(2)]
+        for thread in threads:
+            thread.start()
+        for _ in range(200):
+            listener.reset()
+        stop.set()
+        for thread in threads:
+            thread.join()
+
+        # An update is kept or cleared as a whole, never partly written to cleared maps
+        entry = listener.snapshot()["elements"].get(("http://www.example.com/loans", "Eligibility"), {"count": 0, "sum": 0, "buckets": []})
+        self.assertEqual(entry["count"], sum(entry["buckets"]))
+        self.assertEqual(entry["count"], entry["sum"])
+
+    def testPrometheus(self):
+        listener = MetricsEventListener(buckets=(1, 10))
+        self.evaluate(listener, 5)
+
+        text = listener.toPrometheus()
+        labels = 'namespace="http://www.example.com/loans",element="Eligibility"'
+        self.assertIn(f'jdmn_drg_element_duration_ms_bucket{{{labels},le="1"}} 0', text)
+        self.assertIn(f'jdmn_drg_element_duration_ms_bucket{{{labels},le="10"}} 1', text)
+        self.assertIn(f'jdmn_drg_element_duration_ms_bucket{{{labels},le="+Inf"}} 1', text)
+        self.assertIn(f'jdmn_drg_element_duration_ms_count{{{labels}}} 1', text)
+        self.assertIn(f'jdmn_rule_hits_total{{{labels},rule="1"}} 1', text)
+        self.assertIn(f'jdmn_column_failures_total{{{labels},rule="2",column="2"}} 1', text)
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "jdmn.prom")
+            listener.writePrometheus(path)
+            with open(path, encoding="utf-8") as file:
+                self.assertEqual(text, file.read())
+
+    def evaluate(self, listener: MetricsEventListener, duration: int, element: DRGElement = None):
+        element = self.element if element is None else element
+        arguments = Arguments()
+        listener.startDRGElement(element, arguments)
+        for index, matched in enumerate([True, False]):
+            rule = Rule(index, "")
+            listener.startRule(element, rule)
+            listener.matchColumn(rule, 1, True)
+            listener.matchColumn(rule, 2, matched)
+            if matched:
+                listener.matchRule(element, rule)
+            listener.endRule(element, rule, None)
+        listener.endDRGElement(element, arguments, None, duration)
+
+    @staticmethod
+    def makeElement(namespace: str) -> DRGElement:
+        return DRGElement(namespace, "Eligibility", "", DRGElementKind.DECISION, ExpressionKind.DECISION_TABLE, HitPolicy.UNIQUE, 2)
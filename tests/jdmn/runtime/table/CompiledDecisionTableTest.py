@@ -0,0 +1,158 @@
+#
+# Copyright 2016 Goldman Sachs.
+#
+# Licensed under the Apache License, Version 2.0 (the "License") you may not use self file except in compliance with the License.
+#
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations under the License.
+#
+import random
+from datetime import date
+from decimal import Decimal
+from unittest import TestCase
+
+from jdmn.feel.lib.DefaultStandardFEELLib import DefaultStandardFEELLib
+from jdmn.runtime.LambdaExpression import LambdaExpression
+from jdmn.runtime.LazyEval import LazyEval
+from jdmn.runtime.Range import Range
+from jdmn.runtime.RuleOutput import RuleOutput
+from jdmn.runtime.annotation.DRGElementKind import DRGElementKind
+from jdmn.runtime.annotation.ExpressionKind import ExpressionKind
+from jdmn.runtime.annotation.HitPolicy import HitPolicy
+from jdmn.runtime.listener.DRGElement import DRGElement
+from jdmn.runtime.listener.NopEventListener import NopEventListener
+from jdmn.runtime.table.CompiledDecisionTable import CompiledDecisionTable
+from jdmn.runtime.table.DecisionTableRule import DecisionTableRule
+
+
+class IndexOutput(RuleOutput):
+    def __init__(self, matched: bool, index: int):
+        super().__init__(matched)
+        self.index = index
+
+
+class CompiledDecisionTableTest(TestCase):
+    """
+    Base test class for CompiledDecisionTable
+    """
+
+    def setUp(self):
+        self.lib = DefaultStandardFEELLib()
+        self.element = DRGElement("", "table", "", DRGElementKind.DECISION, ExpressionKind.DECISION_TABLE, HitPolicy.COLLECT, 0)
+
+    def testEqualityAndRangeEntries(self):
+        table = self.makeTable([
+            [Range("<", Decimal(18)), "A"],
+            [Range(True, Decimal(18), False, Decimal(65)), ["A", "B"]],
+            [Range(">=", Decimal(65)), None],
+            [Decimal(30), "C"],
+            [None, "B"],
+        ])
+
+        self.assertEqual([0], self.matchedIndexes(table, Decimal(10), "A"))
+        self.assertEqual([1, 4], self.matchedIndexes(table, Decimal(18), "B"))
+        self.assertEqual([1], self.matchedIndexes(table, Decimal(30), "A"))
+        self.assertEqual([3], self.matchedIndexes(table, Decimal(30), "C"))
+        self.assertEqual([2, 4], self.matchedIndexes(table, Decimal(65), "B"))
+        self.assertEqual([], self.matchedIndexes(table, Decimal(10), "C"))
+
+    def testNullAndMismatchedInputs(self):
+        table = self.makeTable([
+            [Range("<", Decimal(18))],
+            [None],
+            [LambdaExpression(lambda x: x is None)],
+            [date(2020, 1, 1)],
+        ])
+
+        self.assertEqual([1, 2], self.matchedIndexes(table, None))
+        self.assertEqual([1], self.matchedIndexes(table, "abc"))
+        self.assertEqual([1, 3], self.matchedIndexes(table, self.lib.date("2020-01-01")))
+        self.assertEqual([0, 1], self.matchedIndexes(table, LazyEval(lambda: Decimal(1))))
+
+    def testApplyRules(self):
+        table = self.makeTable([
+            [Range(">", Decimal(1))],
+            [Range(">", Decimal(2))],
+        ])
+
+        ruleOutputList = table.applyRules(NopEventListener(), Decimal(3))
+        self.assertEqual([0, 1], [output.index for output in ruleOutputList.getMatchedRuleResults()])
+        self.assertEqual(0, ruleOutputList.applySingle(HitPolicy.FIRST).index)
+
+    def testRangesWithoutEndpointsAreEvaluatedByTheLib(self):
+        rows = [
+            [Range("!=", Decimal(1)), None],
+            [Range("<", None), Range(">", Decimal(5))],
+            [Range(False, None, False, None), [Range("!=", Decimal(2)), Decimal(3)]],
+            [Range("<=", Decimal(2)), Range(True, None, True, None)],
+            [None, None],
+        ]
+        table = self.makeTable(rows)
+
+        for first in [None, Decimal(0), Decimal(1), Decimal(3)]:
+            for second in [None, Decimal(2), Decimal(3), Decimal(6)]:
+                expected = [i for i, row in enumerate(rows) if all(self.entryMatches(entry, value) for entry, value in zip(row, [first, second]))]
+                self.assertEqual(expected, self.matchedIndexes(table, first, second), (first, second))
+        self.assertIsNone(self.lib.includes(Range("!=", Decimal(5)), Decimal(5)))
+        self.assertEqual([], self.matchedIndexes(self.makeTable([[Range("!=", Decimal(5))]]), Decimal(5)))
+
+    def testSameResultAsRuleByRuleEvaluation(self):
+        rnd = random.Random(1234)
+        operators = ["<", "<=", ">", ">=", "="]
+        rows = []
+        for _ in range(300):
+            row = []
+            for _ in range(3):
+                kind = rnd.randint(0, 4)
+                if kind == 0:
+                    row.append(None)
+                elif kind == 1:
+                    row.append(Decimal(rnd.randint(0, 20)))
+                elif kind == 2:
+                    row.append(Range(rnd.choice(operators), Decimal(rnd.randint(0, 20))))
+                elif kind == 3:
+                    start = rnd.randint(0, 20)
+                    row.append(Range(rnd.random() < 0.5, Decimal(start), rnd.random() < 0.5, Decimal(start + rnd.randint(0, 5))))
+                else:
+                    row.append([Decimal(rnd.randint(0, 20)), Range("<", Decimal(rnd.randint(0, 20)))])
+            rows.append(row)
+        table = self.makeTable(rows)
+
+        for _ in range(200):
+            inputs = [Decimal(rnd.randint(-1, 21)) for _ in range(3)]
+            expected = [i for i, row in enumerate(rows) if all(self.entryMatches(entry, value) for entry, value in zip(row, inputs))]
+            self.assertEqual(expected, self.matchedIndexes(table, *inputs))
+
+    def entryMatches(self, entry, value) -> bool:
+        if entry is None:
+            return True
+        elif isinstance(entry, list):
+            return any(self.entryMatches(child, value) for child in entry)
+        elif isinstance(entry, Range):
+            start = entry.getStart()
+            end = entry.getEnd()
+            if start is None and end is None:
+                return self.lib.includes(entry, value) is True
+            if value is None:
+                return False
+            afterStart = start is None or start < value or (entry.isStartIncluded() and start == value)
+            beforeEnd = end is None or value < end or (entry.isEndIncluded() and end == value)
+            return afterStart and beforeEnd
+        else:
+            return self.lib.numericEqual(entry, value)
+
+    def makeTable(self, rows) -> CompiledDecisionTable:
+        rules = [DecisionTableRule(i, "", row, self.makeOutput(i)) for i, row in enumerate(rows)]
+        return CompiledDecisionTable(self.element, rules)
+
+    @staticmethod
+    def makeOutput(index: int):
+        return lambda *args: IndexOutput(False, index)
+
+    @staticmethod
+    def matchedIndexes(table: CompiledDecisionTable, *inputs):
+        return [rule.index for rule in table.matchingRules(*inputs)]